@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Packed 64-bit cell identifiers
+A cell id packs one stable item code per dimension into a fixed bit field
+of a non-negative int64, under a version tag in the top bits:
+
+    bit 62..56: version | fields of the dimensions, first dimension highest
+
+Item codes come from a mapping file (cell_ids.json) rather than from file
+order, so ids survive reordering; new items take unused codes within a
+field's width, and only a field overflow starts a new version. Encoding and
+decoding are vectorized shifts and masks over NumPy arrays
+"""
+
+import json
+from pathlib import Path
+from typing import List, Optional, Dict, Any, Union, Sequence
+
+import numpy as np
+
+from cell_space import CellSpace
+
+# Define paths
+CELL_IDS_FILE = Path(__file__).parent / "cell_ids.json"
+
+VERSION_BITS = 7
+VERSION_SHIFT = 56
+MAX_VERSION = (1 << VERSION_BITS) - 1
+
+# Spare bits per field, so dimensions can grow without a new version
+DEFAULT_HEADROOM_BITS = 1
+
+def field_width(count: int, headroom: int = DEFAULT_HEADROOM_BITS) -> int:
+    """Bits needed for `count` item codes, plus headroom"""
+    return max(1, (count - 1).bit_length()) + headroom
+
+class CellIdCodec:
+    """
+    Bit layout and item codes of one cell-id version
+
+    Args:
+        version: Version tag (1..MAX_VERSION)
+        names: Dimension names, first one in the highest field
+        item_ids: Item IDs of each dimension, indexed by code
+        widths: Field width in bits of each dimension
+    """
+
+    def __init__(self, version: int, names: Sequence[str], item_ids: Sequence[Sequence[str]], widths: Sequence[int]):
+        if not 1 <= version <= MAX_VERSION:
+            raise ValueError(f'Version must be between 1 and {MAX_VERSION}')
+        if sum(widths) > VERSION_SHIFT:
+            raise ValueError(f'Fields need {sum(widths)} bits, only {VERSION_SHIFT} available')
+        for name, ids, width in zip(names, item_ids, widths):
+            if len(ids) > 1 << width:
+                raise ValueError(f'{len(ids)} {name} items do not fit in {width} bits')
+
+        self.version = version
+        self.names: List[str] = list(names)
+        self.item_ids: List[List[str]] = [list(ids) for ids in item_ids]
+        self.widths: List[int] = list(widths)
+        self.codes: List[Dict[str, int]] = [{item_id: code for code, item_id in enumerate(ids)} for ids in self.item_ids]
+
+        # Last dimension in the lowest bits
+        self.shifts: List[int] = []
+        shift = sum(self.widths)
+        for width in self.widths:
+            shift -= width
+            self.shifts.append(shift)
+
+    @classmethod
+    def from_space(
+        cls,
+        space: CellSpace,
+        version: int = 1,
+        headroom: int = DEFAULT_HEADROOM_BITS
+    ) -> 'CellIdCodec':
+        """New layout coding each axis's items in their current order"""
+        item_ids = [[item.id for item in items] for items in space.items]
+        return cls(version, space.names, item_ids, [field_width(len(ids), headroom) for ids in item_ids])
+
+    def updated(self, space: CellSpace, headroom: int = DEFAULT_HEADROOM_BITS) -> 'CellIdCodec':
+        """
+        Codec covering the items of a (regenerated) space
+
+        Existing codes are kept; items new to an axis get the next free codes.
+        Returns self if nothing was added, the same version if the new codes fit
+        the fields, otherwise the next version with widened fields.
+        """
+        if set(space.names) != set(self.names):
+            raise ValueError(f'Cell space axes {space.names} do not match codec axes {self.names}')
+        item_ids = []
+        for name, ids, codes in zip(self.names, self.item_ids, self.codes):
+            added = [item.id for item in space.items[space.axis(name)] if item.id not in codes]
+            item_ids.append(ids + added)
+        if item_ids == self.item_ids:
+            return self
+
+        if all(len(ids) <= 1 << width for ids, width in zip(item_ids, self.widths)):
+            return CellIdCodec(self.version, self.names, item_ids, self.widths)
+        widths = [max(width, field_width(len(ids), headroom)) for ids, width in zip(item_ids, self.widths)]
+        return CellIdCodec(self.version + 1, self.names, item_ids, widths)
+
+    @property
+    def bits(self) -> int:
+        return sum(self.widths)
+
+    # -------------------------------------------------------------------------
+    # Codes
+    # -------------------------------------------------------------------------
+
+    def encode(self, codes: np.ndarray) -> np.ndarray:
+        """Cell ids from an (n, dimensions) array of item codes"""
+        codes = np.asarray(codes, dtype=np.int64)
+        if codes.ndim != 2 or codes.shape[1] != len(self.names):
+            raise ValueError(f'Expected an (n, {len(self.names)}) array of item codes')
+        ids = np.full(len(codes), self.version << VERSION_SHIFT, dtype=np.int64)
+        for axis, (shift, width) in enumerate(zip(self.shifts, self.widths)):
+            column = codes[:, axis]
+            if len(column) and (column.min() < 0 or column.max() >= 1 << width):
+                raise ValueError(f'{self.names[axis]} codes must fall in [0, {1 << width})')
+            ids |= column << shift
+        return ids
+
+    def decode(self, ids: np.ndarray) -> np.ndarray:
+        """(n, dimensions) array of item codes from cell ids"""
+        ids = np.asarray(ids, dtype=np.int64)
+        versions = ids >> VERSION_SHIFT
+        if len(ids) and (versions != self.version).any():
+            found = int(versions[versions != self.version][0])
+            raise ValueError(f'Cell id has version {found}, codec is version {self.version}')
+        return np.stack(
+            [(ids >> shift) & ((1 << width) - 1) for shift, width in zip(self.shifts, self.widths)], axis=1
+        ) if len(ids) else np.empty((0, len(self.names)), dtype=np.int64)
+
+    # -------------------------------------------------------------------------
+    # Cell space positions and ranks
+    # -------------------------------------------------------------------------
+
+    def _position_codes(self, space: CellSpace) -> List[np.ndarray]:
+        """Per codec dimension: code of each position on the space's axis"""
+        lookups = []
+        for name, codes in zip(self.names, self.codes):
+            try:
+                lookups.append(np.array([codes[item.id] for item in space.items[space.axis(name)]], dtype=np.int64))
+            except KeyError as e:
+                raise KeyError(f'{name} item {e.args[0]} has no code in version {self.version}') from None
+        return lookups
+
+    def encode_ranks(self, space: CellSpace, ranks: np.ndarray) -> np.ndarray:
+        """Cell ids of cell ranks in a space"""
+        ranks = np.asarray(ranks, dtype=np.int64)
+        lookups = self._position_codes(space)
+        codes = np.stack([
+            lookup[(ranks // space.strides[space.axis(name)]) % space.radices[space.axis(name)]]
+            for name, lookup in zip(self.names, lookups)
+        ], axis=1)
+        return self.encode(codes)
+
+    def decode_ranks(self, space: CellSpace, ids: np.ndarray) -> np.ndarray:
+        """Cell ranks in a space of cell ids (KeyError for items not on its axes)"""
+        codes = self.decode(ids)
+        ranks = np.zeros(len(codes), dtype=np.int64)
+        for axis, (name, width, lookup) in enumerate(zip(self.names, self.widths, self._position_codes(space))):
+            positions = np.full(1 << width, -1, dtype=np.int64)
+            positions[lookup] = np.arange(len(lookup))
+            column = positions[codes[:, axis]]
+            if (column < 0).any():
+                code = int(codes[column < 0, axis][0])
+                item_id = self.item_ids[axis][code] if code < len(self.item_ids[axis]) else f'code {code}'
+                raise KeyError(f'{name} item {item_id} is not on the cell space axis')
+            ranks += column * space.strides[space.axis(name)]
+        return ranks
+
+    def item_ids_of(self, cell_id: int) -> Dict[str, str]:
+        """Cell of one id as {dimension: item_id}"""
+        codes = self.decode(np.array([cell_id]))[0]
+        return {name: ids[code] for name, ids, code in zip(self.names, self.item_ids, codes.tolist())}
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'version': self.version,
+            'fields': [
+                {'dimension': name, 'shift': shift, 'width': width, 'item_ids': ids}
+                for name, shift, width, ids in zip(self.names, self.shifts, self.widths, self.item_ids)
+            ]
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'CellIdCodec':
+        fields = data['fields']
+        return cls(
+            data['version'],
+            [field['dimension'] for field in fields],
+            [field['item_ids'] for field in fields],
+            [field['width'] for field in fields]
+        )
+
+def load_codecs(path: Union[str, Path] = CELL_IDS_FILE) -> Dict[int, CellIdCodec]:
+    """Every version in a mapping file, keyed by version"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return {data['version']: CellIdCodec.from_dict(data) for data in json.load(f)['versions']}
+
+def save_codecs(codecs: Dict[int, CellIdCodec], path: Union[str, Path] = CELL_IDS_FILE) -> Path:
+    """Write all versions to a mapping file (oldest first)"""
+    path = Path(path)
+    document = {
+        'description': 'Stable item codes and bit layout of packed 64-bit cell ids (see cell_ids.py)',
+        'version_shift': VERSION_SHIFT,
+        'versions': [codecs[version].to_dict() for version in sorted(codecs)]
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(document, f, indent=2, ensure_ascii=False)
+    return path
+
+def load_codec(path: Union[str, Path] = CELL_IDS_FILE, version: Optional[int] = None) -> CellIdCodec:
+    """One version of a mapping file (default: the latest)"""
+    codecs = load_codecs(path)
+    return codecs[max(codecs) if version is None else version]
+
+def cell_id_version(ids: np.ndarray) -> np.ndarray:
+    """Version tag of each cell id"""
+    return np.asarray(ids, dtype=np.int64) >> VERSION_SHIFT
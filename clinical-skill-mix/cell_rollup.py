@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Roll-up and drill-down of per-cell metrics along dimension hierarchies
+Per-cell values (keyed by cell rank in a CellSpace) are aggregated to any
+combination of dimension depths with precomputed position -> ancestor index
+arrays and one vectorized bincount per metric, giving dense tensors over
+the chosen levels
+"""
+
+from typing import List, Optional, Dict, Any, Sequence, Tuple
+
+import numpy as np
+
+from cell_space import CellSpace
+
+AGGREGATIONS = ['sum', 'mean', 'min', 'max']
+
+def cell_ranks(space: CellSpace, cells: Dict[str, Sequence[str]]) -> np.ndarray:
+    """
+    Vectorized cell ranks from per-dimension item ID columns
+
+    Args:
+        space: Cell space defining the axes
+        cells: Dimension name -> item IDs (one per cell, all columns equal length)
+    """
+    ranks = None
+    for name, positions, stride in zip(space.names, space.positions, space.strides):
+        try:
+            column = np.fromiter((positions[item_id] for item_id in cells[name]), dtype=np.int64)
+        except KeyError as e:
+            raise KeyError(f'Item {e.args[0]} is not on the {name} axis') from None
+        ranks = column * stride if ranks is None else ranks + column * stride
+    return ranks if ranks is not None else np.empty(0, dtype=np.int64)
+
+class RollupResult:
+    """Dense metric tensors over the item labels of each kept dimension"""
+
+    def __init__(self, names: List[str], labels: List[List[str]], counts: np.ndarray, values: Dict[str, np.ndarray]):
+        self.names = names
+        self.labels = labels
+        self.counts = counts
+        self.values = values
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self.counts.shape
+
+    def to_records(self, metric: str) -> List[Dict[str, Any]]:
+        """Non-empty tensor entries as {dimension: item_id, ..., 'count', metric}"""
+        records = []
+        for index in zip(*np.nonzero(self.counts)):
+            record = {name: labels[i] for name, labels, i in zip(self.names, self.labels, index)}
+            record['count'] = int(self.counts[index])
+            record[metric] = float(self.values[metric][index])
+            records.append(record)
+        return records
+
+class RollupEngine:
+    """
+    Aggregate per-cell metrics to chosen hierarchy levels
+
+    Args:
+        space: Cell space the cell ranks were computed in
+    """
+
+    def __init__(self, space: CellSpace):
+        self.space = space
+        self._groups: Dict[Tuple[str, int], Tuple[List[str], np.ndarray]] = {}
+
+    def level_index(self, name: str, depth: int) -> Tuple[List[str], np.ndarray]:
+        """Ancestor labels at a depth and the ancestor index of each axis position (cached)"""
+        key = (name, depth)
+        if key not in self._groups:
+            labels, group_of_position = self.space.ancestor_groups(name, depth)
+            self._groups[key] = (labels, np.asarray(group_of_position, dtype=np.intp))
+        return self._groups[key]
+
+    def axis_positions(self, ranks: np.ndarray, name: str) -> np.ndarray:
+        """Item position on one axis for each cell rank"""
+        axis = self.space.axis(name)
+        return (ranks // self.space.strides[axis]) % self.space.radices[axis]
+
+    def _position_mask(self, name: str, item_ids: Sequence[str]) -> np.ndarray:
+        """Axis positions whose item is, or descends from, one of the given items"""
+        item_ids = tuple(item_ids)
+        prefixes = tuple(f'{item_id}/' for item_id in item_ids)
+        return np.array([
+            item.id in item_ids or item.id.startswith(prefixes)
+            for item in self.space.items[self.space.axis(name)]
+        ], dtype=bool)
+
+    def rollup(
+        self,
+        ranks: np.ndarray,
+        metrics: Dict[str, np.ndarray],
+        levels: Dict[str, int],
+        aggregation: str = 'sum',
+        filters: Optional[Dict[str, Sequence[str]]] = None
+    ) -> RollupResult:
+        """
+        Aggregate per-cell metrics to one depth per kept dimension
+
+        Args:
+            ranks: Cell rank of each row
+            metrics: Metric name -> per-row values (e.g. accuracy, item counts)
+            levels: Dimension name -> depth to roll up to, in output axis order;
+                dimensions not listed are aggregated away
+            aggregation: 'sum', 'mean', 'min' or 'max'
+            filters: Dimension name -> item IDs; only cells under those items are kept
+
+        Returns:
+            RollupResult with one tensor per metric and the row count tensor
+        """
+        if aggregation not in AGGREGATIONS:
+            raise ValueError(f'Unsupported aggregation: {aggregation}')
+
+        ranks = np.asarray(ranks, dtype=np.int64)
+        metrics = {name: np.asarray(values, dtype=np.float64) for name, values in metrics.items()}
+        position_masks = {name: self._position_mask(name, item_ids) for name, item_ids in (filters or {}).items()}
+        if position_masks:
+            mask = np.ones(len(ranks), dtype=bool)
+            for name, keep in position_masks.items():
+                mask &= keep[self.axis_positions(ranks, name)]
+            ranks = ranks[mask]
+            metrics = {name: values[mask] for name, values in metrics.items()}
+
+        names, labels, group_indices = list(levels), [], []
+        for name, depth in levels.items():
+            level_labels, group_of_position = self.level_index(name, depth)
+            if name in position_masks:
+                # Only groups reachable under the filter get a slot in the tensor
+                kept = np.unique(group_of_position[position_masks[name]])
+                remap = np.full(len(level_labels), -1, dtype=np.intp)
+                remap[kept] = np.arange(len(kept))
+                level_labels = [level_labels[i] for i in kept]
+                group_of_position = remap[group_of_position]
+            labels.append(level_labels)
+            group_indices.append(group_of_position[self.axis_positions(ranks, name)])
+
+        shape = tuple(len(level_labels) for level_labels in labels)
+        size = int(np.prod(shape, dtype=np.int64))
+        flat = np.ravel_multi_index(group_indices, shape) if names else np.zeros(len(ranks), dtype=np.intp)
+
+        counts = np.bincount(flat, minlength=size)
+        values = {}
+        for name, metric in metrics.items():
+            if aggregation in ('sum', 'mean'):
+                totals = np.bincount(flat, weights=metric, minlength=size)
+                if aggregation == 'mean':
+                    with np.errstate(divide='ignore', invalid='ignore'):
+                        totals = totals / counts
+            else:
+                totals = np.full(size, np.nan)
+                fill = np.inf if aggregation == 'min' else -np.inf
+                extreme = np.full(size, fill)
+                (np.minimum if aggregation == 'min' else np.maximum).at(extreme, flat, metric)
+                totals[counts > 0] = extreme[counts > 0]
+            values[name] = totals.reshape(shape)
+
+        return RollupResult(names, labels, counts.reshape(shape), values)
+
+    def drill_down(
+        self,
+        ranks: np.ndarray,
+        metrics: Dict[str, np.ndarray],
+        levels: Dict[str, int],
+        name: str,
+        item_id: str,
+        aggregation: str = 'sum'
+    ) -> RollupResult:
+        """Roll up the cells under one item, one level deeper along its dimension"""
+        depth = item_id.count('/') + 1
+        return self.rollup(
+            ranks, metrics, {**levels, name: depth},
+            aggregation=aggregation, filters={name: [item_id]}
+        )
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Mixed-radix addressing of Clinical Intelligence cells
+Each cell (one item per dimension) maps to a unique integer rank, with the
+last dimension varying fastest, so cells can be keyed by a single integer
+"""
+
+from typing import List, Optional, Dict, Any, Union, Sequence, Tuple
+
+from skill_mix_dimensions_model import SkillMixDimension, DimensionItem
+
+# Depth or depths of one cell axis (None: every item of the dimension)
+AxisDepth = Union[int, Tuple[int, ...], None]
+
+# Depth(s) forming each dimension's cell axis (None: every item of the dimension).
+# Matches the 67.5B-cell space counted by data/analysis/count_dimension_values.py:
+# 1,918 conditions × 7 × 12 × 58 tasks × 86 provider roles × 4 × 7 × 3
+# (provider roles are occupations and specialties; subspecialties only refine them)
+CLINICAL_INTELLIGENCE_DEPTHS: Dict[str, AxisDepth] = {
+    # Clinical Competency Space (5C)
+    'condition': 1,
+    'care_phase': 0,
+    'care_setting': 0,
+    'care_task': 1,
+    'care_provider_role': (0, 1),
+    # AI Cognitive Engagement (3A)
+    'agent_facing': 0,
+    'anchoring_layer': 0,
+    'assigned_authority': 0,
+}
+
+CellKey = Union[Dict[str, str], Sequence[str]]
+
+class CellSpace:
+    """
+    Ordered axes of items with rank <-> cell conversion
+
+    Args:
+        axes: Mapping of dimension name -> items on that axis, in axis order
+    """
+
+    def __init__(self, axes: Dict[str, List[DimensionItem]]):
+        self.names: List[str] = list(axes)
+        self.items: List[List[DimensionItem]] = [list(items) for items in axes.values()]
+        self.radices: List[int] = [len(items) for items in self.items]
+        self.positions: List[Dict[str, int]] = [
+            {item.id: position for position, item in enumerate(items)} for items in self.items
+        ]
+
+        # Row-major strides: the last axis varies fastest
+        self.strides: List[int] = [1] * len(self.radices)
+        for axis in range(len(self.radices) - 2, -1, -1):
+            self.strides[axis] = self.strides[axis + 1] * self.radices[axis + 1]
+        self.size: int = self.strides[0] * self.radices[0] if self.radices else 0
+
+    @classmethod
+    def from_dimensions(
+        cls,
+        dimensions: Dict[str, SkillMixDimension],
+        depths: Dict[str, AxisDepth] = CLINICAL_INTELLIGENCE_DEPTHS
+    ) -> 'CellSpace':
+        """Build a cell space from loaded dimensions and the depth (or depths) of each axis"""
+        axes = {}
+        for name, depth in depths.items():
+            if name not in dimensions:
+                continue
+            items = dimensions[name].items
+            if depth is None:
+                axes[name] = items
+            else:
+                allowed = {depth} if isinstance(depth, int) else set(depth)
+                axes[name] = [item for item in items if item.depth in allowed]
+        return cls(axes)
+
+    def axis(self, name: str) -> int:
+        """Axis number of a dimension"""
+        return self.names.index(name)
+
+    def indices(self, cell: CellKey) -> List[int]:
+        """Per-axis item positions of a cell given as {dimension: item_id} or a sequence of IDs"""
+        item_ids = [cell[name] for name in self.names] if isinstance(cell, dict) else list(cell)
+        if len(item_ids) != len(self.names):
+            raise ValueError(f'Expected {len(self.names)} item IDs, got {len(item_ids)}')
+        try:
+            return [positions[item_id] for positions, item_id in zip(self.positions, item_ids)]
+        except KeyError as e:
+            raise KeyError(f'Item {e.args[0]} is not on any axis of this cell space') from None
+
+    def rank(self, cell: CellKey) -> int:
+        """Integer rank of a cell"""
+        return sum(index * stride for index, stride in zip(self.indices(cell), self.strides))
+
+    def unrank_indices(self, rank: int) -> List[int]:
+        """Per-axis item positions of the cell with the given rank"""
+        if not 0 <= rank < self.size:
+            raise IndexError(f'Cell rank {rank} out of range [0, {self.size})')
+        return [(rank // stride) % radix for stride, radix in zip(self.strides, self.radices)]
+
+    def unrank(self, rank: int) -> Dict[str, str]:
+        """Cell with the given rank as {dimension: item_id}"""
+        return {
+            name: items[index].id
+            for name, items, index in zip(self.names, self.items, self.unrank_indices(rank))
+        }
+
+    def ancestor_groups(self, name: str, depth: int) -> Tuple[List[str], List[int]]:
+        """
+        Group an axis's items by their ancestor at a depth
+
+        Items shallower than the depth form their own group.
+
+        Returns:
+            (group item IDs in first-seen order, group number of each axis position)
+        """
+        groups: Dict[str, int] = {}
+        group_of_position = []
+        for item in self.items[self.axis(name)]:
+            key = item.get_ancestor_at_depth(depth) or item.id
+            group_of_position.append(groups.setdefault(key, len(groups)))
+        return list(groups), group_of_position
+
+    def describe(self) -> Dict[str, Any]:
+        """Axis names, sizes and total cell count"""
+        return {'axes': dict(zip(self.names, self.radices)), 'size': self.size}
@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+Compressed coverage bitmap over Clinical Intelligence cell ranks
+Roaring-style layout: ranks are split into 2^16-wide chunks keyed by their
+high bits, and each non-empty chunk stores its low 16 bits either as a
+sorted uint16 array (sparse) or as a 1,024-word uint64 bitmap (dense), so
+memory scales with the number of covered cells, not the 67.5B-cell space
+"""
+
+from pathlib import Path
+from typing import List, Optional, Dict, Any, Union, Iterable, Tuple
+
+import numpy as np
+
+from cell_space import CellSpace
+
+CHUNK_BITS = 16
+CHUNK_MASK = (1 << CHUNK_BITS) - 1
+BITMAP_WORDS = (1 << CHUNK_BITS) // 64
+
+# Above this cardinality a bitmap container is smaller than an array container
+ARRAY_MAX = 4096
+
+# =============================================================================
+# Container Helpers
+# =============================================================================
+
+def _array_to_bitmap(values: np.ndarray) -> np.ndarray:
+    words = np.zeros(BITMAP_WORDS, dtype=np.uint64)
+    np.bitwise_or.at(words, values >> 6, np.left_shift(np.uint64(1), (values & 63).astype(np.uint64)))
+    return words
+
+def _bitmap_to_array(words: np.ndarray) -> np.ndarray:
+    bits = np.unpackbits(words.astype('<u8').view(np.uint8), bitorder='little')
+    return np.flatnonzero(bits).astype(np.uint16)
+
+def _bitmap_cardinality(words: np.ndarray) -> int:
+    return int(np.unpackbits(words.view(np.uint8)).sum())
+
+def _bitmap_contains(words: np.ndarray, values: np.ndarray) -> np.ndarray:
+    return ((words[values >> 6] >> (values & 63).astype(np.uint64)) & np.uint64(1)).astype(bool)
+
+def _is_bitmap(container: np.ndarray) -> bool:
+    return container.dtype == np.uint64
+
+def _container_values(container: np.ndarray) -> np.ndarray:
+    return _bitmap_to_array(container) if _is_bitmap(container) else container
+
+def _container_cardinality(container: np.ndarray) -> int:
+    return _bitmap_cardinality(container) if _is_bitmap(container) else len(container)
+
+def _normalize(container: np.ndarray) -> Tuple[Optional[np.ndarray], int]:
+    """Pick the smaller representation; returns (container or None if empty, cardinality)"""
+    cardinality = _container_cardinality(container)
+    if cardinality == 0:
+        return None, 0
+    if _is_bitmap(container) and cardinality <= ARRAY_MAX:
+        return _bitmap_to_array(container), cardinality
+    if not _is_bitmap(container) and cardinality > ARRAY_MAX:
+        return _array_to_bitmap(container), cardinality
+    return container, cardinality
+
+def _split_by_chunk(ranks: np.ndarray) -> Iterable[Tuple[int, np.ndarray, np.ndarray]]:
+    """Yield (chunk key, low bits, positions into ranks) for each chunk touched by ranks"""
+    ranks = np.asarray(ranks, dtype=np.int64)
+    order = np.argsort(ranks, kind='stable')
+    ordered = ranks[order]
+    highs = ordered >> CHUNK_BITS
+    starts = np.flatnonzero(np.diff(highs, prepend=-1))
+    stops = np.append(starts[1:], len(ordered))
+    for key, start, stop in zip(highs[starts].tolist(), starts.tolist(), stops.tolist()):
+        yield key, (ordered[start:stop] & CHUNK_MASK).astype(np.uint16), order[start:stop]
+
+# =============================================================================
+# Coverage Bitmap
+# =============================================================================
+
+class CoverageBitmap:
+    """
+    Set of covered cell ranks
+
+    Args:
+        size: Number of cells in the space (ranks must fall in [0, size)); None for unbounded
+    """
+
+    def __init__(self, size: Optional[int] = None):
+        self.size = size
+        self._containers: Dict[int, np.ndarray] = {}
+        self._cardinalities: Dict[int, int] = {}
+
+    @classmethod
+    def for_space(cls, space: CellSpace) -> 'CoverageBitmap':
+        """Empty bitmap sized to a cell space"""
+        return cls(space.size)
+
+    def _check_ranks(self, ranks: np.ndarray):
+        if len(ranks) and (ranks.min() < 0 or (self.size is not None and ranks.max() >= self.size)):
+            raise IndexError(f'Cell ranks must fall in [0, {self.size})')
+
+    def _store(self, key: int, container: np.ndarray):
+        container, cardinality = _normalize(container)
+        if container is None:
+            self._containers.pop(key, None)
+            self._cardinalities.pop(key, None)
+        else:
+            self._containers[key] = container
+            self._cardinalities[key] = cardinality
+
+    # -------------------------------------------------------------------------
+    # Set and test
+    # -------------------------------------------------------------------------
+
+    def add(self, rank: int):
+        """Mark one cell as covered"""
+        self.add_many([rank])
+
+    def add_many(self, ranks: Union[Iterable[int], np.ndarray]):
+        """Mark many cells as covered (vectorized per chunk)"""
+        ranks = np.unique(np.asarray(ranks, dtype=np.int64))
+        self._check_ranks(ranks)
+        highs = ranks >> CHUNK_BITS
+        starts = np.flatnonzero(np.diff(highs, prepend=-1))
+        groups = np.split((ranks & CHUNK_MASK).astype(np.uint16), starts[1:])
+
+        containers, cardinalities = self._containers, self._cardinalities
+        for key, lows in zip(highs[starts].tolist(), groups):
+            container = containers.get(key)
+            if container is None:
+                # Fresh chunk: lows are already sorted and unique
+                if len(lows) <= ARRAY_MAX:
+                    containers[key] = lows
+                    cardinalities[key] = len(lows)
+                    continue
+                merged = lows
+            elif _is_bitmap(container):
+                merged = container.copy()
+                np.bitwise_or.at(merged, lows >> 6, np.left_shift(np.uint64(1), (lows & 63).astype(np.uint64)))
+            else:
+                merged = np.union1d(container, lows)
+            self._store(key, merged)
+
+    def discard_many(self, ranks: Union[Iterable[int], np.ndarray]):
+        """Unmark cells (ranks not present are ignored)"""
+        ranks = np.asarray(ranks, dtype=np.int64).ravel()
+        for key, lows, _ in _split_by_chunk(ranks):
+            container = self._containers.get(key)
+            if container is not None:
+                self._store(key, np.setdiff1d(_container_values(container), lows))
+
+    def contains(self, rank: int) -> bool:
+        """Test whether one cell is covered"""
+        container = self._containers.get(rank >> CHUNK_BITS)
+        if container is None:
+            return False
+        low = rank & CHUNK_MASK
+        if _is_bitmap(container):
+            return bool((int(container[low >> 6]) >> (low & 63)) & 1)
+        position = np.searchsorted(container, low)
+        return position < len(container) and container[position] == low
+
+    __contains__ = contains
+
+    def contains_many(self, ranks: Union[Iterable[int], np.ndarray]) -> np.ndarray:
+        """Boolean array: which of the given cells are covered"""
+        ranks = np.asarray(ranks, dtype=np.int64).ravel()
+        result = np.zeros(len(ranks), dtype=bool)
+        for key, lows, positions in _split_by_chunk(ranks):
+            container = self._containers.get(key)
+            if container is None:
+                continue
+            if _is_bitmap(container):
+                result[positions] = _bitmap_contains(container, lows)
+            else:
+                result[positions] = np.isin(lows, container, assume_unique=False)
+        return result
+
+    # -------------------------------------------------------------------------
+    # Cardinality and iteration
+    # -------------------------------------------------------------------------
+
+    def cardinality(self) -> int:
+        """Number of covered cells"""
+        return sum(self._cardinalities.values())
+
+    __len__ = cardinality
+
+    def coverage_ratio(self) -> float:
+        """Covered fraction of the whole space"""
+        if not self.size:
+            raise ValueError('Coverage ratio requires a bitmap with a known size')
+        return self.cardinality() / self.size
+
+    def iter_chunks(self) -> Iterable[np.ndarray]:
+        """Yield the covered ranks of each chunk as int64 arrays, in rank order"""
+        for key in sorted(self._containers):
+            values = _container_values(self._containers[key]).astype(np.int64)
+            yield (key << CHUNK_BITS) | values
+
+    def iter_blocks(self, block_size: int = 1 << 20) -> Iterable[np.ndarray]:
+        """Yield covered ranks in rank order, batched into arrays of roughly block_size"""
+        keys, values, pending = [], [], 0
+        for key in sorted(self._containers):
+            container = _container_values(self._containers[key])
+            keys.append(key)
+            values.append(container)
+            pending += len(container)
+            if pending >= block_size:
+                yield self._join(keys, values)
+                keys, values, pending = [], [], 0
+        if keys:
+            yield self._join(keys, values)
+
+    @staticmethod
+    def _join(keys: List[int], values: List[np.ndarray]) -> np.ndarray:
+        lengths = [len(v) for v in values]
+        highs = np.repeat(np.array(keys, dtype=np.int64) << CHUNK_BITS, lengths)
+        return highs | np.concatenate(values).astype(np.int64)
+
+    def to_array(self) -> np.ndarray:
+        """All covered ranks, sorted"""
+        blocks = list(self.iter_blocks())
+        return np.concatenate(blocks) if blocks else np.empty(0, dtype=np.int64)
+
+    # -------------------------------------------------------------------------
+    # Set operations
+    # -------------------------------------------------------------------------
+
+    def _combined_size(self, other: 'CoverageBitmap') -> Optional[int]:
+        if self.size is not None and other.size is not None and self.size != other.size:
+            raise ValueError(f'Bitmaps cover different spaces ({self.size} vs {other.size} cells)')
+        return self.size if self.size is not None else other.size
+
+    def union(self, other: 'CoverageBitmap') -> 'CoverageBitmap':
+        """Cells covered by either bitmap"""
+        result = CoverageBitmap(self._combined_size(other))
+        for key in self._containers.keys() | other._containers.keys():
+            a, b = self._containers.get(key), other._containers.get(key)
+            if a is None or b is None:
+                container = (a if b is None else b).copy()
+            elif _is_bitmap(a) or _is_bitmap(b):
+                container = (a if _is_bitmap(a) else _array_to_bitmap(a)) | (b if _is_bitmap(b) else _array_to_bitmap(b))
+            else:
+                container = np.union1d(a, b)
+            result._store(key, container)
+        return result
+
+    def intersection(self, other: 'CoverageBitmap') -> 'CoverageBitmap':
+        """Cells covered by both bitmaps"""
+        result = CoverageBitmap(self._combined_size(other))
+        for key in self._containers.keys() & other._containers.keys():
+            a, b = self._containers[key], other._containers[key]
+            if _is_bitmap(a) and _is_bitmap(b):
+                container = a & b
+            elif _is_bitmap(a):
+                container = b[_bitmap_contains(a, b)]
+            elif _is_bitmap(b):
+                container = a[_bitmap_contains(b, a)]
+            else:
+                container = np.intersect1d(a, b, assume_unique=True)
+            result._store(key, container)
+        return result
+
+    __or__ = union
+    __and__ = intersection
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CoverageBitmap) or self._cardinalities != other._cardinalities:
+            return False
+        return all(
+            np.array_equal(_container_values(container), _container_values(other._containers[key]))
+            for key, container in self._containers.items()
+        )
+
+    # -------------------------------------------------------------------------
+    # Hierarchical roll-up
+    # -------------------------------------------------------------------------
+
+    def coverage_by_item(self, space: CellSpace, name: str, depth: int) -> List[Dict[str, Any]]:
+        """
+        Roll coverage up to the items of one dimension at a hierarchy depth
+
+        Args:
+            space: Cell space the ranks were computed in
+            name: Dimension to roll up along
+            depth: Hierarchy depth of the reported items (axis items shallower
+                than the depth are reported as themselves)
+
+        Returns:
+            One dict per item: item_id, covered cells, total cells and ratio
+        """
+        if self.size is not None and self.size != space.size:
+            raise ValueError(f'Bitmap covers {self.size} cells, cell space has {space.size}')
+
+        axis = space.axis(name)
+        stride, radix = space.strides[axis], space.radices[axis]
+        group_ids, group_of_position = space.ancestor_groups(name, depth)
+        group_of_position = np.asarray(group_of_position, dtype=np.intp)
+
+        covered = np.zeros(len(group_ids), dtype=np.int64)
+        for ranks in self.iter_blocks():
+            positions = (ranks // stride) % radix
+            covered += np.bincount(group_of_position[positions], minlength=len(group_ids))
+
+        # Every axis position spans the same number of cells
+        cells_per_position = space.size // radix
+        totals = np.bincount(group_of_position, minlength=len(group_ids)) * cells_per_position
+
+        return [
+            {'item_id': item_id, 'covered': int(c), 'total': int(t), 'ratio': float(c / t)}
+            for item_id, c, t in zip(group_ids, covered, totals)
+        ]
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """Persist to a compressed .npz file"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        keys = sorted(self._containers)
+        containers = [self._containers[key] for key in keys]
+        is_bitmap = np.array([_is_bitmap(c) for c in containers], dtype=bool)
+        lengths = np.array([len(c) for c in containers], dtype=np.int64)
+
+        np.savez_compressed(
+            path,
+            size=np.array(-1 if self.size is None else self.size, dtype=np.int64),
+            keys=np.array(keys, dtype=np.int64),
+            is_bitmap=is_bitmap,
+            lengths=lengths,
+            arrays=np.concatenate([c for c in containers if not _is_bitmap(c)] or [np.empty(0, np.uint16)]),
+            bitmaps=np.concatenate([c for c in containers if _is_bitmap(c)] or [np.empty(0, np.uint64)])
+        )
+        return path
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'CoverageBitmap':
+        """Load a bitmap saved with save()"""
+        with np.load(path, allow_pickle=False) as data:
+            size = int(data['size'])
+            result = cls(None if size < 0 else size)
+            arrays, bitmaps = data['arrays'], data['bitmaps']
+            array_offset = bitmap_offset = 0
+            for key, is_bitmap, length in zip(data['keys'].tolist(), data['is_bitmap'], data['lengths']):
+                if is_bitmap:
+                    container = bitmaps[bitmap_offset:bitmap_offset + length]
+                    bitmap_offset += length
+                else:
+                    container = arrays[array_offset:array_offset + length]
+                    array_offset += length
+                result._containers[key] = container
+                result._cardinalities[key] = _container_cardinality(container)
+        return result
@@ -0,0 +1,470 @@
+#!/usr/bin/env python3
+"""
+t-wise covering arrays over a Clinical Intelligence cell space
+A covering array is a set of cells in which every combination of items on
+any t axes (every pair for t=2) occurs at least once. Suites are built with
+IPOG: the first t axes (largest first) are enumerated, then each further
+axis is added by horizontal growth (each row takes the item covering the
+most still-uncovered tuples) and vertical growth (rows are added or their
+don't-care entries filled for tuples left over). Uncovered tuples are
+tracked in one boolean bitmap per new axis, so scoring a row is a gather
+and a column sum. Incompatible item pairs are never placed together and
+tuples containing them are not required; neither are tuples that the pairs
+rule out indirectly (implied constraints), e.g. two items that each leave
+only a different item of a third axis allowed
+"""
+
+from itertools import combinations
+from typing import List, Optional, Dict, Iterable, Sequence, Tuple
+
+import numpy as np
+
+from cell_space import CellSpace
+
+DEFAULT_STRENGTH = 2
+
+# Entry not yet assigned (don't care) while the array is built
+UNASSIGNED = -1
+
+# ((dimension, item_id), (dimension, item_id)): items that may not share a cell;
+# an item above the axis depth stands for all of its descendants on the axis
+Incompatibility = Tuple[Tuple[str, str], Tuple[str, str]]
+
+# =============================================================================
+# Constraints
+# =============================================================================
+
+def _axis_positions_under(space: CellSpace, axis: int, item_id: str) -> List[int]:
+    """Positions on an axis of an item or of its descendants"""
+    positions = [
+        position for position, item in enumerate(space.items[axis])
+        if item.id == item_id or item.id.startswith(item_id + '/')
+    ]
+    if not positions:
+        raise KeyError(f'No {space.names[axis]} items on the axis under {item_id}')
+    return positions
+
+def forbidden_pairs(space: CellSpace, incompatible: Iterable[Incompatibility]) -> Dict[Tuple[int, int], np.ndarray]:
+    """
+    Forbidden item pairs as boolean matrices
+
+    Returns:
+        (axis a, axis b) with a < b -> (radix a, radix b) matrix, True where forbidden
+    """
+    forbidden = {}
+    for (name_a, item_a), (name_b, item_b) in incompatible:
+        a, b = space.axis(name_a), space.axis(name_b)
+        if a == b:
+            raise ValueError(f'Incompatible items must be on different axes: {item_a}, {item_b}')
+        if a > b:
+            (a, item_a), (b, item_b) = (b, item_b), (a, item_a)
+        matrix = forbidden.setdefault((a, b), np.zeros((space.radices[a], space.radices[b]), dtype=bool))
+        matrix[np.ix_(_axis_positions_under(space, a, item_a), _axis_positions_under(space, b, item_b))] = True
+    return forbidden
+
+def _forbidden_between(forbidden: Dict[Tuple[int, int], np.ndarray], a: int, b: int) -> Optional[np.ndarray]:
+    """Forbidden matrix oriented (axis a, axis b), or None"""
+    if a < b:
+        return forbidden.get((a, b))
+    matrix = forbidden.get((b, a))
+    return matrix.T if matrix is not None else None
+
+def allowed_tuples(
+    radices: Sequence[int],
+    axes: Sequence[int],
+    forbidden: Dict[Tuple[int, int], np.ndarray]
+) -> np.ndarray:
+    """Boolean tensor over the items of some axes, False where a forbidden pair occurs"""
+    allowed = np.ones([radices[axis] for axis in axes], dtype=bool)
+    for p, q in combinations(range(len(axes)), 2):
+        matrix = _forbidden_between(forbidden, axes[p], axes[q])
+        if matrix is not None:
+            shape = [1] * len(axes)
+            shape[p], shape[q] = matrix.shape
+            allowed &= ~matrix.reshape(shape)
+    return allowed
+
+def viable_items(radices: Sequence[int], forbidden: Dict[Tuple[int, int], np.ndarray]) -> List[np.ndarray]:
+    """
+    Items that can occur in some valid cell, as one boolean array per axis
+
+    An item is dropped when every remaining item of another axis is forbidden
+    next to it, repeated until nothing changes (arc consistency).
+    """
+    viable = [np.ones(radix, dtype=bool) for radix in radices]
+    changed = True
+    while changed:
+        changed = False
+        for (a, b), matrix in forbidden.items():
+            for this, other, oriented in ((a, b, matrix), (b, a, matrix.T)):
+                keep = viable[this] & (~oriented[:, viable[other]]).any(axis=1)
+                if (keep != viable[this]).any():
+                    viable[this] = keep
+                    changed = True
+    return viable
+
+def feasible_tuples(
+    radices: Sequence[int],
+    axes: Sequence[int],
+    forbidden: Dict[Tuple[int, int], np.ndarray],
+    viable: Optional[List[np.ndarray]] = None
+) -> np.ndarray:
+    """
+    Boolean tensor over the items of some axes, False where a tuple cannot be
+    extended to a valid cell: a forbidden pair, an item that is not viable, or
+    another axis with no viable item compatible with all of the tuple's items.
+    Constraints spanning several other axes can still rule out a True tuple;
+    covering_array() finds those while building
+    """
+    if viable is None:
+        viable = viable_items(radices, forbidden)
+    feasible = allowed_tuples(radices, axes, forbidden)
+    for p, axis in enumerate(axes):
+        shape = [1] * len(axes)
+        shape[p] = radices[axis]
+        feasible &= viable[axis].reshape(shape)
+
+    for other in range(len(radices)):
+        if other in axes:
+            continue
+        constrained = [(p, _forbidden_between(forbidden, axis, other)) for p, axis in enumerate(axes)]
+        constrained = [(p, matrix[:, viable[other]]) for p, matrix in constrained if matrix is not None]
+        if len(constrained) < 2:
+            continue  # a single axis is already covered by viable_items
+        reachable = np.zeros_like(feasible)
+        for item in range(int(viable[other].sum())):
+            fits = np.ones_like(feasible)
+            for p, matrix in constrained:
+                shape = [1] * len(axes)
+                shape[p] = len(matrix)
+                fits &= ~matrix[:, item].reshape(shape)
+            reachable |= fits
+        feasible &= reachable
+    return feasible
+
+def _under(item_id: str, ancestor_id: str) -> bool:
+    return item_id == ancestor_id or item_id.startswith(ancestor_id + '/')
+
+def constraints_against(
+    incompatible: Iterable[Incompatibility],
+    cell: Dict[str, str],
+    name: str
+) -> List[Incompatibility]:
+    """Incompatibilities between a dimension and the items of a (partial) cell"""
+    found = []
+    for pair in incompatible:
+        for (name_a, item_a), (name_b, _) in (pair, pair[::-1]):
+            if name_b == name and name_a in cell and _under(cell[name_a], item_a):
+                found.append(pair)
+                break
+    return found
+
+# =============================================================================
+# Covering Array
+# =============================================================================
+
+class CoveringArray:
+    """
+    Rows of a covering array: one cell per row, as per-axis item positions
+
+    Args:
+        space: Cell space the rows address
+        rows: (n, axes) item positions
+        strength: Number of axes t whose item combinations are all covered
+        forbidden: Forbidden pairs as returned by forbidden_pairs()
+        infeasible: t-tuples ({dimension: item_id}) that passed feasible_tuples()
+            but were found to fit no valid cell while building, and were dropped
+    """
+
+    def __init__(
+        self,
+        space: CellSpace,
+        rows: np.ndarray,
+        strength: int,
+        forbidden: Optional[Dict[Tuple[int, int], np.ndarray]] = None,
+        infeasible: Optional[List[Dict[str, str]]] = None
+    ):
+        self.space = space
+        self.rows = rows
+        self.strength = strength
+        self.forbidden = forbidden or {}
+        self.infeasible = infeasible or []
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def ranks(self) -> np.ndarray:
+        """Cell rank of each row"""
+        return self.rows.astype(np.int64) @ np.array(self.space.strides, dtype=np.int64)
+
+    def cells(self) -> Iterable[Dict[str, str]]:
+        """Rows as {dimension: item_id}"""
+        for row in self.rows.tolist():
+            yield {name: items[index].id for name, items, index in zip(self.space.names, self.space.items, row)}
+
+    def coverage(self, strength: Optional[int] = None) -> Tuple[int, int]:
+        """
+        Covered and required t-tuples (tuples that no valid cell contains are not required)
+
+        Returns:
+            (covered, required)
+        """
+        strength = strength or self.strength
+        radices = self.space.radices
+        viable = viable_items(radices, self.forbidden)
+        covered = required = 0
+        for axes in combinations(range(len(radices)), strength):
+            allowed = feasible_tuples(radices, axes, self.forbidden, viable).ravel()
+            flat = np.ravel_multi_index(tuple(self.rows[:, axes].T), [radices[axis] for axis in axes])
+            hit = np.zeros(len(allowed), dtype=bool)
+            hit[flat] = True
+            covered += int((hit & allowed).sum())
+            required += int(allowed.sum())
+        if strength == self.strength:
+            required -= len(self.infeasible)
+        return covered, required
+
+    def implied_exclusions(self, strength: Optional[int] = None) -> int:
+        """Number of t-tuples without a forbidden pair that no valid cell contains"""
+        strength = strength or self.strength
+        radices = self.space.radices
+        viable = viable_items(radices, self.forbidden)
+        excluded = sum(
+            int((allowed_tuples(radices, axes, self.forbidden)
+                 & ~feasible_tuples(radices, axes, self.forbidden, viable)).sum())
+            for axes in combinations(range(len(radices)), strength)
+        )
+        return excluded + (len(self.infeasible) if strength == self.strength else 0)
+
+def _grow_rows(rows: np.ndarray, count: int) -> np.ndarray:
+    """Rows buffer with room for one more row"""
+    if count < len(rows):
+        return rows
+    grown = np.full((max(2 * len(rows), 1024), rows.shape[1]), UNASSIGNED, dtype=rows.dtype)
+    grown[:count] = rows[:count]
+    return grown
+
+def covering_array(
+    space: CellSpace,
+    strength: int = DEFAULT_STRENGTH,
+    incompatible: Iterable[Incompatibility] = ()
+) -> CoveringArray:
+    """
+    Build a t-wise covering array with IPOG
+
+    Every row is kept completable: its constrained don't cares can still be
+    filled without a forbidden pair (checked by a small backtracking search).
+    Required tuples that fit no valid cell are dropped and listed in
+    CoveringArray.infeasible.
+
+    Args:
+        space: Cell space (axes at the depths to be covered)
+        strength: t, the number of axes whose item combinations must all occur
+        incompatible: Item pairs that may not share a cell
+
+    Returns:
+        CoveringArray whose rows contain no forbidden pair
+
+    Raises:
+        ValueError: if the constraints leave an axis without usable items
+            (naming the constraints involved)
+    """
+    axis_count = len(space.radices)
+    if not 1 <= strength <= axis_count:
+        raise ValueError(f'Strength must be between 1 and {axis_count}')
+    incompatible = list(incompatible)
+    forbidden = forbidden_pairs(space, incompatible)
+
+    # Largest axes first: they fix the suite size, the rest fit into their rows
+    order = sorted(range(axis_count), key=lambda axis: -space.radices[axis])
+    radices = [space.radices[axis] for axis in order]
+    inner_forbidden = {}
+    for i, j in combinations(range(axis_count), 2):
+        matrix = _forbidden_between(forbidden, order[i], order[j])
+        if matrix is not None:
+            inner_forbidden[(i, j)] = matrix
+
+    viable = viable_items(radices, inner_forbidden)
+    for axis, items in enumerate(viable):
+        if not items.any():
+            name = space.names[order[axis]]
+            involved = [pair for pair in incompatible if name in (pair[0][0], pair[1][0])]
+            raise ValueError(f'Constraints leave no {name} item usable: {involved}')
+
+    # Forbidden matrices of each axis, oriented (axis, other axis)
+    neighbours = [[] for _ in range(axis_count)]
+    for (i, j), matrix in inner_forbidden.items():
+        neighbours[i].append((j, matrix))
+        neighbours[j].append((i, matrix.T))
+    constrained_axes = [axis for axis in range(axis_count) if neighbours[axis]]
+
+    def open_items(row, axis):
+        """Viable items of an axis compatible with every assigned entry of a row"""
+        open_ = viable[axis]
+        for other, matrix in neighbours[axis]:
+            if row[other] != UNASSIGNED:
+                open_ = open_ & ~matrix[:, row[other]]
+        return open_
+
+    def complete(row):
+        """
+        Copy of a row with its constrained don't cares filled, or None if no
+        valid cell contains it (depth-first, most constrained axis first)
+        """
+        free = [axis for axis in constrained_axes if row[axis] == UNASSIGNED]
+        if not free:
+            return row.copy()
+        options = [(np.flatnonzero(open_items(row, axis)), axis) for axis in free]
+        values, axis = min(options, key=lambda option: len(option[0]))
+        if len(values) == 0:
+            return None
+        for value in values.tolist():
+            row[axis] = value
+            filled = complete(row)
+            row[axis] = UNASSIGNED
+            if filled is not None:
+                return filled
+        return None
+
+    # Items with the same forbidden partners are interchangeable when completing a row,
+    # so completions are cached by the class of each constrained entry
+    classes, members = {}, {}
+    for axis in constrained_axes:
+        signature = np.hstack([viable[axis][:, None]] + [matrix for _, matrix in neighbours[axis]])
+        classes[axis] = np.unique(signature, axis=0, return_inverse=True)[1].ravel()
+        members[axis] = [np.flatnonzero(classes[axis] == c) for c in range(int(classes[axis].max()) + 1)]
+    completions = {}
+
+    def completion(row):
+        """Cached complete(row) for rows with the same entry classes"""
+        key = tuple(-1 if row[axis] == UNASSIGNED else int(classes[axis][row[axis]]) for axis in constrained_axes)
+        if key not in completions:
+            completions[key] = complete(row)
+        return completions[key]
+
+    def completable(row):
+        return completion(row) is not None
+
+    def cell_of(row, axes):
+        return {space.names[order[axis]]: space.items[order[axis]][row[axis]].id for axis in axes}
+
+    infeasible = []
+
+    # All feasible tuples of the first t axes
+    seed_axes = list(range(strength))
+    grid = np.argwhere(feasible_tuples(radices, seed_axes, inner_forbidden, viable)).astype(np.int32)
+    rows = np.full((len(grid), axis_count), UNASSIGNED, dtype=np.int32)
+    rows[:, :strength] = grid
+    if constrained_axes:
+        fits = np.array([completable(row) for row in rows], dtype=bool)
+        infeasible.extend(cell_of(row, seed_axes) for row in rows[~fits])
+        rows = rows[fits]
+    count = len(rows)
+
+    for k in range(strength, axis_count):
+        combos = list(combinations(range(k), strength - 1))
+        combo_axes = np.array(combos, dtype=np.int64).reshape(len(combos), strength - 1)
+        combo_strides = np.zeros(combo_axes.shape, dtype=np.int64)
+        offsets = np.zeros(len(combos) + 1, dtype=np.int64)
+
+        # Bitmap of uncovered tuples: one row per (combo, items on its axes), one column per item of axis k
+        blocks = []
+        for c, combo in enumerate(combos):
+            allowed = feasible_tuples(radices, list(combo) + [k], inner_forbidden, viable)
+            blocks.append(allowed.reshape(-1, radices[k]))
+            combo_strides[c] = [int(np.prod([radices[axis] for axis in combo[i + 1:]])) for i in range(len(combo))]
+            offsets[c + 1] = offsets[c] + len(blocks[-1])
+        uncovered = np.concatenate(blocks)
+        remaining = int(uncovered.sum())
+
+        def tuple_rows(row):
+            """Bitmap rows of the tuples a row forms with axis k (fully assigned combos only)"""
+            values = row[combo_axes]
+            assigned = (values != UNASSIGNED).all(axis=1)
+            return (offsets[:-1] + (values * combo_strides).sum(axis=1))[assigned]
+
+        # Horizontal growth
+        for r in range(count):
+            if remaining == 0:
+                break
+            row = rows[r]
+            targets = tuple_rows(row)
+            gains = uncovered[targets].sum(axis=0)
+            if neighbours[k]:
+                gains[~open_items(row, k)] = -1
+            while True:
+                value = int(gains.argmax())
+                if gains[value] <= 0 or not neighbours[k]:
+                    break
+                row[k] = value
+                fits = completable(row)
+                row[k] = UNASSIGNED
+                if fits:
+                    break
+                gains[value] = -1
+            if gains[value] <= 0:
+                continue  # leave as don't care
+            row[k] = value
+            uncovered[targets, value] = False
+            remaining -= int(gains[value])
+
+        # Vertical growth: place each leftover tuple in a compatible row, or a new one
+        for flat, value in zip(*np.nonzero(uncovered)):
+            if not uncovered[flat, value]:
+                continue
+            c = int(np.searchsorted(offsets, flat, side='right')) - 1
+            columns = list(combos[c]) + [k]
+            target = list(np.unravel_index(flat - offsets[c], [radices[axis] for axis in combos[c]])) + [value]
+
+            current = rows[:count, columns]
+            candidates = np.flatnonzero(((current == target) | (current == UNASSIGNED)).all(axis=1))
+            placed = None
+            for r in candidates.tolist():
+                row = rows[r].copy()
+                row[columns] = target
+                if all(
+                    matrix is None or not matrix[row[a], row[b]]
+                    for a, b in combinations(np.flatnonzero(row[:k + 1] != UNASSIGNED).tolist(), 2)
+                    for matrix in [inner_forbidden.get((a, b))]
+                ) and (not constrained_axes or completable(row)):
+                    placed = r
+                    break
+            if placed is None:
+                row = np.full(axis_count, UNASSIGNED, dtype=rows.dtype)
+                row[columns] = target
+                if constrained_axes and not completable(row):
+                    # Ruled out by constraints over several other axes: not required
+                    infeasible.append(cell_of(row, columns))
+                    uncovered[flat, value] = False
+                    continue
+                rows = _grow_rows(rows, count)
+                placed, count = count, count + 1
+                rows[placed] = UNASSIGNED
+            rows[placed, columns] = target
+            uncovered[tuple_rows(rows[placed]), rows[placed, k]] = False
+
+    rows = rows[:count]
+
+    # Fill remaining don't cares (every row is completable), cycling through the items
+    # of each axis, or of the item's class on constrained axes
+    for r in np.flatnonzero((rows == UNASSIGNED).any(axis=1)).tolist():
+        if constrained_axes:
+            filled = completion(rows[r])
+            if filled is None:
+                name = next(space.names[order[axis]] for axis in constrained_axes if rows[r, axis] == UNASSIGNED)
+                cell = cell_of(rows[r], np.flatnonzero(rows[r] != UNASSIGNED).tolist())
+                raise ValueError(
+                    f'No {name} item is compatible with row {r} {cell}; '
+                    f'conflicting constraints: {constraints_against(incompatible, cell, name)}'
+                )
+            for axis in constrained_axes:
+                if rows[r, axis] == UNASSIGNED:
+                    same = members[axis][classes[axis][filled[axis]]]
+                    rows[r, axis] = same[r % len(same)]
+        for axis in np.flatnonzero(rows[r] == UNASSIGNED).tolist():
+            rows[r, axis] = r % radices[axis]
+
+    # Back to the space's axis order
+    result = np.empty_like(rows)
+    result[:, order] = rows
+    return CoveringArray(space, result, strength, forbidden, infeasible)
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+In-memory lookup indexes over loaded dimensions
+Answers the depth-aware queries of skill_mix_dimensions_model (ancestors,
+descendants, expand_to_depth, ...) from precomputed maps instead of a scan
+over every item, returning items in the same (file) order
+"""
+
+from typing import List, Optional, Dict
+
+from skill_mix_dimensions_model import SkillMixDimension, DimensionItem
+
+class DimensionIndex:
+    """
+    Id, depth, ancestor and descendant lookups for one dimension
+
+    Args:
+        dimension: Loaded dimension to index
+    """
+
+    def __init__(self, dimension: SkillMixDimension):
+        self.dimension = dimension
+        self.name: str = dimension.dimension.value
+        self.items: List[DimensionItem] = list(dimension.items)
+        self.by_id: Dict[str, DimensionItem] = {item.id: item for item in self.items}
+        self.by_depth: Dict[int, List[DimensionItem]] = {}
+        self._descendants: Dict[str, List[DimensionItem]] = {item.id: [] for item in self.items}
+
+        for item in self.items:
+            self.by_depth.setdefault(item.depth, []).append(item)
+            for depth in range(item.depth):
+                ancestor_id = item.get_ancestor_at_depth(depth)
+                if ancestor_id in self._descendants:
+                    self._descendants[ancestor_id].append(item)
+
+    @property
+    def max_depth(self) -> int:
+        return max(self.by_depth, default=0)
+
+    def get(self, item_id: str) -> DimensionItem:
+        """Item by ID (KeyError if it is not in the dimension)"""
+        try:
+            return self.by_id[item_id]
+        except KeyError:
+            raise KeyError(f'Unknown {self.name} item: {item_id}') from None
+
+    def items_at_depth(self, depth: int) -> List[DimensionItem]:
+        return self.by_depth.get(depth, [])
+
+    def children(self, item_id: str) -> List[DimensionItem]:
+        return [self.by_id[child_id] for child_id in self.get(item_id).children_ids if child_id in self.by_id]
+
+    def ancestors(self, item_id: str) -> List[DimensionItem]:
+        """Ancestors from the root down (as get_ancestors)"""
+        item = self.get(item_id)
+        ancestor_ids = (item.get_ancestor_at_depth(depth) for depth in range(item.depth))
+        return [self.by_id[ancestor_id] for ancestor_id in ancestor_ids if ancestor_id in self.by_id]
+
+    def descendants(self, item_id: str, depth: Optional[int] = None) -> List[DimensionItem]:
+        """All descendants (as get_all_descendants), or only those at one depth"""
+        descendants = self._descendants[self.get(item_id).id]
+        if depth is None:
+            return list(descendants)
+        return [item for item in descendants if item.depth == depth]
+
+    def expand_to_depth(self, item_id: str, target_depth: int) -> List[DimensionItem]:
+        """Item itself, its descendants at target_depth, or [] if it is deeper (as expand_to_depth)"""
+        item = self.get(item_id)
+        if item.depth == target_depth:
+            return [item]
+        if item.depth < target_depth:
+            return self.descendants(item_id, target_depth)
+        return []
+
+def index_dimensions(dimensions: Dict[str, SkillMixDimension]) -> Dict[str, DimensionIndex]:
+    """Index every loaded dimension, keyed like the input"""
+    return {name: DimensionIndex(dimension) for name, dimension in dimensions.items()}
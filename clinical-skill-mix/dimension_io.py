@@ -0,0 +1,446 @@
+#!/usr/bin/env python3
+"""
+Streaming I/O for Clinical Skill-Mix dimension files
+Writes dimension JSON incrementally (header, then items one at a time)
+with output byte-identical to json.dump(..., indent=2), and reads it back
+item by item without loading the whole document
+"""
+
+import json
+import os
+from collections import Counter
+from pathlib import Path
+from typing import List, Optional, Dict, Any, Union, Iterable, Callable
+
+from skill_mix_dimensions_model import (
+    SkillMixDimension, DimensionItem, ReferenceInfo, HierarchyInfo, DimensionType
+)
+
+# Directory holding the dimension JSON files (this module lives alongside them)
+SKILL_MIX_PATH = Path(__file__).parent
+
+# Dimension JSON files in Clinical Intelligence order (5C, then 3A)
+DIMENSION_FILES = {
+    # Clinical Competency Space (5C)
+    DimensionType.CONDITION.value: 'conditions.json',
+    DimensionType.CARE_PHASE.value: 'care_phases.json',
+    DimensionType.CARE_SETTING.value: 'care_settings.json',
+    DimensionType.CARE_TASK.value: 'care_task.json',
+    DimensionType.CARE_PROVIDER_ROLE.value: 'care_provider_role.json',
+    # AI Cognitive Engagement (3A)
+    DimensionType.AGENT_FACING.value: 'agent_facing.json',
+    DimensionType.ANCHORING_LAYER.value: 'anchoring_layer.json',
+    DimensionType.ASSIGNED_AUTHORITY.value: 'assigned_authority.json',
+}
+
+# =============================================================================
+# Serialization Helpers
+# =============================================================================
+
+# Top-level fields that follow the streamed items array
+TRAILER_FIELDS = ['dimension_metadata']
+
+def model_to_dict(model: Any) -> Any:
+    """Convert a Pydantic model to a dict (works with Pydantic v1 and v2)"""
+    if hasattr(model, 'model_dump'):
+        return model.model_dump()
+    if hasattr(model, 'dict'):
+        return model.dict()
+    return model
+
+def _indent_json(value: Any, level: int, ensure_ascii: bool) -> str:
+    """Serialize a value as json.dump(indent=2) would when nested at `level`"""
+    text = json.dumps(value, indent=2, ensure_ascii=ensure_ascii)
+    # JSON strings never contain raw newlines, so every newline is structural
+    return text.replace('\n', '\n' + '  ' * level)
+
+# =============================================================================
+# Streaming Writer
+# =============================================================================
+
+class StreamingDimensionWriter:
+    """
+    Write a dimension document incrementally
+
+    Header fields are written on open, items are appended one at a time and
+    trailing fields (dimension_metadata) are written on close, so only one
+    item is serialized in memory at a time. Output goes to a temporary file
+    that replaces the target only when the document is closed successfully.
+    """
+
+    def __init__(
+        self,
+        output_path: Union[str, Path],
+        header: Dict[str, Any],
+        ensure_ascii: bool = False,
+        encoding: str = 'utf-8'
+    ):
+        self.output_path = Path(output_path)
+        self.header = header
+        self.trailer: Dict[str, Any] = {}
+        self.ensure_ascii = ensure_ascii
+        self.encoding = encoding
+        self.item_count = 0
+        self._tmp_path = self.output_path.with_name(self.output_path.name + '.tmp')
+        self._file = None
+
+    def open(self) -> 'StreamingDimensionWriter':
+        """Open the temporary output file and write the header fields"""
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self._tmp_path, 'w', encoding=self.encoding)
+        self._file.write('{')
+        for key, value in self.header.items():
+            self._write_field(key, value)
+            self._file.write(',')
+        self._file.write('\n  "items": [')
+        return self
+
+    def _write_field(self, key: str, value: Any):
+        self._file.write('\n  ' + json.dumps(key, ensure_ascii=self.ensure_ascii) + ': ')
+        self._file.write(_indent_json(value, 1, self.ensure_ascii))
+
+    def write_item(self, item: Union[DimensionItem, Dict[str, Any]]):
+        """Append one item to the items array"""
+        if self.item_count:
+            self._file.write(',')
+        self._file.write('\n    ' + _indent_json(model_to_dict(item), 2, self.ensure_ascii))
+        self.item_count += 1
+
+    def close(self) -> Path:
+        """Write trailing fields and move the finished file into place"""
+        self._file.write('\n  ]' if self.item_count else ']')
+        for key, value in self.trailer.items():
+            self._file.write(',')
+            self._write_field(key, value)
+        self._file.write('\n}')
+        self._file.close()
+        self._file = None
+        os.replace(self._tmp_path, self.output_path)
+        return self.output_path
+
+    def abort(self):
+        """Discard the partially written file, leaving any existing output untouched"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._tmp_path.exists():
+            self._tmp_path.unlink()
+
+    def __enter__(self) -> 'StreamingDimensionWriter':
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
+
+def write_dimension_document(
+    output_path: Union[str, Path],
+    document: Dict[str, Any],
+    ensure_ascii: bool = False
+) -> Path:
+    """Stream an already-assembled dimension dict (header, items, trailer) to disk"""
+    header = {key: value for key, value in document.items() if key not in ('items', *TRAILER_FIELDS)}
+    with StreamingDimensionWriter(output_path, header, ensure_ascii=ensure_ascii) as writer:
+        for item in document.get('items', []):
+            writer.write_item(item)
+        for key in TRAILER_FIELDS:
+            if key in document:
+                writer.trailer[key] = document[key]
+    return Path(output_path)
+
+# =============================================================================
+# Dimension Builder
+# =============================================================================
+
+class DimensionBuilder:
+    """
+    Build and stream a Clinical Skill-Mix dimension without holding its items
+
+    The header is validated with the same Pydantic models as SkillMixDimension.
+    Each item is validated as it is written; hierarchy consistency (unique IDs,
+    parents and children present) is checked when the stream ends, and a failed
+    check leaves the existing output file untouched.
+    """
+
+    def __init__(
+        self,
+        dimension: DimensionType,
+        description: str,
+        hierarchy: HierarchyInfo,
+        reference: Optional[ReferenceInfo] = None,
+        dimension_metadata: Union[Dict[str, Any], Callable[[Dict[str, Any]], Dict[str, Any]], None] = None
+    ):
+        self.dimension = DimensionType(dimension)
+        self.description = description
+        self.hierarchy = hierarchy if isinstance(hierarchy, HierarchyInfo) else HierarchyInfo(**hierarchy)
+        if reference is not None and not isinstance(reference, ReferenceInfo):
+            reference = ReferenceInfo(**reference)
+        self.reference = reference
+        self.dimension_metadata = dimension_metadata if dimension_metadata is not None else {}
+
+    @classmethod
+    def from_dimension(cls, dimension: SkillMixDimension) -> 'DimensionBuilder':
+        """Create a builder with the header of an existing dimension"""
+        return cls(
+            dimension=dimension.dimension,
+            description=dimension.description,
+            hierarchy=dimension.hierarchy,
+            reference=dimension.reference,
+            dimension_metadata=dimension.dimension_metadata
+        )
+
+    def header(self) -> Dict[str, Any]:
+        """Header fields in document order"""
+        return {
+            'dimension': self.dimension,
+            'description': self.description,
+            'reference': model_to_dict(self.reference) if self.reference is not None else None,
+            'hierarchy': model_to_dict(self.hierarchy)
+        }
+
+    def write(
+        self,
+        output_path: Union[str, Path],
+        items: Iterable[Union[DimensionItem, Dict[str, Any]]],
+        ensure_ascii: bool = False,
+        validate: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Stream items to a dimension JSON file
+
+        Args:
+            output_path: Target JSON file
+            items: Iterable (typically a generator) of DimensionItem or item dicts
+            ensure_ascii: Escape non-ASCII characters (as json.dump does by default)
+            validate: Validate items and hierarchy references while streaming
+
+        Returns:
+            Summary with total_items and depth_counts; if dimension_metadata was
+            given as a callable it is called with this summary before writing
+        """
+        seen_ids = set()
+        referenced_ids = {}
+        depth_counts = Counter()
+
+        with StreamingDimensionWriter(output_path, self.header(), ensure_ascii=ensure_ascii) as writer:
+            for item in items:
+                if validate:
+                    checked = item if isinstance(item, DimensionItem) else DimensionItem(**item)
+                    if checked.id in seen_ids:
+                        raise ValueError(f'Item IDs must be unique within component: {checked.id}')
+                    seen_ids.add(checked.id)
+                    for ref_id in ([checked.parent_id] if checked.parent_id else []) + checked.children_ids:
+                        referenced_ids.setdefault(ref_id, checked.id)
+                    depth = checked.depth
+                else:
+                    depth = item.depth if isinstance(item, DimensionItem) else item['depth']
+
+                writer.write_item(item)
+                depth_counts[depth] += 1
+
+            if writer.item_count == 0:
+                raise ValueError('Items list cannot be empty')
+
+            missing = [(ref_id, owner) for ref_id, owner in referenced_ids.items() if ref_id not in seen_ids]
+            if missing:
+                ref_id, owner = missing[0]
+                raise ValueError(f'Item {ref_id} referenced by {owner} not found ({len(missing)} missing)')
+
+            summary = {
+                'total_items': writer.item_count,
+                'depth_counts': dict(sorted(depth_counts.items()))
+            }
+            metadata = self.dimension_metadata
+            writer.trailer['dimension_metadata'] = metadata(summary) if callable(metadata) else metadata
+
+        return summary
+
+def write_dimension(
+    dimension: SkillMixDimension,
+    output_path: Union[str, Path],
+    ensure_ascii: bool = False
+) -> Path:
+    """Stream an in-memory SkillMixDimension to disk one item at a time"""
+    builder = DimensionBuilder.from_dimension(dimension)
+    # The model already validated its items on construction
+    builder.write(output_path, dimension.items, ensure_ascii=ensure_ascii, validate=False)
+    return Path(output_path)
+
+# =============================================================================
+# Loading
+# =============================================================================
+
+def load_dimension(path: Union[str, Path]) -> SkillMixDimension:
+    """Load and validate a dimension JSON file"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return SkillMixDimension(**json.load(f))
+
+def load_all_dimensions(base_path: Union[str, Path] = SKILL_MIX_PATH) -> Dict[str, SkillMixDimension]:
+    """Load all eight dimensions keyed by dimension name, in Clinical Intelligence order"""
+    return {
+        name: load_dimension(Path(base_path) / filename)
+        for name, filename in DIMENSION_FILES.items()
+    }
+
+# =============================================================================
+# Streaming Reader
+# =============================================================================
+
+READ_CHUNK_SIZE = 64 * 1024
+
+# Characters that may continue a JSON number
+_NUMBER_CHARS = frozenset('0123456789+-.eE')
+
+class DimensionReader:
+    """
+    Incrementally parse a dimension JSON file
+
+    Top-level fields before the items array are parsed on open and exposed as
+    `header`; items are then decoded one at a time from a bounded buffer, so
+    memory use does not grow with the number of items. Fields after the array
+    (dimension_metadata) are available in `trailer` once all items are read.
+    """
+
+    def __init__(self, path: Union[str, Path], chunk_size: int = READ_CHUNK_SIZE):
+        self.path = Path(path)
+        self.chunk_size = chunk_size
+        self.header: Dict[str, Any] = {}
+        self.trailer: Dict[str, Any] = {}
+        self._decoder = json.JSONDecoder()
+        self._file = None
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+        self._items_started = False
+        self._items_done = False
+
+    # -- buffer management ----------------------------------------------------
+
+    def _fill(self) -> bool:
+        """Read another chunk, dropping consumed text; False at end of file"""
+        if self._eof:
+            return False
+        chunk = self._file.read(self.chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _next_char(self) -> str:
+        """Skip whitespace and return the next significant character without consuming it"""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in ' \t\r\n':
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                raise ValueError(f'Unexpected end of file in {self.path}')
+
+    def _expect(self, char: str):
+        found = self._next_char()
+        if found != char:
+            raise ValueError(f'Expected {char!r} but found {found!r} in {self.path}')
+        self._pos += 1
+
+    def _decode_value(self) -> Any:
+        """Decode the next complete JSON value, reading more input as needed"""
+        self._next_char()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+                # A bare number may continue in the next chunk ("12." + "5")
+                is_number = isinstance(value, (int, float)) and not isinstance(value, bool)
+                if self._eof or not is_number or (end < len(self._buffer) and self._buffer[end] not in _NUMBER_CHARS):
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            self._fill()
+
+    # -- document structure ---------------------------------------------------
+
+    def _read_fields(self, target: Dict[str, Any], first: bool) -> bool:
+        """Read top-level fields into target; True if stopped at the items key"""
+        while True:
+            if self._next_char() == '}':
+                self._pos += 1
+                return False
+            if not first:
+                self._expect(',')
+            first = False
+            key = self._decode_value()
+            self._expect(':')
+            if key == 'items':
+                return True
+            target[key] = self._decode_value()
+
+    def open(self) -> 'DimensionReader':
+        """Open the file and parse the header fields"""
+        self._file = open(self.path, 'r', encoding='utf-8')
+        self._expect('{')
+        self._items_started = self._read_fields(self.header, first=True)
+        if self._items_started:
+            self._expect('[')
+        else:
+            self._items_done = True
+        return self
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> 'DimensionReader':
+        return self.open()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def iter_raw_items(self) -> Iterable[Dict[str, Any]]:
+        """Yield item dicts one at a time, then parse the trailing fields"""
+        if self._items_done:
+            return
+        first = True
+        while True:
+            if self._next_char() == ']':
+                self._pos += 1
+                break
+            if not first:
+                self._expect(',')
+            first = False
+            yield self._decode_value()
+        self._items_done = True
+        self._read_fields(self.trailer, first=False)
+
+    def iter_items(self) -> Iterable[DimensionItem]:
+        """Yield validated DimensionItem models one at a time"""
+        for item in self.iter_raw_items():
+            yield DimensionItem(**item)
+
+def read_dimension_header(path: Union[str, Path]) -> Dict[str, Any]:
+    """Read the top-level fields that precede the items array"""
+    with DimensionReader(path) as reader:
+        return reader.header
+
+def iter_dimension_items(path: Union[str, Path], as_model: bool = True) -> Iterable[Union[DimensionItem, Dict[str, Any]]]:
+    """
+    Yield the items of a dimension JSON file one at a time
+
+    Only one item is decoded at a time, so callers run in constant memory
+    and may stop iterating early without reading the rest of the file.
+
+    Args:
+        path: Dimension JSON file
+        as_model: Yield DimensionItem models (True) or lightweight item dicts (False)
+    """
+    with DimensionReader(path) as reader:
+        items = reader.iter_items() if as_model else reader.iter_raw_items()
+        for item in items:
+            yield item
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Merkle-hashed dimension hierarchies and version diffs
+Every item gets a content hash (its fields other than the hierarchy links)
+and a subtree hash combining it with its children's subtree hashes, and the
+dimension a root hash over its header and top-level subtrees. Two versions
+are identical exactly when their roots match, and a diff only descends into
+subtrees whose hashes differ
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import List, Optional, Dict, Any, Union, Iterable, Tuple
+
+from skill_mix_dimensions_model import SkillMixDimension
+from dimension_io import DimensionReader, model_to_dict
+
+# Item fields describing its place in the hierarchy; covered by subtree hashes instead
+STRUCTURE_FIELDS = ('id', 'parent_id', 'children_ids', 'path_components', 'depth')
+
+DIGEST_SIZE = 16
+
+def _digest(*parts: Union[str, bytes]) -> str:
+    h = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    for part in parts:
+        h.update(part.encode('utf-8') if isinstance(part, str) else part)
+        h.update(b'\0')
+    return h.hexdigest()
+
+def _canonical(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+
+def content_hash(item: Dict[str, Any]) -> str:
+    """Hash of an item dict's own content (everything but STRUCTURE_FIELDS)"""
+    return _digest(_canonical({key: value for key, value in item.items() if key not in STRUCTURE_FIELDS}))
+
+# =============================================================================
+# Merkle Tree
+# =============================================================================
+
+class MerkleNode:
+    """Hashes and hierarchy links of one item"""
+
+    __slots__ = ('id', 'parent_id', 'children_ids', 'content', 'subtree', 'label')
+
+    def __init__(self, item: Dict[str, Any]):
+        self.id: str = item['id']
+        self.parent_id: Optional[str] = item.get('parent_id')
+        self.children_ids: List[str] = list(item.get('children_ids', []))
+        self.content: str = content_hash(item)
+        self.subtree: str = ''
+        # Matches items whose ID changed with their parent (see DimensionDiff.match_renamed_moves)
+        self.label: str = _digest(item.get('name', ''), item.get('description') or '')
+
+class MerkleTree:
+    """
+    Merkle hashes of one dimension version
+
+    Args:
+        header: Top-level fields other than items (dimension, description, ...)
+        items: Item dicts in file order
+    """
+
+    def __init__(self, header: Dict[str, Any], items: Iterable[Dict[str, Any]]):
+        self.nodes: Dict[str, MerkleNode] = {}
+        for item in items:
+            self.nodes[item['id']] = MerkleNode(item)
+        self.root_ids = [node.id for node in self.nodes.values() if node.parent_id not in self.nodes]
+        self.header_hash = _digest(_canonical(header))
+
+        # Children before parents: hash subtrees iteratively, deepest first
+        order, stack = [], list(self.root_ids)
+        while stack:
+            node = self.nodes[stack.pop()]
+            order.append(node)
+            stack.extend(child_id for child_id in node.children_ids if child_id in self.nodes)
+        for node in reversed(order):
+            node.subtree = _digest(node.content, *self._child_hashes(node))
+        self.root = _digest(self.header_hash, *(self.nodes[root_id].subtree for root_id in self.root_ids))
+
+    def _child_hashes(self, node: MerkleNode) -> List[str]:
+        # Children are hashed in listed order, with missing children by ID
+        return [self.nodes[child_id].subtree if child_id in self.nodes else f'?{child_id}' for child_id in node.children_ids]
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path]) -> 'MerkleTree':
+        """Hash a dimension JSON file, streaming its items"""
+        with DimensionReader(path) as reader:
+            items = list(reader.iter_raw_items())
+            return cls({**reader.header, **reader.trailer}, items)
+
+    @classmethod
+    def from_dimension(cls, dimension: SkillMixDimension) -> 'MerkleTree':
+        """Hash a loaded dimension"""
+        document = model_to_dict(dimension)
+        items = document.pop('items')
+        return cls(document, items)
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def unchanged(self, other: 'MerkleTree') -> bool:
+        return self.root == other.root
+
+    def diff(self, new: 'MerkleTree') -> 'DimensionDiff':
+        """Changes from this version to a newer one (see DimensionDiff)"""
+        result = DimensionDiff(header_changed=self.header_hash != new.header_hash)
+        if self.root == new.root:
+            return result
+
+        visited = set()
+        stack: List[Tuple[Optional[str], List[str], List[str]]] = [(None, self.root_ids, new.root_ids)]
+        while stack:
+            parent_id, old_ids, new_ids = stack.pop()
+            old_siblings, new_siblings = set(old_ids), set(new_ids)
+            kept = old_siblings & new_siblings
+            if [item_id for item_id in old_ids if item_id in kept] != [item_id for item_id in new_ids if item_id in kept]:
+                result.reordered.append(parent_id)
+            for item_id in old_ids + [item_id for item_id in new_ids if item_id not in old_siblings]:
+                if item_id in visited:
+                    continue
+                old_node, new_node = self.nodes.get(item_id), new.nodes.get(item_id)
+                if old_node is not None and new_node is not None:
+                    # Moved items are reached from their old parent
+                    if item_id not in old_siblings:
+                        continue
+                    visited.add(item_id)
+                    if item_id not in new_siblings:
+                        result.moved.append({'from': item_id, 'to': item_id,
+                                             'old_parent': old_node.parent_id, 'new_parent': new_node.parent_id})
+                    elif old_node.subtree == new_node.subtree:
+                        continue
+                    if old_node.content != new_node.content:
+                        result.modified.append(item_id)
+                    stack.append((item_id, old_node.children_ids, new_node.children_ids))
+                elif old_node is not None:
+                    visited.add(item_id)
+                    result.removed.append(item_id)
+                    stack.append((item_id, old_node.children_ids, []))
+                elif new_node is not None:
+                    visited.add(item_id)
+                    result.added.append(item_id)
+                    stack.append((item_id, [], new_node.children_ids))
+
+        result.match_renamed_moves(self, new)
+        return result
+
+# =============================================================================
+# Diff
+# =============================================================================
+
+class DimensionDiff:
+    """
+    Item-level changes between two versions of a dimension
+
+    Attributes:
+        added: IDs only in the new version
+        removed: IDs only in the old version
+        modified: IDs whose own content changed
+        moved: {'from', 'to', 'old_parent', 'new_parent'} for items under a new parent
+            ('from' != 'to' when the move also changed a path-based ID)
+        reordered: IDs of parents whose remaining children are listed in a new order
+            (None for the top-level items)
+        header_changed: Description, reference, hierarchy or metadata changed
+    """
+
+    def __init__(self, header_changed: bool = False):
+        self.added: List[str] = []
+        self.removed: List[str] = []
+        self.modified: List[str] = []
+        self.moved: List[Dict[str, Optional[str]]] = []
+        self.reordered: List[Optional[str]] = []
+        self.header_changed = header_changed
+
+    def match_renamed_moves(self, old: MerkleTree, new: MerkleTree):
+        """Pair removed and added items with the same name and description into moves"""
+        added_by_label: Dict[str, List[str]] = {}
+        for item_id in self.added:
+            added_by_label.setdefault(new.nodes[item_id].label, []).append(item_id)
+        removed_by_label: Dict[str, List[str]] = {}
+        for item_id in self.removed:
+            removed_by_label.setdefault(old.nodes[item_id].label, []).append(item_id)
+
+        matched_old, matched_new = set(), set()
+        for label, old_ids in removed_by_label.items():
+            new_ids = added_by_label.get(label, [])
+            # Only unambiguous matches
+            if len(old_ids) == 1 and len(new_ids) == 1:
+                old_node, new_node = old.nodes[old_ids[0]], new.nodes[new_ids[0]]
+                self.moved.append({'from': old_node.id, 'to': new_node.id,
+                                   'old_parent': old_node.parent_id, 'new_parent': new_node.parent_id})
+                if old_node.content != new_node.content:
+                    self.modified.append(new_node.id)
+                matched_old.add(old_node.id)
+                matched_new.add(new_node.id)
+
+        self.removed = [item_id for item_id in self.removed if item_id not in matched_old]
+        self.added = [item_id for item_id in self.added if item_id not in matched_new]
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.modified or self.moved or self.reordered or self.header_changed)
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'added': len(self.added),
+            'removed': len(self.removed),
+            'modified': len(self.modified),
+            'moved': len(self.moved),
+            'reordered': len(self.reordered),
+            'header_changed': self.header_changed,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'added': self.added,
+            'removed': self.removed,
+            'modified': self.modified,
+            'moved': self.moved,
+            'reordered': self.reordered,
+            'header_changed': self.header_changed,
+        }
+
+def diff_dimension_files(old_path: Union[str, Path], new_path: Union[str, Path]) -> DimensionDiff:
+    """Diff two dimension JSON files"""
+    return MerkleTree.from_file(old_path).diff(MerkleTree.from_file(new_path))
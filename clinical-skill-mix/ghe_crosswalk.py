@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+ICD-10 -> WHO Global Health Estimates (GHE) cause crosswalk
+GHE causes are defined by ICD-10 code ranges (data/analysis/ghe_icd10_ranges.json).
+The ranges are flattened into sorted, non-overlapping integer intervals
+(the narrowest range wins where ranges overlap), so a batch of codes is
+resolved with a single searchsorted pass and then joined to the DALY
+figures of data/analysis/global_daly_statistics.json
+"""
+
+import json
+from pathlib import Path
+from typing import List, Optional, Dict, Any, Union, Iterable, Tuple
+
+import numpy as np
+
+# Define paths
+ANALYSIS_PATH = Path(__file__).parent.parent / "data" / "analysis"
+GHE_RANGES_FILE = ANALYSIS_PATH / "ghe_icd10_ranges.json"
+DALY_STATISTICS_FILE = ANALYSIS_PATH / "global_daly_statistics.json"
+
+# Condition metadata written from the matched GHE cause (names as in generate_conditions_json.py)
+BURDEN_FIELDS = {
+    'ghe_cause_code': 'code',
+    'ghe_cause_title': 'title',
+    'disease_type': 'type',
+    'global_rank': 'rank',
+    'daly_total': 'daly_total',
+    'daly_per_100k': 'daly_per_100k',
+    'deaths_total': 'deaths_total',
+    'deaths_per_100k': 'deaths_per_100k',
+    'daly_category': 'daly_category',
+}
+
+# =============================================================================
+# Code Keys
+# =============================================================================
+
+def icd10_key(code: str) -> int:
+    """
+    Integer key of a code's 3-character category
+
+    Base-36 ordering puts digits before letters, matching string order, so
+    ICD-10-CM categories such as I1A or M1A sort after I19 and M19.
+    """
+    category = code.strip().replace('.', '')[:3]
+    if len(category) != 3 or not category.isalnum():
+        raise ValueError(f'Not an ICD-10 code: {code}')
+    return int(category, 36)
+
+def parse_code_range(text: str) -> Tuple[int, int]:
+    """Inclusive key range of 'A15-A19' or a single code 'B90'"""
+    start, _, end = text.partition('-')
+    return icd10_key(start), icd10_key(end or start)
+
+# =============================================================================
+# Interval Index
+# =============================================================================
+
+class IntervalIndex:
+    """
+    Sorted, non-overlapping inclusive integer intervals, each with a value
+
+    Args:
+        starts: Interval start keys (ascending)
+        ends: Interval end keys (inclusive)
+        values: Value index per interval
+    """
+
+    def __init__(self, starts: np.ndarray, ends: np.ndarray, values: np.ndarray):
+        self.starts = np.asarray(starts, dtype=np.int64)
+        self.ends = np.asarray(ends, dtype=np.int64)
+        self.values = np.asarray(values, dtype=np.int64)
+
+    @classmethod
+    def from_ranges(cls, ranges: Iterable[Tuple[int, int, int]]) -> 'IntervalIndex':
+        """
+        Flatten possibly overlapping (start, end, value) ranges
+
+        Each key gets the value of the narrowest range containing it;
+        adjacent pieces with the same value are merged.
+        """
+        ranges = [(start, end, value) for start, end, value in ranges if start <= end]
+        boundaries = sorted({start for start, _, _ in ranges} | {end + 1 for _, end, _ in ranges})
+
+        starts, ends, values = [], [], []
+        for low, high in zip(boundaries, boundaries[1:]):
+            covering = [(end - start, value) for start, end, value in ranges if start <= low and high - 1 <= end]
+            if not covering:
+                continue
+            value = min(covering)[1]
+            if values and values[-1] == value and ends[-1] == low - 1:
+                ends[-1] = high - 1
+            else:
+                starts.append(low)
+                ends.append(high - 1)
+                values.append(value)
+        return cls(np.array(starts), np.array(ends), np.array(values))
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def lookup_many(self, keys: np.ndarray) -> np.ndarray:
+        """Value of the interval containing each key (-1 where none does)"""
+        keys = np.asarray(keys, dtype=np.int64)
+        positions = np.searchsorted(self.starts, keys, side='right') - 1
+        clipped = np.clip(positions, 0, max(len(self) - 1, 0))
+        inside = (positions >= 0) & (keys <= self.ends[clipped]) if len(self) else np.zeros(len(keys), dtype=bool)
+        return np.where(inside, self.values[clipped] if len(self) else -1, -1)
+
+    def lookup(self, key: int) -> int:
+        return int(self.lookup_many(np.array([key]))[0])
+
+# =============================================================================
+# Crosswalk
+# =============================================================================
+
+class GHECrosswalk:
+    """
+    Resolve ICD-10 codes to GHE causes
+
+    Args:
+        causes: Cause dicts with 'code', 'title' and 'icd10' (list of code ranges)
+    """
+
+    def __init__(self, causes: List[Dict[str, Any]]):
+        self.causes = list(causes)
+        self.index = IntervalIndex.from_ranges(
+            (*parse_code_range(code_range), position)
+            for position, cause in enumerate(self.causes)
+            for code_range in cause['icd10']
+        )
+
+    @classmethod
+    def load(cls, path: Union[str, Path] = GHE_RANGES_FILE) -> 'GHECrosswalk':
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f)['causes'])
+
+    def resolve_many(self, codes: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """GHE cause of each code (None if no range covers it), in one bulk pass"""
+        positions = self.index.lookup_many(np.fromiter((icd10_key(code) for code in codes), dtype=np.int64))
+        return [self.causes[position] if position >= 0 else None for position in positions.tolist()]
+
+    def resolve(self, code: str) -> Optional[Dict[str, Any]]:
+        return self.resolve_many([code])[0]
+
+def load_daly_statistics(path: Union[str, Path] = DALY_STATISTICS_FILE) -> Dict[int, Dict[str, Any]]:
+    """DALY statistics per GHE cause code"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return {disease['code']: disease for disease in json.load(f)['diseases']}
+
+def condition_burden(
+    codes: List[str],
+    crosswalk: Optional[GHECrosswalk] = None,
+    daly_statistics: Optional[Dict[int, Dict[str, Any]]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Burden metadata (BURDEN_FIELDS) for each ICD-10 code; empty where no GHE cause matches
+
+    Args:
+        codes: ICD-10 codes
+        crosswalk: Crosswalk to use (default: GHECrosswalk.load())
+        daly_statistics: DALY figures per GHE cause (default: load_daly_statistics())
+    """
+    crosswalk = crosswalk or GHECrosswalk.load()
+    daly_statistics = daly_statistics if daly_statistics is not None else load_daly_statistics()
+
+    burden = []
+    for cause in crosswalk.resolve_many(codes):
+        disease = daly_statistics.get(cause['code']) if cause else None
+        if disease is None:
+            burden.append({})
+        else:
+            burden.append({field: disease[source] for field, source in BURDEN_FIELDS.items() if source in disease})
+    return burden
+
+def burden_summary(burden: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Coverage of a condition_burden() result, for dimension metadata"""
+    causes = {entry['ghe_cause_code'] for entry in burden if entry}
+    return {
+        'source': 'WHO Global Health Estimates (data/analysis/global_daly_statistics.json)',
+        'crosswalk': 'ICD-10 code ranges per GHE cause (data/analysis/ghe_icd10_ranges.json)',
+        'mapped_codes': sum(1 for entry in burden if entry),
+        'unmapped_codes': sum(1 for entry in burden if not entry),
+        'ghe_causes': len(causes),
+    }
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+TF-IDF "related items" index with precomputed top-k neighbours
+Item text (name, description and ancestor names) is vectorized into a
+sparse, L2-normalized TF-IDF matrix; cosine neighbours are found block by
+block (sparse block x sparse transpose), keeping only each row's top k, so
+no all-pairs dense matrix is ever built. The resulting neighbour table
+answers lookups in constant time
+"""
+
+import re
+from pathlib import Path
+from typing import List, Optional, Dict, Any, Union, Tuple
+
+import numpy as np
+from scipy import sparse
+
+from skill_mix_dimensions_model import SkillMixDimension, DimensionItem
+
+DEFAULT_K = 10
+DEFAULT_BLOCK_SIZE = 512
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+# Words carrying no topical signal in item names and descriptions
+STOP_WORDS = frozenset("""
+a an and are as at be by for from in into is it its not of on or other others
+than that the their this to with without unspecified specified
+""".split())
+
+# =============================================================================
+# Vectorization
+# =============================================================================
+
+def item_text(item: DimensionItem) -> str:
+    """Text an item is compared on: its name, description and ancestor names"""
+    ancestor_names = [
+        info.get('name', '') for level, info in sorted(item.level_info.items()) if int(level) < item.depth
+    ]
+    return ' '.join([item.name, item.description or ''] + ancestor_names)
+
+def tokenize(text: str) -> List[str]:
+    return [token for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOP_WORDS and len(token) > 1]
+
+def tfidf_matrix(texts: List[str]) -> sparse.csr_matrix:
+    """
+    L2-normalized TF-IDF rows (smoothed idf: ln((1 + n) / (1 + df)) + 1)
+
+    Args:
+        texts: One document per row
+    """
+    vocabulary: Dict[str, int] = {}
+    rows, columns = [], []
+    for row, text in enumerate(texts):
+        for token in tokenize(text):
+            rows.append(row)
+            columns.append(vocabulary.setdefault(token, len(vocabulary)))
+
+    counts = sparse.csr_matrix(
+        (np.ones(len(rows), dtype=np.float32), (rows, columns)),
+        shape=(len(texts), len(vocabulary))
+    )
+    counts.sum_duplicates()
+
+    document_frequency = np.bincount(counts.indices, minlength=len(vocabulary))
+    idf = np.log((1 + len(texts)) / (1 + document_frequency)) + 1
+    matrix = counts.multiply(idf.astype(np.float32)).tocsr()
+
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1
+    return sparse.csr_matrix(sparse.diags(1 / norms) @ matrix, dtype=np.float32)
+
+def top_k_neighbours(
+    matrix: sparse.csr_matrix,
+    k: int = DEFAULT_K,
+    block_size: int = DEFAULT_BLOCK_SIZE
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Top-k cosine neighbours of every row (excluding itself), computed in row blocks
+
+    Returns:
+        (neighbours, scores): (n, k) row indices and similarities, best first;
+        missing neighbours (no shared tokens) are -1 with score 0
+    """
+    n = matrix.shape[0]
+    k = min(k, max(n - 1, 0))
+    neighbours = np.full((n, k), -1, dtype=np.int32)
+    scores = np.zeros((n, k), dtype=np.float32)
+    if k == 0:
+        return neighbours, scores
+
+    transposed = matrix.T.tocsc()
+    for start in range(0, n, block_size):
+        stop = min(start + block_size, n)
+        block = (matrix[start:stop] @ transposed).toarray()
+        block[np.arange(stop - start), np.arange(start, stop)] = -1  # exclude self
+
+        top = np.argpartition(-block, k - 1, axis=1)[:, :k]
+        top_scores = np.take_along_axis(block, top, axis=1)
+        order = np.argsort(-top_scores, axis=1, kind='stable')
+        top = np.take_along_axis(top, order, axis=1)
+        top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+        found = top_scores > 0
+        neighbours[start:stop] = np.where(found, top, -1)
+        scores[start:stop] = np.where(found, top_scores, 0)
+
+    return neighbours, scores
+
+# =============================================================================
+# Neighbour Table
+# =============================================================================
+
+class RelatedItemsIndex:
+    """
+    Precomputed nearest neighbours of every item of one dimension
+
+    Args:
+        ids: Item IDs, one per row
+        neighbours: (n, k) neighbour row indices (-1 for none)
+        scores: (n, k) cosine similarities
+    """
+
+    def __init__(self, ids: List[str], neighbours: np.ndarray, scores: np.ndarray):
+        self.ids = list(ids)
+        self.neighbours = neighbours
+        self.scores = scores
+        self.positions = {item_id: position for position, item_id in enumerate(self.ids)}
+
+    @classmethod
+    def build(
+        cls,
+        dimension: SkillMixDimension,
+        k: int = DEFAULT_K,
+        block_size: int = DEFAULT_BLOCK_SIZE
+    ) -> 'RelatedItemsIndex':
+        """Vectorize a dimension's items and compute their top-k neighbours"""
+        matrix = tfidf_matrix([item_text(item) for item in dimension.items])
+        neighbours, scores = top_k_neighbours(matrix, k, block_size)
+        return cls([item.id for item in dimension.items], neighbours, scores)
+
+    @property
+    def k(self) -> int:
+        return self.neighbours.shape[1]
+
+    def related(self, item_id: str, k: Optional[int] = None) -> List[Tuple[str, float]]:
+        """(item ID, similarity) pairs of an item's nearest neighbours, best first"""
+        try:
+            row = self.positions[item_id]
+        except KeyError:
+            raise KeyError(f'Unknown item: {item_id}') from None
+        return [
+            (self.ids[neighbour], float(score))
+            for neighbour, score in zip(self.neighbours[row, :k], self.scores[row, :k])
+            if neighbour >= 0
+        ]
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """Persist to a compressed .npz file"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(
+            path,
+            ids=np.array(self.ids, dtype=str),
+            neighbours=self.neighbours,
+            scores=self.scores.astype(np.float16)
+        )
+        return path
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'RelatedItemsIndex':
+        """Load an index saved with save()"""
+        with np.load(path, allow_pickle=False) as data:
+            return cls(data['ids'].tolist(), data['neighbours'], data['scores'].astype(np.float32))
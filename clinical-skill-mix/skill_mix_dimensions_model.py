@@ -305,6 +305,38 @@ def multiply_dimensions_at_depth(
     
     return combinations
 
+def select_dimension_items(spec: Dict[str, Any]) -> List[DimensionItem]:
+    """
+    Select the items of one component according to a flexible depth spec
+
+    Args:
+        spec: Spec containing:
+            - dimension: SkillMixDimension (component)
+            - depth: int (optional, default: max depth)
+            - filter_ids: List[str] (optional, filter to specific item IDs)
+            - parent_id: str (optional, only descendants of this item)
+
+    Returns:
+        Selected items in component order
+    """
+    dimension = spec['dimension']
+    depth = spec.get('depth', dimension.hierarchy.max_depth)
+    filter_ids = spec.get('filter_ids', [])
+    parent_id = spec.get('parent_id')
+    
+    # Get items based on specifications
+    if parent_id:
+        items = get_children_at_depth(dimension, parent_id, depth)
+    else:
+        items = get_items_at_depth(dimension, depth)
+    
+    # Apply ID filter if specified
+    if filter_ids:
+        filter_set = set(filter_ids)
+        items = [item for item in items if item.id in filter_set]
+    
+    return items
+
 def multiply_dimensions_flexible_depth(
     dimension_specs: List[Dict[str, Any]]
 ) -> List[Dict[str, DimensionItem]]:
@@ -323,27 +355,8 @@ def multiply_dimensions_flexible_depth(
     Returns:
         List of combination dictionaries representing Cube cells
     """
-    dimension_items = []
-    dimension_names = []
-    
-    for spec in dimension_specs:
-        dimension = spec['dimension']
-        depth = spec.get('depth', dimension.hierarchy.max_depth)
-        filter_ids = spec.get('filter_ids', [])
-        parent_id = spec.get('parent_id')
-        
-        # Get items based on specifications
-        if parent_id:
-            items = get_children_at_depth(dimension, parent_id, depth)
-        else:
-            items = get_items_at_depth(dimension, depth)
-        
-        # Apply ID filter if specified
-        if filter_ids:
-            items = [item for item in items if item.id in filter_ids]
-        
-        dimension_items.append(items)
-        dimension_names.append(dimension.dimension.value)
+    dimension_items = [select_dimension_items(spec) for spec in dimension_specs]
+    dimension_names = [spec['dimension'].dimension.value for spec in dimension_specs]
     
     # Compute Cartesian product
     combinations = []
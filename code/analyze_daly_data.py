@@ -8,64 +8,46 @@ import json
 import numpy as np
 from pathlib import Path
 
+from daly_cache import load_daly_frame
+from daly_cube import load_daly_cube
+
 # Define paths
 BASE_PATH = Path(__file__).parent.parent
 DATA_PATH = BASE_PATH / "data"
 ANALYSIS_PATH = DATA_PATH / "analysis"
 
-def load_daly_data():
-    """Load the WHO DALY 2021 CSV file"""
-    csv_path = DATA_PATH / "WHO DALY 2021.csv"
-    return pd.read_csv(csv_path)
+# Most recent pre-COVID year
+ANALYSIS_YEAR = 2019
 
-def analyze_global_daly(df):
-    """Analyze DALY data to get global disease statistics"""
-    
-    # Filter for 2019 data (most recent pre-COVID year)
-    df_2019 = df[df['YEAR'] == 2019]
-    
-    # Group by disease and sum across all countries, sexes, and age groups
-    disease_daly = df_2019.groupby(['GHE_CAUSE_CODE', 'GHE_CAUSE_TITLE', 'GHE_CAUSE_TYPE']).agg({
-        'DALY': 'sum',
-        'DEATHS': 'sum',
-        'POPULATION': 'sum'
-    }).reset_index()
-    
-    # Calculate rates per 100,000
-    disease_daly['DALY_PER_100K'] = (disease_daly['DALY'] / disease_daly['POPULATION']) * 100000
-    disease_daly['DEATHS_PER_100K'] = (disease_daly['DEATHS'] / disease_daly['POPULATION']) * 100000
-    
-    # Sort by total DALY
-    disease_daly = disease_daly.sort_values('DALY', ascending=False)
-    
-    # Add ranking
-    disease_daly['GLOBAL_RANK'] = range(1, len(disease_daly) + 1)
-    
-    # Categorize by DALY burden
-    disease_daly['DALY_CATEGORY'] = pd.cut(
-        disease_daly['GLOBAL_RANK'],
-        bins=[0, 10, 30, 50, float('inf')],
-        labels=['very-high', 'high', 'moderate', 'low']
-    )
-    
-    return disease_daly
+def load_daly_data(columns=None, years=None):
+    """Load WHO DALY 2021 records from the columnar cache (built from the CSV on first use)"""
+    return load_daly_frame(columns=columns, years=years)
+
+def analyze_global_daly(cube=None, year=ANALYSIS_YEAR):
+    """Analyze DALY data to get global disease statistics for one year"""
+    if cube is None:
+        cube = load_daly_cube()
+    
+    # Slice the precomputed cube instead of filtering and grouping the raw records:
+    # sums across all countries, sexes, and age groups with rates, ranks and categories
+    return cube.select(years=[year])
 
 def get_disease_categories(df):
     """Extract unique disease categories"""
-    categories = df.groupby(['GHE_CAUSE_TYPE']).agg({
+    categories = df.groupby(['GHE_CAUSE_TYPE'], observed=True).agg({
         'GHE_CAUSE_CODE': 'count'
     }).reset_index()
     categories.columns = ['category', 'count']
     return categories
 
-def save_analysis_results(disease_stats, categories):
+def save_analysis_results(disease_stats, categories, year=ANALYSIS_YEAR):
     """Save analysis results to JSON files"""
     ANALYSIS_PATH.mkdir(exist_ok=True)
     
     # Save disease statistics
     stats_output = {
         'data_source': 'WHO Global Health Estimates 2021',
-        'analysis_year': 2019,
+        'analysis_year': year,
         'notes': 'Data represents top 25 economies, extrapolated for global burden',
         'total_diseases': len(disease_stats),
         'diseases': []
@@ -118,7 +100,7 @@ def save_analysis_results(disease_stats, categories):
         })
     
     # Count by category
-    category_counts = disease_stats.groupby('GHE_CAUSE_TYPE').size().to_dict()
+    category_counts = disease_stats.groupby('GHE_CAUSE_TYPE', observed=True).size().to_dict()
     summary_output['disease_categories'] = category_counts
     
     summary_path = ANALYSIS_PATH / 'daly_summary.json'
@@ -129,9 +111,9 @@ def save_analysis_results(disease_stats, categories):
     
     return stats_path, summary_path
 
-def print_top_diseases(disease_stats, n=20):
+def print_top_diseases(disease_stats, n=20, year=ANALYSIS_YEAR):
     """Print top N diseases by DALY"""
-    print(f"\nTop {n} Diseases by Global DALY Burden (2019)")
+    print(f"\nTop {n} Diseases by Global DALY Burden ({year})")
     print("=" * 80)
     print(f"{'Rank':<6}{'Disease':<50}{'DALY (millions)':<20}{'Type':<20}")
     print("-" * 80)
@@ -142,7 +124,7 @@ def print_top_diseases(disease_stats, n=20):
 
 if __name__ == "__main__":
     print("Loading WHO DALY 2021 data...")
-    df = load_daly_data()
+    df = load_daly_data(columns=['YEAR', 'COUNTRY', 'GHE_CAUSE_CODE', 'GHE_CAUSE_TYPE'])
     
     print(f"Loaded {len(df)} records")
     print(f"Countries: {df['COUNTRY'].nunique()}")
@@ -150,7 +132,7 @@ if __name__ == "__main__":
     print(f"Disease categories: {df['GHE_CAUSE_TYPE'].nunique()}")
     
     print("\nAnalyzing global DALY burden...")
-    disease_stats = analyze_global_daly(df)
+    disease_stats = analyze_global_daly(load_daly_cube())
     
     print("\nExtracting disease categories...")
     categories = get_disease_categories(df)
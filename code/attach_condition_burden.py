@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Attach WHO GHE burden figures to an existing conditions.json
+
+Resolves every condition's ICD-10 code to its Global Health Estimates cause
+(ghe_crosswalk.py) in one bulk pass and writes the cause and DALY figures
+into the condition metadata, without regenerating the dimension from the
+ICD-10-CM source CSV. Re-running replaces previously attached figures.
+
+Example:
+    python code/attach_condition_burden.py
+    python code/attach_condition_burden.py --show I21 E11 Z00
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "clinical-skill-mix"))
+
+from dimension_io import DimensionReader, write_dimension_document
+from ghe_crosswalk import BURDEN_FIELDS, GHECrosswalk, load_daly_statistics, condition_burden, burden_summary
+
+# Define paths
+SKILL_MIX_PATH = Path(__file__).parent.parent / "clinical-skill-mix"
+CONDITIONS_FILE = SKILL_MIX_PATH / "conditions.json"
+
+
+def attach_condition_burden(path=CONDITIONS_FILE, output_path=None):
+    """
+    Rewrite a conditions dimension with burden metadata on its ICD-10 coded items
+
+    Returns:
+        {icd10 code: burden metadata} of the coded items
+    """
+    with DimensionReader(path) as reader:
+        items = list(reader.iter_raw_items())
+        document = {**reader.header, 'items': items, **reader.trailer}
+
+    coded = [item for item in items if 'icd10_code' in item.get('metadata', {})]
+    codes = [item['metadata']['icd10_code'] for item in coded]
+    burden = condition_burden(codes, GHECrosswalk.load(), load_daly_statistics())
+
+    for item, entry in zip(coded, burden):
+        metadata = {key: value for key, value in item['metadata'].items() if key not in BURDEN_FIELDS}
+        item['metadata'] = {**metadata, **entry}
+
+    document['dimension_metadata'] = {**document.get('dimension_metadata', {}), 'daly_crosswalk': burden_summary(burden)}
+    write_dimension_document(output_path or path, document)
+    return dict(zip(codes, burden))
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--input', type=Path, default=CONDITIONS_FILE)
+    parser.add_argument('--output', type=Path, help='Write here instead of rewriting the input')
+    parser.add_argument('--show', nargs='+', metavar='CODE', help='Print the burden of some ICD-10 codes')
+    args = parser.parse_args()
+
+    burden = attach_condition_burden(args.input, args.output)
+    summary = burden_summary(list(burden.values()))
+    print(f"✓ {summary['mapped_codes']:,} of {len(burden):,} conditions mapped to "
+          f"{summary['ghe_causes']} GHE causes -> {args.output or args.input}")
+
+    for code in args.show or []:
+        entry = burden.get(code.upper())
+        if not entry:
+            print(f"  {code.upper()}: no GHE cause")
+            continue
+        print(f"  {code.upper()}: {entry['ghe_cause_code']} {entry['ghe_cause_title']} "
+              f"(rank {entry.get('global_rank')}, {entry.get('daly_total', 0):,.0f} DALYs)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Create or update the cell-id mapping file (clinical-skill-mix/cell_ids.json)
+
+Assigns stable codes to the items of the current cell space (cell_ids.py):
+existing codes are kept, new items take free codes, and a new version is
+added only when an axis outgrows its bit field. Rerun after regenerating
+a dimension.
+
+Example:
+    python code/build_cell_ids.py
+    python code/build_cell_ids.py --encode 0 67504639103 --decode 72057594037927936
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "clinical-skill-mix"))
+
+from dimension_io import load_all_dimensions
+from cell_space import CellSpace
+from cell_ids import CELL_IDS_FILE, CellIdCodec, load_codecs, save_codecs, cell_id_version
+
+
+def update_cell_ids(space, path=CELL_IDS_FILE):
+    """
+    Bring the mapping file up to date with a cell space
+
+    Returns:
+        (all codecs by version, latest codec)
+    """
+    codecs = load_codecs(path) if Path(path).exists() else {}
+    codec = codecs[max(codecs)].updated(space) if codecs else CellIdCodec.from_space(space)
+    if codecs.get(codec.version) is not codec:
+        codecs[codec.version] = codec
+        save_codecs(codecs, path)
+    return codecs, codec
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--mapping', type=Path, default=CELL_IDS_FILE)
+    parser.add_argument('--encode', nargs='+', type=int, metavar='RANK', help='Print the cell ids of cell ranks')
+    parser.add_argument('--decode', nargs='+', type=int, metavar='CELL_ID', help='Print the cells of cell ids')
+    args = parser.parse_args()
+
+    space = CellSpace.from_dimensions(load_all_dimensions())
+    codecs, codec = update_cell_ids(space, args.mapping)
+
+    print(f"✓ Cell ids version {codec.version} ({codec.bits} bits) in {args.mapping}")
+    for name, shift, width, ids in zip(codec.names, codec.shifts, codec.widths, codec.item_ids):
+        print(f"  {name:<20} bits {shift:>2}-{shift + width - 1:<2} {len(ids):>5,} of {1 << width:,} codes")
+
+    if args.encode:
+        for rank, cell_id in zip(args.encode, codec.encode_ranks(space, np.array(args.encode)).tolist()):
+            print(f"  rank {rank} -> {cell_id}")
+    if args.decode:
+        for cell_id, version in zip(args.decode, cell_id_version(np.array(args.decode)).tolist()):
+            if version not in codecs:
+                print(f"  {cell_id}: unknown version {version}")
+                continue
+            print(f"  {cell_id} (v{version}) -> {codecs[version].item_ids_of(cell_id)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Build the website data under docs/clinical-skill-mix/
+
+Copies each dimension JSON into the docs folder and writes a small sidecar
+next to it (<file>.stats.json) with what dimension-loader.js otherwise
+recomputes on every load: the dimension header, item statistics, depth
+histogram and the parent -> children map.
+
+Large dimensions (conditions) are additionally split into a directory with
+an index.json (header, statistics and root items) and one shard per root
+item (ICD chapter), so the explorer can fetch chapters on demand.
+
+Every file is then published minified under dist/ with a content hash in
+its name and listed in manifest.json, which the website resolves logical
+file names through. Transfer compression is left to the web server (GitHub
+Pages gzips JSON on the fly), so no precompressed copies are written.
+Hashed files never change, so they can be cached indefinitely; the docs
+service worker (docs/sw.js) precaches the manifest's files and refreshes
+only those whose hash changed. Files superseded by shards are listed with
+precache: false.
+"""
+
+import hashlib
+import json
+import shutil
+import sys
+from collections import Counter
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "clinical-skill-mix"))
+
+from dimension_io import DIMENSION_FILES, SKILL_MIX_PATH, DimensionReader
+from skill_mix_dimensions_model import DimensionType
+
+# Define paths
+BASE_PATH = Path(__file__).parent.parent
+DOCS_DATA_PATH = BASE_PATH / "docs" / "clinical-skill-mix"
+
+SIDECAR_SUFFIX = '.stats.json'
+MANIFEST_FILE = 'manifest.json'
+DIST_DIR = 'dist'
+
+# Hex digits of the SHA-256 content hash kept in file names
+HASH_LENGTH = 10
+
+# Dimensions also published as an index plus one shard per root item
+SHARDED_DIMENSIONS = [DimensionType.CONDITION.value]
+
+
+def write_minified_json(path, data):
+    """Write compact JSON (no indentation or spaces)"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+
+
+def dimension_statistics(items):
+    """
+    Item statistics as computed by calculateDimensionStatistics in dimension-loader.js
+    """
+    items_by_depth = Counter(item['depth'] for item in items)
+    child_counts = [len(item.get('children_ids') or []) for item in items]
+    parent_counts = [count for count in child_counts if count > 0]
+
+    # JS reports toFixed(1) (a string) when there are parents, else the number 0
+    average = f"{sum(parent_counts) / len(parent_counts):.1f}" if parent_counts else 0
+
+    return {
+        'totalItems': len(items),
+        'itemsByDepth': {str(depth): items_by_depth[depth] for depth in sorted(items_by_depth)},
+        'averageChildrenPerParent': average,
+        'maxChildren': max(child_counts, default=0),
+        'leafNodes': sum(1 for count in child_counts if count == 0)
+    }
+
+
+def build_sidecar(header, items, trailer):
+    """
+    Sidecar for one dimension: header fields, statistics and hierarchy maps
+
+    Args:
+        header: Top-level fields before the items array
+        items: Raw item dicts
+        trailer: Top-level fields after the items array
+    """
+    by_depth = {}
+    for item in items:
+        by_depth.setdefault(str(item['depth']), []).append(item['id'])
+
+    return {
+        **header,
+        **trailer,
+        'maxDepth': max((item['depth'] for item in items), default=0),
+        'statistics': dimension_statistics(items),
+        'depthHistogram': {depth: len(ids) for depth, ids in by_depth.items()},
+        'byDepth': by_depth,
+        'children': {item['id']: item['children_ids'] for item in items if item.get('children_ids')}
+    }
+
+
+def build_shards(shard_path, header, items, trailer):
+    """
+    Write index.json and one shard per root item into shard_path
+
+    Each shard holds every descendant of its root item plus the root's
+    children_ids; the index holds the root items without children_ids.
+
+    Returns:
+        List of written file paths (index first)
+    """
+    if shard_path.exists():
+        shutil.rmtree(shard_path)
+    shard_path.mkdir(parents=True)
+
+    roots = [item for item in items if item['depth'] == 0]
+    descendants = {root['id']: [] for root in roots}
+    for item in items:
+        if item['depth'] > 0:
+            descendants[item['path_components'][0]].append(item)
+
+    paths = [shard_path / 'index.json']
+    shards = {}
+    for root in roots:
+        file_name = f"{root['id']}.json"
+        write_minified_json(shard_path / file_name, {
+            'root': root['id'],
+            'children_ids': root['children_ids'],
+            'items': descendants[root['id']]
+        })
+        shards[root['id']] = {'file': file_name, 'count': len(descendants[root['id']])}
+        paths.append(shard_path / file_name)
+
+    write_minified_json(paths[0], {
+        **header,
+        **trailer,
+        'maxDepth': max((item['depth'] for item in items), default=0),
+        'statistics': dimension_statistics(items),
+        'items': [{key: value for key, value in root.items() if key != 'children_ids'} for root in roots],
+        'shards': shards
+    })
+    return paths
+
+
+def build_dimension(name, file_name, source_path=SKILL_MIX_PATH, output_path=DOCS_DATA_PATH):
+    """Copy one dimension file into docs/ and write its sidecar (and shards)"""
+    source = Path(source_path) / file_name
+    output_path = Path(output_path)
+    shutil.copyfile(source, output_path / file_name)
+
+    with DimensionReader(source) as reader:
+        items = list(reader.iter_raw_items())
+        header, trailer = reader.header, reader.trailer
+
+    sidecar_path = output_path / (Path(file_name).stem + SIDECAR_SUFFIX)
+    write_minified_json(sidecar_path, build_sidecar(header, items, trailer))
+    paths = [sidecar_path]
+
+    if name in SHARDED_DIMENSIONS:
+        paths += build_shards(output_path / Path(file_name).stem, header, items, trailer)
+    return paths
+
+
+def build_hashed_artifacts(logical_paths, output_path=DOCS_DATA_PATH, skip_precache=()):
+    """
+    Publish minified, content-hashed copies of the given files
+
+    Args:
+        logical_paths: Files under output_path to publish
+        output_path: docs data directory (dist/ and manifest.json are written here)
+        skip_precache: Files the website does not fetch up front (marked precache: false)
+
+    Returns:
+        Manifest dictionary
+    """
+    output_path = Path(output_path)
+    dist_path = output_path / DIST_DIR
+    if dist_path.exists():
+        shutil.rmtree(dist_path)
+
+    files = {}
+    for path in logical_paths:
+        logical = path.relative_to(output_path).as_posix()
+        with open(path, encoding='utf-8') as f:
+            data = json.dumps(json.load(f), ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+        digest = hashlib.sha256(data).hexdigest()
+        hashed = Path(DIST_DIR) / Path(logical).parent / f"{Path(logical).stem}.{digest[:HASH_LENGTH]}.json"
+        (output_path / hashed).parent.mkdir(parents=True, exist_ok=True)
+        (output_path / hashed).write_bytes(data)
+
+        entry = {'path': hashed.as_posix(), 'hash': digest, 'size': len(data)}
+        if path in skip_precache:
+            entry['precache'] = False
+        files[logical] = entry
+
+    manifest = {'files': files}
+    with open(output_path / MANIFEST_FILE, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    return manifest
+
+
+def build_docs_data(source_path=SKILL_MIX_PATH, output_path=DOCS_DATA_PATH):
+    """Build website data for all eight dimensions"""
+    output_path = Path(output_path)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    paths, superseded = [], []
+    for name, file_name in DIMENSION_FILES.items():
+        written = build_dimension(name, file_name, source_path, output_path)
+        paths += [output_path / file_name] + written
+        if name in SHARDED_DIMENSIONS:
+            # The website reads the shard index and shards instead
+            superseded += [output_path / file_name, written[0]]
+
+    manifest = build_hashed_artifacts(paths, output_path, skip_precache=set(superseded))
+    return paths, manifest
+
+
+def main():
+    """Main execution function."""
+    print("Building website data...")
+    paths, manifest = build_docs_data()
+    for path in paths:
+        if path.parent == DOCS_DATA_PATH or path.name == 'index.json':
+            print(f"  {path.relative_to(DOCS_DATA_PATH)}: {path.stat().st_size:,} bytes")
+    print(f"  ({len(paths)} files written)")
+
+    entries = manifest['files'].values()
+    print(f"\nPublished {len(manifest['files'])} hashed files:")
+    print(f"  source:   {sum(path.stat().st_size for path in paths):,} bytes")
+    print(f"  minified: {sum(entry['size'] for entry in entries):,} bytes")
+    print(f"✓ Saved to {DOCS_DATA_PATH}")
+
+
+if __name__ == "__main__":
+    main()
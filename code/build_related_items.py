@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Build the "related items" neighbour tables for every dimension
+
+Writes one RelatedItemsIndex per dimension (related_items.py) to
+data/exports/related/<dimension>.npz: the top-k TF-IDF cosine neighbours of
+each item, computed in blocks of rows. Load a table with
+RelatedItemsIndex.load(path) and call related(item_id).
+
+Example:
+    python code/build_related_items.py --k 10 --show condition chapter-i/i21
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "clinical-skill-mix"))
+
+from dimension_io import DIMENSION_FILES, load_all_dimensions
+from related_items import DEFAULT_K, DEFAULT_BLOCK_SIZE, RelatedItemsIndex
+
+# Define paths
+BASE_PATH = Path(__file__).parent.parent
+EXPORT_PATH = BASE_PATH / "data" / "exports" / "related"
+
+
+def build_related_items(dimensions, output_path=EXPORT_PATH, k=DEFAULT_K, block_size=DEFAULT_BLOCK_SIZE):
+    """
+    Build and save the neighbour table of each dimension
+
+    Returns:
+        Dimension name -> RelatedItemsIndex
+    """
+    indexes = {}
+    for name, dimension in dimensions.items():
+        start = time.perf_counter()
+        indexes[name] = RelatedItemsIndex.build(dimension, k, block_size)
+        path = indexes[name].save(Path(output_path) / f"{name}.npz")
+        print(f"  {name}: {len(dimension.items):,} items, k={indexes[name].k} "
+              f"({time.perf_counter() - start:.2f}s) -> {path.name}")
+    return indexes
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--dimensions', nargs='+', default=list(DIMENSION_FILES), choices=list(DIMENSION_FILES))
+    parser.add_argument('--k', type=int, default=DEFAULT_K, help='Neighbours kept per item')
+    parser.add_argument('--block-size', type=int, default=DEFAULT_BLOCK_SIZE, help='Rows compared per block')
+    parser.add_argument('--output', type=Path, default=EXPORT_PATH)
+    parser.add_argument('--show', nargs=2, metavar=('DIMENSION', 'ITEM_ID'), help='Print the neighbours of one item')
+    args = parser.parse_args()
+
+    dimensions = load_all_dimensions()
+    if args.show:
+        name, item_id = args.show
+        if name not in args.dimensions:
+            parser.error(f"--show dimension {name} is not being built (--dimensions {' '.join(args.dimensions)})")
+        if not any(item.id == item_id for item in dimensions[name].items):
+            parser.error(f"--show item {item_id} not found in {name}")
+
+    print("Building related-item tables...")
+    indexes = build_related_items(
+        {name: dimensions[name] for name in args.dimensions}, args.output, args.k, args.block_size
+    )
+    print(f"✓ Saved to {args.output}")
+
+    if args.show:
+        name, item_id = args.show
+        items = {item.id: item for item in dimensions[name].items}
+        print(f"\nRelated to {item_id} ({items[item_id].name}):")
+        for neighbour_id, score in indexes[name].related(item_id):
+            print(f"  {score:.3f}  {neighbour_id:<24} {items[neighbour_id].name}")
+
+
+if __name__ == "__main__":
+    main()
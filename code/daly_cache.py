@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Columnar cache for the WHO DALY 2021 CSV
+
+The CSV is converted once into one .npy file per column, with text columns
+stored as categorical codes and numeric columns downcast where lossless.
+Rows are sorted by YEAR so each year is a contiguous slice, and columns are
+memory-mapped on load so analyses only touch the columns and years they use.
+"""
+
+import json
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+# Define paths
+BASE_PATH = Path(__file__).parent.parent
+DATA_PATH = BASE_PATH / "data"
+DALY_CSV = DATA_PATH / "WHO DALY 2021.csv"
+CACHE_PATH = DATA_PATH / "cache" / "who_daly_2021"
+
+CACHE_FORMAT_VERSION = 1
+YEAR_COLUMN = 'YEAR'
+
+
+def _source_signature(csv_path):
+    """Size and modification time used to detect a stale cache"""
+    stat = Path(csv_path).stat()
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def read_cache_meta(cache_path=CACHE_PATH):
+    """Read the cache metadata, or None if the cache has not been built"""
+    meta_path = Path(cache_path) / 'meta.json'
+    if not meta_path.exists():
+        return None
+    with open(meta_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _downcast_numeric(series):
+    """Downcast a numeric column to the smallest dtype that holds it exactly"""
+    if pd.api.types.is_integer_dtype(series):
+        return pd.to_numeric(series, downcast='integer')
+    if pd.api.types.is_float_dtype(series):
+        as_float32 = series.astype(np.float32)
+        if np.array_equal(as_float32.to_numpy(np.float64), series.to_numpy(np.float64), equal_nan=True):
+            return as_float32
+    return series
+
+
+def cache_is_fresh(csv_path=DALY_CSV, cache_path=CACHE_PATH):
+    """Check whether the cache exists and was built from the current CSV"""
+    meta = read_cache_meta(cache_path)
+    if meta is None or meta.get('format_version') != CACHE_FORMAT_VERSION:
+        return False
+    return meta.get('source') == _source_signature(csv_path)
+
+
+def build_daly_cache(csv_path=DALY_CSV, cache_path=CACHE_PATH, force=False):
+    """
+    Convert the WHO DALY CSV into the columnar cache
+
+    Args:
+        csv_path: Source CSV file
+        cache_path: Directory receiving one .npy file per column plus meta.json
+        force: Rebuild even if the cache is up to date
+
+    Returns:
+        Path to the cache directory
+    """
+    cache_path = Path(cache_path)
+    if not force and cache_is_fresh(csv_path, cache_path):
+        return cache_path
+
+    df = pd.read_csv(csv_path)
+    df = df.sort_values(YEAR_COLUMN, kind='stable').reset_index(drop=True)
+
+    cache_path.mkdir(parents=True, exist_ok=True)
+    columns = {}
+
+    for column in df.columns:
+        series = df[column]
+        if pd.api.types.is_numeric_dtype(series):
+            series = _downcast_numeric(series)
+            values = series.to_numpy()
+            columns[column] = {'kind': 'numeric', 'dtype': values.dtype.str}
+        else:
+            categorical = series.astype('category')
+            values = categorical.cat.codes.to_numpy()
+            columns[column] = {
+                'kind': 'categorical',
+                'dtype': values.dtype.str,
+                'categories': [str(c) for c in categorical.cat.categories]
+            }
+        np.save(cache_path / f"{column}.npy", values, allow_pickle=False)
+
+    # Rows are sorted by year, so each year maps to a contiguous [start, stop) slice
+    years = df[YEAR_COLUMN].to_numpy()
+    unique_years, starts = np.unique(years, return_index=True)
+    stops = list(starts[1:]) + [len(years)]
+    year_slices = {
+        str(int(year)): [int(start), int(stop)]
+        for year, start, stop in zip(unique_years, starts, stops)
+    }
+
+    meta = {
+        'format_version': CACHE_FORMAT_VERSION,
+        'source': _source_signature(csv_path),
+        'row_count': len(df),
+        'columns': columns,
+        'year_slices': year_slices
+    }
+    with open(cache_path / 'meta.json', 'w', encoding='utf-8') as f:
+        json.dump(meta, f, indent=2)
+
+    return cache_path
+
+
+def load_daly_frame(columns=None, years=None, csv_path=DALY_CSV, cache_path=CACHE_PATH):
+    """
+    Load DALY records from the columnar cache, building it on first use
+
+    Args:
+        columns: Column names to load (default: all columns)
+        years: Years to load (default: all years)
+        csv_path: Source CSV file, used to build or refresh the cache
+        cache_path: Cache directory
+
+    Returns:
+        DataFrame with categorical text columns and downcast numeric columns
+    """
+    cache_path = Path(cache_path)
+    if Path(csv_path).exists():
+        build_daly_cache(csv_path, cache_path)
+
+    meta = read_cache_meta(cache_path)
+    if meta is None:
+        raise FileNotFoundError(f"No DALY cache at {cache_path} and no source CSV at {csv_path}")
+
+    if columns is None:
+        columns = list(meta['columns'])
+    unknown = [c for c in columns if c not in meta['columns']]
+    if unknown:
+        raise KeyError(f"Columns not in DALY cache: {unknown}")
+
+    if years is None:
+        slices = [slice(0, meta['row_count'])]
+    else:
+        slices = [
+            slice(*meta['year_slices'][str(int(year))])
+            for year in sorted(set(years))
+            if str(int(year)) in meta['year_slices']
+        ]
+
+    data = {}
+    for column in columns:
+        info = meta['columns'][column]
+        mapped = np.load(cache_path / f"{column}.npy", mmap_mode='r', allow_pickle=False)
+        if slices:
+            values = np.concatenate([mapped[s] for s in slices])
+        else:
+            values = np.empty(0, dtype=mapped.dtype)
+
+        if info['kind'] == 'categorical':
+            data[column] = pd.Categorical.from_codes(values, categories=info['categories'])
+        else:
+            data[column] = values
+
+    return pd.DataFrame(data, columns=columns)
+
+
+if __name__ == "__main__":
+    print(f"Building DALY cache from {DALY_CSV}...")
+    path = build_daly_cache(force=True)
+    meta = read_cache_meta(path)
+    print(f"Cached {meta['row_count']} records, {len(meta['columns'])} columns")
+    print(f"Years: {', '.join(meta['year_slices'])}")
+    print(f"Saved to {path}")
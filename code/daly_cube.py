@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Precomputed WHO DALY aggregate cube
+
+Sums DALY, deaths and population once into a dense array over
+year × country × cause × sex, so burden for any subset of years, countries
+or sexes can be sliced out with rates, ranks and DALY_CATEGORY tiers
+without rerunning pandas groupbys.
+"""
+
+import json
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+from daly_cache import CACHE_PATH, DALY_CSV, build_daly_cache, load_daly_frame, read_cache_meta
+
+# Define paths
+CUBE_PATH = CACHE_PATH.parent / "who_daly_2021_cube.npz"
+
+METRICS = ['DALY', 'DEATHS', 'POPULATION', 'RECORDS']
+CAUSE_COLUMNS = ['GHE_CAUSE_CODE', 'GHE_CAUSE_TITLE', 'GHE_CAUSE_TYPE']
+SEX_COLUMN = 'SEX'
+ALL_SEXES = 'all'
+# Label for records with a missing country or sex: kept in their own slot so global sums stay complete
+UNKNOWN_LABEL = '<unknown>'
+
+# Rank cut-offs shared with analyze_daly_data
+DALY_CATEGORY_BINS = [0, 10, 30, 50, float('inf')]
+DALY_CATEGORY_LABELS = ['very-high', 'high', 'moderate', 'low']
+
+
+class DalyCube:
+    """Dense year × country × cause × sex × metric array with labelled axes"""
+
+    def __init__(self, values, years, countries, causes, sexes, source=None):
+        self.values = values
+        self.years = list(years)
+        self.countries = list(countries)
+        self.causes = causes.reset_index(drop=True)
+        self.sexes = list(sexes)
+        self.source = source
+
+        self._year_index = {year: i for i, year in enumerate(self.years)}
+        self._country_index = {country: i for i, country in enumerate(self.countries)}
+        self._cause_index = {code: i for i, code in enumerate(self.causes['GHE_CAUSE_CODE'])}
+        self._sex_index = {sex: i for i, sex in enumerate(self.sexes)}
+
+    @classmethod
+    def from_frame(cls, df, source=None):
+        """Aggregate DALY records into a cube with one bincount per metric"""
+        years, year_idx = np.unique(df['YEAR'].to_numpy(), return_inverse=True)
+        country_idx, countries = pd.factorize(df['COUNTRY'].astype(object).fillna(UNKNOWN_LABEL), sort=True)
+
+        cause_keys = df[CAUSE_COLUMNS].astype(object)
+        cause_idx = cause_keys.groupby(CAUSE_COLUMNS, sort=True, dropna=False).ngroup().to_numpy()
+        causes = cause_keys.drop_duplicates().sort_values(CAUSE_COLUMNS)
+
+        if SEX_COLUMN in df.columns:
+            sex_idx, sexes = pd.factorize(df[SEX_COLUMN].astype(object).fillna(UNKNOWN_LABEL), sort=True)
+        else:
+            sex_idx, sexes = np.zeros(len(df), dtype=np.intp), [ALL_SEXES]
+
+        shape = (len(years), len(countries), len(causes), len(sexes))
+        flat = np.ravel_multi_index((year_idx, country_idx, cause_idx, sex_idx), shape)
+        size = int(np.prod(shape))
+
+        values = np.empty(shape + (len(METRICS),), dtype=np.float64)
+        for m, metric in enumerate(METRICS):
+            weights = None if metric == 'RECORDS' else df[metric].to_numpy(np.float64)
+            values[..., m] = np.bincount(flat, weights=weights, minlength=size).reshape(shape)
+
+        return cls(values, years.tolist(), list(countries), causes, list(sexes), source=source)
+
+    def save(self, path=CUBE_PATH):
+        """Persist the cube and its axis labels to a single .npz file"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        labels = {
+            'years': [int(y) for y in self.years],
+            'countries': [str(c) for c in self.countries],
+            'causes': self.causes.to_dict(orient='list'),
+            'sexes': [str(s) for s in self.sexes],
+            'source': self.source
+        }
+        np.savez(path, values=self.values, labels=np.array(json.dumps(labels, default=str)))
+        return path
+
+    @classmethod
+    def load(cls, path=CUBE_PATH):
+        """Load a cube saved with save()"""
+        with np.load(path, allow_pickle=False) as data:
+            values = data['values']
+            labels = json.loads(str(data['labels']))
+        return cls(
+            values, labels['years'], labels['countries'],
+            pd.DataFrame(labels['causes']), labels['sexes'], source=labels['source']
+        )
+
+    def _axis_indices(self, index, labels, axis_name):
+        if labels is None:
+            return slice(None)
+        missing = [label for label in labels if label not in index]
+        if missing:
+            raise KeyError(f"Unknown {axis_name} values: {missing}")
+        return np.array([index[label] for label in labels], dtype=np.intp)
+
+    def totals(self, years=None, countries=None, causes=None, sexes=None):
+        """Metric totals for a subset, summed over year, country and sex (shape: cause × metric)"""
+        block = self.values
+        for axis, (index, labels, name) in enumerate([
+            (self._year_index, years, 'year'),
+            (self._country_index, countries, 'country'),
+            (self._cause_index, causes, 'cause'),
+            (self._sex_index, sexes, 'sex'),
+        ]):
+            selector = self._axis_indices(index, labels, name)
+            if not isinstance(selector, slice):
+                block = np.take(block, selector, axis=axis)
+        return block.sum(axis=(0, 1, 3))
+
+    def select(self, years=None, countries=None, causes=None, sexes=None):
+        """
+        Burden table for any subset of the cube
+
+        Args:
+            years: Years to include (default: all)
+            countries: Countries to include (default: all)
+            causes: GHE cause codes to include (default: all)
+            sexes: Sexes to include (default: all)
+
+        Returns:
+            DataFrame with one row per cause present in the subset, sorted by
+            DALY, with per-100k rates, GLOBAL_RANK and DALY_CATEGORY tiers
+        """
+        totals = self.totals(years, countries, causes, sexes)
+
+        cause_rows = self.causes
+        if causes is not None:
+            cause_rows = cause_rows.iloc[[self._cause_index[c] for c in causes]]
+
+        result = cause_rows.reset_index(drop=True).copy()
+        for m, metric in enumerate(METRICS):
+            result[metric] = totals[:, m]
+
+        # Causes without any records in the subset are dropped, as a groupby would
+        result = result[result['RECORDS'] > 0].drop(columns='RECORDS')
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result['DALY_PER_100K'] = (result['DALY'] / result['POPULATION']) * 100000
+            result['DEATHS_PER_100K'] = (result['DEATHS'] / result['POPULATION']) * 100000
+
+        result = result.sort_values('DALY', ascending=False)
+        result['GLOBAL_RANK'] = range(1, len(result) + 1)
+        result['DALY_CATEGORY'] = pd.cut(
+            result['GLOBAL_RANK'],
+            bins=DALY_CATEGORY_BINS,
+            labels=DALY_CATEGORY_LABELS
+        )
+        return result
+
+
+def load_daly_cube(cube_path=CUBE_PATH, csv_path=DALY_CSV, cache_path=CACHE_PATH):
+    """Load the DALY cube, rebuilding it when the columnar cache has changed"""
+    cube_path = Path(cube_path)
+    if Path(csv_path).exists():
+        build_daly_cache(csv_path, cache_path)
+    meta = read_cache_meta(cache_path)
+    source = meta['source'] if meta else None
+
+    if cube_path.exists():
+        cube = DalyCube.load(cube_path)
+        if source is None or cube.source == source:
+            return cube
+
+    columns = ['YEAR', 'COUNTRY'] + CAUSE_COLUMNS + METRICS[:3]
+    if meta and SEX_COLUMN in meta['columns']:
+        columns.append(SEX_COLUMN)
+    df = load_daly_frame(columns=columns, csv_path=csv_path, cache_path=cache_path)
+
+    cube = DalyCube.from_frame(df, source=source)
+    cube.save(cube_path)
+    return cube
+
+
+if __name__ == "__main__":
+    print("Building DALY aggregate cube...")
+    cube = load_daly_cube()
+    print(f"Cube shape (year × country × cause × sex × metric): {cube.values.shape}")
+    print(f"Saved to {CUBE_PATH}")
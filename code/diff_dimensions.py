@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Diff two versions of the Clinical Skill-Mix dimensions
+
+Compares dimension JSON files by Merkle hash (dimension_merkle.py): files
+whose root hashes match are reported unchanged without an item walk, and
+otherwise only changed subtrees are visited to list added, removed,
+modified and moved items, and parents whose children were reordered.
+Defaults to checking the docs/ copy against clinical-skill-mix/, e.g.
+after rerunning a generator.
+
+Example:
+    python code/diff_dimensions.py
+    python code/diff_dimensions.py --old /tmp/conditions.json --new clinical-skill-mix/conditions.json --json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "clinical-skill-mix"))
+
+from dimension_io import DIMENSION_FILES
+from dimension_merkle import diff_dimension_files
+
+# Define paths
+BASE_PATH = Path(__file__).parent.parent
+SKILL_MIX_PATH = BASE_PATH / "clinical-skill-mix"
+DOCS_SKILL_MIX_PATH = BASE_PATH / "docs" / "clinical-skill-mix"
+
+# Items listed per change type before truncating
+SHOW_LIMIT = 10
+
+
+def file_pairs(old, new):
+    """(name, old file, new file) for two files or two directories of dimension files"""
+    if old.is_file() or new.is_file():
+        return [(new.stem, old, new)]
+    return [(name, old / filename, new / filename) for name, filename in DIMENSION_FILES.items()]
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--old', type=Path, default=DOCS_SKILL_MIX_PATH, help='Old dimension file or directory')
+    parser.add_argument('--new', type=Path, default=SKILL_MIX_PATH, help='New dimension file or directory')
+    parser.add_argument('--json', action='store_true', help='Print full diffs as JSON')
+    args = parser.parse_args()
+
+    diffs = {}
+    for name, old_path, new_path in file_pairs(args.old, args.new):
+        if not old_path.exists() or not new_path.exists():
+            print(f"  {name}: missing {old_path if not old_path.exists() else new_path}", file=sys.stderr)
+            continue
+        diffs[name] = diff_dimension_files(old_path, new_path)
+
+    if args.json:
+        print(json.dumps({name: diff.to_dict() for name, diff in diffs.items()}, indent=2, ensure_ascii=False))
+        return
+
+    for name, diff in diffs.items():
+        if not diff:
+            print(f"  {name}: unchanged")
+            continue
+        counts = ', '.join(f"{count} {kind}" for kind, count in diff.summary().items()
+                           if kind != 'header_changed' and count)
+        print(f"  {name}: {counts or 'no item changes'}{' (header changed)' if diff.header_changed else ''}")
+        for kind in ('added', 'removed', 'modified'):
+            ids = getattr(diff, kind)
+            for item_id in ids[:SHOW_LIMIT]:
+                print(f"    {kind[0].upper()} {item_id}")
+            if len(ids) > SHOW_LIMIT:
+                print(f"    ... {len(ids) - SHOW_LIMIT} more {kind}")
+        for move in diff.moved[:SHOW_LIMIT]:
+            print(f"    > {move['from']} -> {move['to']} ({move['old_parent']} -> {move['new_parent']})")
+        if len(diff.moved) > SHOW_LIMIT:
+            print(f"    ... {len(diff.moved) - SHOW_LIMIT} more moved")
+        for parent_id in diff.reordered[:SHOW_LIMIT]:
+            print(f"    ~ {parent_id or '(top level)'} children reordered")
+        if len(diff.reordered) > SHOW_LIMIT:
+            print(f"    ... {len(diff.reordered) - SHOW_LIMIT} more reordered")
+
+    changed = [name for name, diff in diffs.items() if diff]
+    print(f"{'✗' if changed else '✓'} {len(changed)} of {len(diffs)} dimensions changed")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,16 +3,10 @@
 Explore WHO DALY data structure
 """
 
-import pandas as pd
-from pathlib import Path
+from daly_cache import load_daly_frame
 
-# Define paths
-BASE_PATH = Path(__file__).parent.parent
-DATA_PATH = BASE_PATH / "data"
-
-# Load data
-csv_path = DATA_PATH / "WHO DALY 2021.csv"
-df = pd.read_csv(csv_path)
+# Load data from the columnar cache (built from the CSV on first use)
+df = load_daly_frame()
 
 print("Column Info:")
 print(df.info())
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Export Clinical Skill-Mix Cube cells to partitioned Parquet or Arrow IPC files
+
+Cells are the Cartesian product of the items selected for each dimension
+(same specs as multiply_dimensions_flexible_depth). They are enumerated in
+vectorized batches by mixed-radix rank instead of materializing dicts, and
+each dimension column is stored dictionary-encoded: a small integer index
+per row into the dimension's item IDs. Files are partitioned Hive-style by
+the ancestor of one chosen dimension (e.g. the condition chapter).
+
+Requires pyarrow in addition to numpy.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from urllib.parse import quote
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "clinical-skill-mix"))
+
+from skill_mix_dimensions_model import DimensionType, select_dimension_items
+from dimension_io import DIMENSION_FILES, load_all_dimensions
+
+# Define paths
+BASE_PATH = Path(__file__).parent.parent
+EXPORT_PATH = BASE_PATH / "data" / "exports" / "cube_cells"
+
+# Rows per written batch / row group
+DEFAULT_BATCH_SIZE = 1_000_000
+
+# Clinical Competency (5C) dimensions, exported by default
+DEFAULT_DIMENSIONS = list(DIMENSION_FILES)[:5]
+
+FILE_EXTENSIONS = {'parquet': 'parquet', 'arrow': 'arrow'}
+
+
+def dictionary_index_type(size):
+    """Smallest signed integer Arrow/NumPy type able to index `size` dictionary entries"""
+    for arrow_type, numpy_type in [
+        (pa.int8(), np.int8),
+        (pa.int16(), np.int16),
+        (pa.int32(), np.int32),
+    ]:
+        if size <= np.iinfo(numpy_type).max + 1:
+            return arrow_type, numpy_type
+    return pa.int64(), np.int64
+
+
+def partition_groups(items, partition_depth):
+    """
+    Group item positions by their ancestor at the partition depth
+
+    Returns:
+        Dict of partition key -> array of positions into `items`, in first-seen order
+    """
+    groups = {}
+    for position, item in enumerate(items):
+        key = item.get_ancestor_at_depth(partition_depth) or item.id
+        groups.setdefault(key, []).append(position)
+    return {key: np.array(positions, dtype=np.int64) for key, positions in groups.items()}
+
+
+def iter_cell_index_batches(radices, batch_size):
+    """
+    Yield per-dimension item index arrays for cells in row-major rank order
+
+    Args:
+        radices: Number of items per dimension (last dimension varies fastest)
+        batch_size: Maximum cells per batch
+    """
+    total = int(np.prod(radices, dtype=np.int64)) if radices else 0
+    for start in range(0, total, batch_size):
+        ranks = np.arange(start, min(start + batch_size, total), dtype=np.int64)
+        digits = [None] * len(radices)
+        for d in range(len(radices) - 1, -1, -1):
+            ranks, digits[d] = np.divmod(ranks, radices[d])
+        yield digits
+
+
+class _PartitionWriter:
+    """Write record batches to one Parquet or Arrow IPC file"""
+
+    def __init__(self, path, schema, file_format, compression):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.file_format = file_format
+        if file_format == 'parquet':
+            self._writer = pq.ParquetWriter(path, schema, compression=compression, use_dictionary=True)
+        else:
+            self._sink = pa.OSFile(str(path), 'wb')
+            options = pa.ipc.IpcWriteOptions(compression=compression if compression != 'none' else None)
+            self._writer = pa.ipc.new_file(self._sink, schema, options=options)
+
+    def write(self, batch):
+        if self.file_format == 'parquet':
+            self._writer.write_table(pa.Table.from_batches([batch]))
+        else:
+            self._writer.write_batch(batch)
+
+    def close(self):
+        self._writer.close()
+        if self.file_format != 'parquet':
+            self._sink.close()
+
+
+def export_cube_cells(
+    dimension_specs,
+    output_path=EXPORT_PATH,
+    partition_by=None,
+    partition_depth=0,
+    file_format='parquet',
+    batch_size=DEFAULT_BATCH_SIZE,
+    compression='zstd'
+):
+    """
+    Export cube cells to partitioned, dictionary-encoded columnar files
+
+    Args:
+        dimension_specs: Specs as accepted by multiply_dimensions_flexible_depth
+        output_path: Output directory (one subdirectory per partition)
+        partition_by: Dimension name to partition on (None: single partition)
+        partition_depth: Depth of the partition dimension's ancestor used as key
+        file_format: 'parquet' or 'arrow' (Arrow IPC file)
+        batch_size: Cells per record batch
+        compression: Codec for Parquet pages, or 'zstd'/'lz4' for Arrow IPC ('none' to disable)
+
+    Returns:
+        Manifest dictionary (also written to _manifest.json)
+    """
+    if file_format not in FILE_EXTENSIONS:
+        raise ValueError(f"Unsupported format: {file_format}")
+
+    output_path = Path(output_path)
+    names = [spec['dimension'].dimension.value for spec in dimension_specs]
+    items = [select_dimension_items(spec) for spec in dimension_specs]
+
+    # Item IDs become the shared dictionary of each column, so codes agree across partitions
+    fields, dictionaries, index_dtypes = [], [], []
+    for name, dimension_items in zip(names, items):
+        arrow_type, numpy_type = dictionary_index_type(len(dimension_items))
+        fields.append(pa.field(name, pa.dictionary(arrow_type, pa.string())))
+        dictionaries.append(pa.array([item.id for item in dimension_items], type=pa.string()))
+        index_dtypes.append(numpy_type)
+    schema = pa.schema(fields)
+
+    if partition_by is None:
+        partition_field = None
+        groups = {None: None}
+    else:
+        if partition_by not in names:
+            raise ValueError(f"Partition dimension {partition_by} is not among the exported dimensions")
+        partition_index = names.index(partition_by)
+        partition_field = f"{partition_by}_level{partition_depth}"
+        groups = partition_groups(items[partition_index], partition_depth)
+
+    manifest = {
+        'format': file_format,
+        'dimensions': [
+            {'name': name, 'depth': spec.get('depth', spec['dimension'].hierarchy.max_depth), 'item_count': len(dimension_items)}
+            for name, spec, dimension_items in zip(names, dimension_specs, items)
+        ],
+        'partition_field': partition_field,
+        'partitions': [],
+        'total_rows': 0
+    }
+
+    for key, positions in groups.items():
+        radices = [len(dimension_items) for dimension_items in items]
+        if key is not None:
+            radices[partition_index] = len(positions)
+
+        relative_path = Path(f"part-0.{FILE_EXTENSIONS[file_format]}")
+        if key is not None:
+            relative_path = Path(f"{partition_field}={quote(key, safe='')}") / relative_path
+
+        writer = None
+        rows = 0
+        for digits in iter_cell_index_batches(radices, batch_size):
+            if key is not None:
+                digits[partition_index] = positions[digits[partition_index]]
+            columns = [
+                pa.DictionaryArray.from_arrays(pa.array(digit.astype(dtype, copy=False)), dictionary)
+                for digit, dtype, dictionary in zip(digits, index_dtypes, dictionaries)
+            ]
+            batch = pa.RecordBatch.from_arrays(columns, schema=schema)
+            if writer is None:
+                writer = _PartitionWriter(output_path / relative_path, schema, file_format, compression)
+            writer.write(batch)
+            rows += batch.num_rows
+
+        if writer is not None:
+            writer.close()
+            manifest['partitions'].append({'key': key, 'path': relative_path.as_posix(), 'rows': rows})
+            manifest['total_rows'] += rows
+
+    output_path.mkdir(parents=True, exist_ok=True)
+    with open(output_path / '_manifest.json', 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+
+    return manifest
+
+
+def parse_depths(pairs):
+    """Parse NAME=DEPTH command-line pairs"""
+    depths = {}
+    for pair in pairs:
+        name, _, depth = pair.partition('=')
+        depths[name] = int(depth)
+    return depths
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--dimensions', nargs='+', default=DEFAULT_DIMENSIONS, choices=list(DIMENSION_FILES),
+                        help='Dimensions to multiply (default: the five 5C dimensions)')
+    parser.add_argument('--depth', nargs='*', default=[], metavar='NAME=DEPTH',
+                        help='Depth per dimension (default: each dimension\'s max depth)')
+    parser.add_argument('--partition-by', default=DimensionType.CONDITION.value, help='Dimension to partition files by')
+    parser.add_argument('--partition-depth', type=int, default=0, help='Ancestor depth used as partition key')
+    parser.add_argument('--format', choices=list(FILE_EXTENSIONS), default='parquet')
+    parser.add_argument('--compression', default='zstd')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument('--output', type=Path, default=EXPORT_PATH)
+    args = parser.parse_args()
+
+    dimensions = load_all_dimensions()
+    depths = parse_depths(args.depth)
+    specs = []
+    for name in args.dimensions:
+        spec = {'dimension': dimensions[name]}
+        if name in depths:
+            spec['depth'] = depths[name]
+        specs.append(spec)
+
+    partition_by = args.partition_by if args.partition_by in args.dimensions else None
+
+    print(f"Exporting cube cells for: {', '.join(args.dimensions)}")
+    manifest = export_cube_cells(
+        specs,
+        output_path=args.output,
+        partition_by=partition_by,
+        partition_depth=args.partition_depth,
+        file_format=args.format,
+        batch_size=args.batch_size,
+        compression=args.compression
+    )
+
+    print(f"✓ Wrote {manifest['total_rows']:,} cells in {len(manifest['partitions'])} partitions")
+    print(f"✓ Saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Export the Clinical Intelligence dimensions to a SQLite star schema
+
+Each dimension gets:
+  dim_<name>      one row per item (integer item_key, id, parent, depth, JSON fields)
+  closure_<name>  ancestor/descendant pairs (including each item with itself)
+  meta_<name>     one row per item metadata key, for indexed metadata lookups
+with indexes on depth, parent and metadata keys. An optional cell_facts
+table, keyed by cell_id (the packed 64-bit id from cell_ids.py, stable when
+items are reordered), holds per-cell annotations with one item_key column
+per dimension and the cell's current CellSpace rank.
+
+Hierarchical roll-ups then become indexed joins, e.g. facts for any
+condition under chapter-i in the ICU:
+
+    SELECT f.*
+    FROM cell_facts f
+    JOIN closure_condition cc ON cc.descendant_key = f.condition_key
+    JOIN dim_condition a ON a.item_key = cc.ancestor_key AND a.id = 'chapter-i'
+    JOIN dim_care_setting s ON s.item_key = f.care_setting_key AND s.id = 'intensive-care-units';
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "clinical-skill-mix"))
+
+from dimension_io import model_to_dict, load_all_dimensions
+from cell_space import CellSpace
+from cell_ids import load_codec
+
+# Define paths
+BASE_PATH = Path(__file__).parent.parent
+EXPORT_PATH = BASE_PATH / "data" / "exports" / "clinical_world_model.sqlite"
+
+FACT_TABLE = 'cell_facts'
+
+
+def _json(value):
+    return json.dumps(value, ensure_ascii=False, sort_keys=True)
+
+
+def _metadata_value(value):
+    """Store scalar metadata as-is and everything else as JSON text"""
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    return _json(value)
+
+
+def create_dimension_tables(conn, name):
+    """Create the item, closure and metadata tables of one dimension"""
+    conn.executescript(f"""
+        CREATE TABLE dim_{name} (
+            item_key INTEGER PRIMARY KEY,
+            id TEXT NOT NULL UNIQUE,
+            parent_id TEXT,
+            parent_key INTEGER REFERENCES dim_{name}(item_key),
+            depth INTEGER NOT NULL,
+            name TEXT NOT NULL,
+            description TEXT,
+            children_count INTEGER NOT NULL,
+            axis_position INTEGER,
+            level_info TEXT,
+            metadata TEXT
+        );
+        CREATE INDEX idx_dim_{name}_depth ON dim_{name}(depth);
+        CREATE INDEX idx_dim_{name}_parent ON dim_{name}(parent_key);
+
+        CREATE TABLE closure_{name} (
+            ancestor_key INTEGER NOT NULL REFERENCES dim_{name}(item_key),
+            descendant_key INTEGER NOT NULL REFERENCES dim_{name}(item_key),
+            distance INTEGER NOT NULL,
+            PRIMARY KEY (ancestor_key, descendant_key)
+        ) WITHOUT ROWID;
+        CREATE INDEX idx_closure_{name}_descendant ON closure_{name}(descendant_key, distance);
+
+        CREATE TABLE meta_{name} (
+            item_key INTEGER NOT NULL REFERENCES dim_{name}(item_key),
+            key TEXT NOT NULL,
+            value,
+            PRIMARY KEY (item_key, key)
+        ) WITHOUT ROWID;
+        CREATE INDEX idx_meta_{name}_key ON meta_{name}(key, value);
+    """)
+
+
+def load_dimension_rows(conn, name, dimension, axis_positions=None):
+    """
+    Insert one dimension's items, closure pairs and metadata rows
+
+    Args:
+        conn: Open SQLite connection
+        name: Dimension name (table suffix)
+        dimension: SkillMixDimension to load
+        axis_positions: Item ID -> position on the dimension's cell axis
+
+    Returns:
+        Number of items loaded
+    """
+    axis_positions = axis_positions or {}
+    keys = {item.id: key for key, item in enumerate(dimension.items)}
+
+    conn.executemany(
+        f"INSERT INTO dim_{name} VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            (
+                keys[item.id], item.id, item.parent_id, keys.get(item.parent_id),
+                item.depth, item.name, item.description, len(item.children_ids),
+                axis_positions.get(item.id),
+                _json({str(level): info for level, info in item.level_info.items()}),
+                _json(item.metadata)
+            )
+            for item in dimension.items
+        )
+    )
+
+    # Ancestors follow from the path-based IDs: one prefix per depth
+    def closure_rows():
+        for item in dimension.items:
+            key = keys[item.id]
+            for depth in range(item.depth + 1):
+                ancestor_id = '/'.join(item.path_components[:depth + 1])
+                if ancestor_id in keys:
+                    yield keys[ancestor_id], key, item.depth - depth
+
+    conn.executemany(f"INSERT INTO closure_{name} VALUES (?, ?, ?)", closure_rows())
+
+    conn.executemany(
+        f"INSERT INTO meta_{name} VALUES (?, ?, ?)",
+        (
+            (keys[item.id], key, _metadata_value(value))
+            for item in dimension.items
+            for key, value in item.metadata.items()
+        )
+    )
+    return len(keys)
+
+
+def create_fact_table(conn, space):
+    """Create the per-cell annotation table over the cell space's axes"""
+    key_columns = ',\n'.join(
+        f"            {name}_key INTEGER NOT NULL REFERENCES dim_{name}(item_key)" for name in space.names
+    )
+    indexes = '\n'.join(
+        f"        CREATE INDEX idx_{FACT_TABLE}_{name} ON {FACT_TABLE}({name}_key);" for name in space.names
+    )
+    conn.executescript(f"""
+        CREATE TABLE {FACT_TABLE} (
+            cell_id INTEGER PRIMARY KEY,
+            rank INTEGER NOT NULL,
+{key_columns},
+            annotation TEXT
+        );
+{indexes}
+    """)
+
+
+def add_cell_annotations(conn, space, annotations, codec=None):
+    """
+    Insert or replace per-cell annotations
+
+    Args:
+        conn: SQLite connection holding the exported schema
+        space: CellSpace the cells' ranks are taken in
+        annotations: Iterable of (cell, annotation) pairs, where cell is
+            {dimension: item_id} and annotation is any JSON-serializable value
+        codec: CellIdCodec for the packed cell IDs (default: latest in cell_ids.json)
+
+    Returns:
+        Number of annotations written
+    """
+    codec = codec or load_codec()
+    item_keys = {
+        name: dict(conn.execute(f"SELECT id, item_key FROM dim_{name}"))
+        for name in space.names
+    }
+    columns = ', '.join(f"{name}_key" for name in space.names)
+    placeholders = ', '.join('?' * (len(space.names) + 3))
+
+    rows = []
+    for cell, annotation in annotations:
+        item_ids = [cell[name] for name in space.names]
+        rows.append((
+            space.rank(item_ids),
+            *(item_keys[name][item_id] for name, item_id in zip(space.names, item_ids)),
+            _json(annotation)
+        ))
+    cell_ids = codec.encode_ranks(space, np.array([row[0] for row in rows], dtype=np.int64)).tolist()
+
+    conn.executemany(
+        f"INSERT OR REPLACE INTO {FACT_TABLE} (cell_id, rank, {columns}, annotation) VALUES ({placeholders})",
+        ((cell_id, *row) for cell_id, row in zip(cell_ids, rows))
+    )
+    return len(rows)
+
+
+def export_sqlite(output_path=EXPORT_PATH, with_facts=False, dimensions=None):
+    """
+    Build the SQLite database from the dimension JSON files
+
+    Args:
+        output_path: Database file to (re)create
+        with_facts: Also create the empty cell_facts table
+        dimensions: Loaded dimensions (default: load_all_dimensions())
+
+    Returns:
+        Dict of table name -> row count
+    """
+    dimensions = dimensions or load_all_dimensions()
+    space = CellSpace.from_dimensions(dimensions)
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    if output_path.exists():
+        output_path.unlink()
+
+    conn = sqlite3.connect(output_path)
+    try:
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.execute("""
+            CREATE TABLE dimensions (
+                name TEXT PRIMARY KEY,
+                dimension_type TEXT NOT NULL,
+                description TEXT,
+                max_depth INTEGER,
+                levels TEXT,
+                item_count INTEGER NOT NULL,
+                axis_size INTEGER,
+                axis_stride INTEGER
+            )
+        """)
+
+        with conn:
+            for name, dimension in dimensions.items():
+                axis = space.names.index(name) if name in space.names else None
+                axis_positions = space.positions[axis] if axis is not None else None
+
+                create_dimension_tables(conn, name)
+                item_count = load_dimension_rows(conn, name, dimension, axis_positions)
+                conn.execute(
+                    "INSERT INTO dimensions VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        name, dimension.dimension.value, dimension.description,
+                        dimension.hierarchy.max_depth,
+                        _json(model_to_dict(dimension.hierarchy).get('levels')),
+                        item_count,
+                        space.radices[axis] if axis is not None else None,
+                        space.strides[axis] if axis is not None else None
+                    )
+                )
+
+            if with_facts:
+                create_fact_table(conn, space)
+
+        conn.execute("ANALYZE")
+
+        tables = [row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%' ORDER BY name"
+        )]
+        return {table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] for table in tables}
+    finally:
+        conn.close()
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--output', type=Path, default=EXPORT_PATH)
+    parser.add_argument('--with-facts', action='store_true', help='Create the per-cell annotation table')
+    args = parser.parse_args()
+
+    print("Loading dimensions into SQLite...")
+    counts = export_sqlite(args.output, with_facts=args.with_facts)
+
+    for table, count in counts.items():
+        print(f"  {table}: {count:,} rows")
+    print(f"✓ Saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,6 @@ Generate agent_facing.json for the AI Cognitive Engagement Cube (3A)
 Agent Facing defines whose cognition AI engages (provider/patient/encounter/ecosystem)
 """
 
-import json
 from pathlib import Path
 import sys
 
@@ -14,6 +13,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "clinical-skill-mix"))
 from skill_mix_dimensions_model import (
     SkillMixDimension, DimensionItem, ReferenceInfo, HierarchyInfo, DimensionType
 )
+from dimension_io import write_dimension
 
 # Define paths
 BASE_PATH = Path(__file__).parent.parent
@@ -138,8 +138,7 @@ def save_dimension(dimension):
     """Save the agent facing dimension to JSON file"""
     output_path = SKILL_MIX_PATH / 'agent_facing.json'
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(dimension.dict(), f, indent=2, ensure_ascii=False)
+    write_dimension(dimension, output_path)
 
     print(f"✓ Generated agent_facing.json with {len(dimension.items)} agent types")
     print(f"✓ Saved to {output_path}")
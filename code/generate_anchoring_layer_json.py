@@ -4,7 +4,6 @@ Generate anchoring_layer.json for the AI Cognitive Engagement Cube (3A)
 Anchoring Layer specifies the point in cognitive architecture where AI intervenes
 """
 
-import json
 from pathlib import Path
 import sys
 
@@ -14,6 +13,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "clinical-skill-mix"))
 from skill_mix_dimensions_model import (
     SkillMixDimension, DimensionItem, ReferenceInfo, HierarchyInfo, DimensionType
 )
+from dimension_io import write_dimension
 
 # Define paths
 BASE_PATH = Path(__file__).parent.parent
@@ -177,8 +177,7 @@ def save_dimension(dimension):
     """Save the anchoring layer dimension to JSON file"""
     output_path = SKILL_MIX_PATH / 'anchoring_layer.json'
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(dimension.dict(), f, indent=2, ensure_ascii=False)
+    write_dimension(dimension, output_path)
 
     print(f"✓ Generated anchoring_layer.json with {len(dimension.items)} cognitive layers")
     print(f"✓ Saved to {output_path}")
@@ -4,7 +4,6 @@ Generate assigned_authority.json for the AI Cognitive Engagement Cube (3A)
 Assigned Authority specifies the degree of AI cognitive takeover
 """
 
-import json
 from pathlib import Path
 import sys
 
@@ -14,6 +13,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "clinical-skill-mix"))
 from skill_mix_dimensions_model import (
     SkillMixDimension, DimensionItem, ReferenceInfo, HierarchyInfo, DimensionType
 )
+from dimension_io import write_dimension
 
 # Define paths
 BASE_PATH = Path(__file__).parent.parent
@@ -136,8 +136,7 @@ def save_dimension(dimension):
     """Save the assigned authority dimension to JSON file"""
     output_path = SKILL_MIX_PATH / 'assigned_authority.json'
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(dimension.dict(), f, indent=2, ensure_ascii=False)
+    write_dimension(dimension, output_path)
 
     print(f"✓ Generated assigned_authority.json with {len(dimension.items)} authority levels")
     print(f"✓ Saved to {output_path}")
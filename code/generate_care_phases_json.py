@@ -5,7 +5,6 @@ Disease stage represents the temporal dimension of illness
 Seven milestones and six actionable stages spanning the patient journey
 """
 
-import json
 from pathlib import Path
 import sys
 
@@ -15,6 +14,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "clinical-skill-mix"))
 from skill_mix_dimensions_model import (
     SkillMixDimension, DimensionItem, ReferenceInfo, HierarchyInfo, DimensionType
 )
+from dimension_io import write_dimension
 
 # Define paths
 BASE_PATH = Path(__file__).parent.parent
@@ -159,8 +159,7 @@ def save_dimension(dimension):
     """Save the stage dimension to JSON file"""
     output_path = SKILL_MIX_PATH / 'stage.json'
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(dimension.dict(), f, indent=2, ensure_ascii=False)
+    write_dimension(dimension, output_path)
 
     print(f"✓ Generated stage.json with {len(dimension.items)} stages")
     print(f"✓ Saved to {output_path}")
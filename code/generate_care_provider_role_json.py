@@ -8,21 +8,30 @@ following the standardized Pydantic format for Clinical Competency Cube (5C) dim
 Data Sources:
 - WHO_health_worker_classification.csv: Main occupational categories with ISCO codes
 - WHO_health_worker_classification_specialities.csv: Medical specialties for specialists
+- personas_full_structure.txt: ABMS board subspecialties
 
 Structure:
 - Level 0: WHO occupational groups (e.g., Generalist medical practitioners, Nursing professionals)
 - Level 1: Medical specialties for Specialist medical practitioners (e.g., Cardiology, Surgery)
-- Level 2: Not implemented in this WHO-based approach
+- Level 2: ABMS subspecialties under their WHO specialty (from personas_full_structure.txt)
 
 Author: Clinical World Model Framework
 Date: 2025-01-30
 """
 
 import pandas as pd
-import json
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Mapping, Tuple, Iterator
 from pathlib import Path
+from collections import Counter
 import re
+import sys
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "clinical-skill-mix"))
+
+from dimension_io import DimensionBuilder
+from skill_mix_dimensions_model import DimensionType
+from generator_inputs import read_input_csv
 
 
 def normalize_id(text: str) -> str:
@@ -103,18 +112,9 @@ def load_and_process_classification_data(csv_path: str) -> pd.DataFrame:
         Processed DataFrame
     """
     try:
-        # Try different encodings to handle various file formats
-        encodings = ['utf-8', 'latin-1', 'iso-8859-1', 'cp1252']
-        
-        for encoding in encodings:
-            try:
-                df = pd.read_csv(csv_path, encoding=encoding)
-                print(f"Successfully loaded {csv_path} with {encoding} encoding")
-                break
-            except UnicodeDecodeError:
-                continue
-        else:
-            raise Exception("Could not decode file with any supported encoding")
+        # Shared loader: encoding sniffed once, parsed frame cached by file hash
+        df = read_input_csv(csv_path)
+        print(f"Successfully loaded {csv_path}")
         
         # Clean column names
         df.columns = df.columns.str.strip()
@@ -149,12 +149,12 @@ def extract_examples_list(examples_text: str) -> List[str]:
     return examples[:10]  # Limit to first 10 examples to avoid excessive data
 
 
-def create_metadata_for_occupation(row: pd.Series) -> Dict[str, Any]:
+def create_metadata_for_occupation(row: Mapping[str, Any]) -> Dict[str, Any]:
     """
     Create comprehensive metadata for an occupation from WHO data.
     
     Args:
-        row: DataFrame row containing occupation data
+        row: DataFrame row or record dict containing occupation data
         
     Returns:
         Metadata dictionary
@@ -203,6 +203,36 @@ def create_metadata_for_occupation(row: pd.Series) -> Dict[str, Any]:
     return metadata
 
 
+# ABMS member boards mapped to the WHO specialty (or specialties) they refine.
+# Boards without a WHO counterpart map to an empty list and are skipped.
+ABMS_BOARD_TO_WHO_SPECIALTIES = {
+    "Allergy and Immunology": ["immunology"],
+    "Anesthesiology": ["anaesthesiology"],
+    "Colon and Rectal Surgery": ["general-surgery"],
+    "Dermatology": ["dermatovenerology"],
+    "Emergency Medicine": ["accident-and-emergency-medicine"],
+    "Family Medicine": [],
+    "Internal Medicine": ["internal-medicine"],
+    "Medical Genetics and Genomics": [],
+    "Neurological Surgery": ["neurological-surgery"],
+    "Nuclear Medicine": ["radiology"],
+    "Obstetrics and Gynecology": ["gynaecologist", "obstetrician"],
+    "Ophthalmology": ["ophthalmology"],
+    "Orthopaedic Surgery": ["orthopaedics"],
+    "Otolaryngology - Head and Neck Surgery": ["otolaryngology"],
+    "Pathology": [],
+    "Pediatrics": ["paediatrician"],
+    "Physical Medicine and Rehabilitation": ["rehabilitative-medicine"],
+    "Plastic Surgery": ["plastic-surgery"],
+    "Preventive Medicine": ["occupational-medicine"],
+    "Psychiatry and Neurology": ["psychiatrist", "neurology"],
+    "Radiology": ["radiology"],
+    "Surgery": ["general-surgery"],
+    "Thoracic Surgery": ["thoracic-surgery"],
+    "Urology": ["urology"],
+}
+
+
 def process_specialties_data(specialties_csv_path: str) -> Dict[str, List[str]]:
     """
     Process medical specialties data and group by specialty groups.
@@ -219,32 +249,272 @@ def process_specialties_data(specialties_csv_path: str) -> Dict[str, List[str]]:
         print("Warning: Specialties data is empty")
         return {}
     
-    specialty_groups = {}
+    df = df.assign(
+        group=df['Specialty Group'].astype(str).str.strip(),
+        specialty=df['Speciality'].astype(str).str.strip()
+    )
+    valid = (df['group'] != '') & (df['specialty'] != '') & (df['group'] != 'nan') & (df['specialty'] != 'nan')
+    
+    return df[valid].groupby('group', sort=False)['specialty'].agg(list).to_dict()
+
+
+def parse_subspecialty_structure(structure_path: str) -> Dict[str, List[str]]:
+    """
+    Parse the ABMS board -> subspecialty listing (personas_full_structure.txt).
+    
+    Args:
+        structure_path: Path to the text file with numbered boards and "- " subspecialty lines
+        
+    Returns:
+        Dictionary mapping each board name to its list of subspecialties
+    """
+    boards: Dict[str, List[str]] = {}
+    current_board = None
+    
+    with open(structure_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            board_match = re.match(r'^\s*\d+\.\s+(.+?)\s*$', line)
+            if board_match:
+                current_board = board_match.group(1)
+                boards[current_board] = []
+                continue
+            
+            subspecialty_match = re.match(r'^\s*-\s+(.+?)\s*$', line)
+            if subspecialty_match and current_board is not None:
+                subspecialty = subspecialty_match.group(1)
+                if subspecialty.lower() != 'no subspecialties':
+                    boards[current_board].append(subspecialty)
+    
+    return boards
+
+
+def classify_specialty(specialty: str) -> Dict[str, Any]:
+    """
+    Derive specialty-type metadata from a specialty or subspecialty name.
+    
+    Args:
+        specialty: Specialty name
+        
+    Returns:
+        Metadata fields describing the specialty type
+    """
+    specialty_lower = specialty.lower()
+    if any(term in specialty_lower for term in ['surgery', 'surgical']):
+        return {"specialty_type": "surgical", "procedural_focus": True}
+    if any(term in specialty_lower for term in ['psychiatry', 'psychology']):
+        return {"specialty_type": "mental_health"}
+    if any(term in specialty_lower for term in ['pediatrics', 'paediatrics']):
+        return {"specialty_type": "pediatric", "patient_population": "children"}
+    if any(term in specialty_lower for term in ['internal', 'medicine']):
+        return {"specialty_type": "internal_medicine"}
+    return {"specialty_type": "medical"}
+
+
+def plan_occupations(df_classification: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
+    """
+    Source records of the level-0 occupations, deduplicated by normalized ID.
+    
+    Args:
+        df_classification: Processed classification DataFrame
+        
+    Returns:
+        Occupation ID -> classification record, in file order
+    """
+    occupations = df_classification.assign(
+        occupation_group=df_classification['Occupation group'].astype(str).str.strip()
+    )
+    occupations = occupations[
+        (occupations['occupation_group'] != '') & (occupations['occupation_group'] != 'nan')
+    ]
+    occupations = occupations.assign(occupation_id=occupations['occupation_group'].map(normalize_id))
+    occupations = occupations.drop_duplicates(subset='occupation_id', keep='first')
+    
+    return {row['occupation_id']: row for row in occupations.to_dict(orient='records')}
+
+
+def plan_specialties(
+    parent_id: str,
+    specialty_groups: Dict[str, List[str]]
+) -> Dict[str, Tuple[str, str]]:
+    """
+    Level-1 medical specialties under the specialist practitioners role.
     
-    for _, row in df.iterrows():
-        group = str(row.get('Specialty Group', '')).strip()
-        specialty = str(row.get('Speciality', '')).strip()
+    Args:
+        parent_id: ID of the specialist medical practitioners item
+        specialty_groups: Specialty group -> specialties mapping
         
-        if group and specialty and group != 'nan' and specialty != 'nan':
-            if group not in specialty_groups:
-                specialty_groups[group] = []
-            specialty_groups[group].append(specialty)
+    Returns:
+        Specialty ID -> (specialty group, specialty name), first occurrence kept
+    """
+    specialties = {}
+    for specialty_group, names in specialty_groups.items():
+        for specialty in names:
+            if not specialty or specialty.lower() == 'nan':
+                continue
+            specialties.setdefault(f"{parent_id}/{normalize_id(specialty)}", (specialty_group, specialty))
+    return specialties
+
+
+def plan_subspecialties(
+    specialties: Dict[str, Tuple[str, str]],
+    parent_id: str,
+    board_subspecialties: Dict[str, List[str]]
+) -> Dict[str, Tuple[str, str, str]]:
+    """
+    Level-2 subspecialties from ABMS boards mapped onto WHO specialties.
+    
+    Args:
+        specialties: Planned specialties (see plan_specialties)
+        parent_id: ID of the specialist medical practitioners item
+        board_subspecialties: ABMS board -> subspecialties mapping
+        
+    Returns:
+        Subspecialty ID -> (ABMS board, specialty ID, subspecialty name),
+        one per specialty/subspecialty pair
+    """
+    subspecialties = {}
+    
+    for board, names in board_subspecialties.items():
+        specialty_slugs = ABMS_BOARD_TO_WHO_SPECIALTIES.get(board)
+        if specialty_slugs is None:
+            print(f"Warning: ABMS board '{board}' has no WHO specialty mapping - skipped")
+            continue
+        
+        for specialty_slug in specialty_slugs:
+            specialty_id = f"{parent_id}/{specialty_slug}"
+            if specialty_id not in specialties:
+                print(f"Warning: WHO specialty '{specialty_id}' not found for ABMS board '{board}'")
+                continue
+            
+            for subspecialty in names:
+                subspecialty_id = f"{specialty_id}/{normalize_id(subspecialty)}"
+                subspecialties.setdefault(subspecialty_id, (board, specialty_id, subspecialty))
+    
+    return subspecialties
+
+
+def occupation_item(occupation_id: str, row: Mapping[str, Any], children_ids: List[str]) -> Dict[str, Any]:
+    """Level-0 occupation item from its classification record."""
+    return create_dimension_item(
+        id_str=occupation_id,
+        path_components=[occupation_id],
+        depth=0,
+        parent_id=None,
+        children_ids=children_ids,
+        name=row['occupation_group'],
+        description=str(row.get('Definition', '')).strip(),
+        metadata=create_metadata_for_occupation(row)
+    )
+
+
+def specialty_item(
+    specialty_id: str,
+    specialty_group: str,
+    specialty: str,
+    children_ids: List[str]
+) -> Dict[str, Any]:
+    """Level-1 medical specialty item."""
+    parent_id, specialty_slug = specialty_id.split('/')
+    specialty_metadata = {
+        "specialty_group": specialty_group,
+        "medical_specialty": True,
+        "who_classification": True,
+        "requires_specialization": True,
+        "postgraduate_training": True,
+        "board_certification": "varies_by_jurisdiction"
+    }
+    specialty_metadata.update(classify_specialty(specialty))
+    
+    return create_dimension_item(
+        id_str=specialty_id,
+        path_components=[parent_id, specialty_slug],
+        depth=1,
+        parent_id=parent_id,
+        children_ids=children_ids,
+        name=specialty.title(),
+        description=f"Medical specialist in {specialty.lower()}",
+        metadata=specialty_metadata
+    )
+
+
+def subspecialty_item(
+    subspecialty_id: str,
+    board: str,
+    specialty_group: str,
+    specialty_name: str,
+    subspecialty: str
+) -> Dict[str, Any]:
+    """Level-2 ABMS subspecialty item under its WHO specialty."""
+    subspecialty_metadata = {
+        "specialty_group": specialty_group,
+        "abms_board": board,
+        "medical_specialty": True,
+        "subspecialty": True,
+        "requires_specialization": True,
+        "postgraduate_training": True,
+        "board_certification": "abms_subspecialty_certificate"
+    }
+    subspecialty_metadata.update(classify_specialty(subspecialty))
+    
+    return create_dimension_item(
+        id_str=subspecialty_id,
+        path_components=subspecialty_id.split('/'),
+        depth=2,
+        parent_id=subspecialty_id.rsplit('/', 1)[0],
+        children_ids=[],
+        name=subspecialty,
+        description=f"{specialty_name} subspecialist in {subspecialty.lower()}",
+        metadata=subspecialty_metadata
+    )
+
+
+def iter_role_items(
+    occupations: Dict[str, Dict[str, Any]],
+    specialties: Dict[str, Tuple[str, str]],
+    subspecialties: Dict[str, Tuple[str, str, str]]
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield role items sorted by ID, each built only when it is reached.
     
-    return specialty_groups
+    Only the source records and the ID skeleton (parent -> sorted child IDs)
+    are held in memory; items are created and handed to the writer one at a time.
+    """
+    children: Dict[str, List[str]] = {}
+    for item_id in list(specialties) + list(subspecialties):
+        children.setdefault(item_id.rsplit('/', 1)[0], []).append(item_id)
+    for child_ids in children.values():
+        child_ids.sort()
+    
+    for item_id in sorted(list(occupations) + list(specialties) + list(subspecialties)):
+        if item_id in occupations:
+            yield occupation_item(item_id, occupations[item_id], children.get(item_id, []))
+        elif item_id in specialties:
+            specialty_group, specialty = specialties[item_id]
+            yield specialty_item(item_id, specialty_group, specialty, children.get(item_id, []))
+        else:
+            board, specialty_id, subspecialty = subspecialties[item_id]
+            specialty_group, specialty = specialties[specialty_id]
+            yield subspecialty_item(item_id, board, specialty_group, specialty.title(), subspecialty)
 
 
 def generate_personas_json(
     classification_csv_path: str,
     specialties_csv_path: str,
-    output_path: str
+    output_path: str,
+    subspecialties_path: str = ""
 ) -> None:
     """
     Generate comprehensive care_provider_role.json from WHO data.
     
+    The hierarchy is planned from the source data as IDs only, then items are
+    streamed to the file with DimensionBuilder as they are created, so memory
+    holds the inputs and ID index rather than the finished items.
+    
     Args:
         classification_csv_path: Path to main classification CSV
         specialties_csv_path: Path to specialties CSV
         output_path: Output path for generated JSON
+        subspecialties_path: Path to the ABMS subspecialty structure (optional)
     """
     print("Loading WHO health worker classification data...")
     
@@ -255,156 +525,54 @@ def generate_personas_json(
         print("Error: No classification data found")
         return
     
-    # Load specialties data
-    specialty_groups = process_specialties_data(specialties_csv_path)
-    
-    # Initialize the dimension structure
-    dimension_data = {
-        "dimension": "care_provider_role",
-        "description": "Healthcare provider roles based on WHO health worker classification with ISCO codes",
-        "reference": {
-            "classification": "WHO Health Worker Classification and ISCO-08 Standards",
-            "burden_metric": "Professional scope, training requirements, and regulatory status",
-            "data_source": "World Health Organization Health Worker Classification and International Standard Classification of Occupations",
-            "last_updated": "2025-01-30",
-            "sources": [
-                "WHO Health Worker Classification Framework",
-                "International Standard Classification of Occupations (ISCO-08)",
-                "Medical specialty classification systems",
-                "Professional health worker regulatory standards"
-            ]
-        },
-        "hierarchy": {
-            "structure": "Healthcare occupations with medical specializations",
-            "levels": ["occupation", "specialty"],
-            "max_depth": 1  # Level 0: occupation groups, Level 1: specialties for medical practitioners
-        },
-        "items": [],
-        "dimension_metadata": {}
-    }
-    
-    # Track items and relationships
-    all_items = []
-    specialist_medical_practitioners_id = None
+    # Load specialties and subspecialties data
+    specialty_groups = process_specialties_data(specialties_csv_path) if specialties_csv_path else {}
+    board_subspecialties = parse_subspecialty_structure(subspecialties_path) if subspecialties_path else {}
     
     print(f"Processing {len(df_classification)} occupation groups...")
     
-    # Process each occupation group (Level 0)
-    for _, row in df_classification.iterrows():
-        occupation_group = str(row.get('Occupation group', '')).strip()
-        
-        if not occupation_group or occupation_group == 'nan':
-            continue
-        
-        # Create normalized ID
-        occupation_id = normalize_id(occupation_group)
-        
-        # Skip duplicates or invalid entries
-        if any(item['id'] == occupation_id for item in all_items):
-            continue
-        
-        # Determine if we'll add specialties for this occupation
-        children_ids = []
-        if occupation_group.lower() == 'specialist medical practitioners':
-            specialist_medical_practitioners_id = occupation_id
-        
-        # Create metadata
-        metadata = create_metadata_for_occupation(row)
-        
-        # Create the occupation item
-        occupation_item = create_dimension_item(
-            id_str=occupation_id,
-            path_components=[occupation_id],
-            depth=0,
-            parent_id=None,
-            children_ids=children_ids,  # Will be updated later
-            name=occupation_group,
-            description=str(row.get('Definition', '')).strip(),
-            metadata=metadata
-        )
-        
-        all_items.append(occupation_item)
+    # Level 0: occupation groups
+    occupations = plan_occupations(df_classification)
     
-    print(f"Processed {len(all_items)} occupation groups")
+    print(f"Processed {len(occupations)} occupation groups")
     
-    # Process medical specialties (Level 1) for Specialist medical practitioners
-    if specialist_medical_practitioners_id and specialty_groups:
-        print(f"Adding {sum(len(specs) for specs in specialty_groups.values())} medical specialties...")
-        
-        specialist_children = []
-        
-        for specialty_group, specialties in specialty_groups.items():
-            for specialty in specialties:
-                if not specialty or specialty.lower() == 'nan':
-                    continue
-                
-                specialty_id = f"{specialist_medical_practitioners_id}/{normalize_id(specialty)}"
-                specialist_children.append(specialty_id)
-                
-                # Create metadata for specialty
-                specialty_metadata = {
-                    "specialty_group": specialty_group,
-                    "medical_specialty": True,
-                    "who_classification": True,
-                    "requires_specialization": True,
-                    "postgraduate_training": True,
-                    "board_certification": "varies_by_jurisdiction"
-                }
-                
-                # Add specific metadata based on specialty type
-                specialty_lower = specialty.lower()
-                if any(term in specialty_lower for term in ['surgery', 'surgical']):
-                    specialty_metadata["specialty_type"] = "surgical"
-                    specialty_metadata["procedural_focus"] = True
-                elif any(term in specialty_lower for term in ['psychiatry', 'psychology']):
-                    specialty_metadata["specialty_type"] = "mental_health"
-                elif any(term in specialty_lower for term in ['pediatrics', 'paediatrics']):
-                    specialty_metadata["specialty_type"] = "pediatric"
-                    specialty_metadata["patient_population"] = "children"
-                elif any(term in specialty_lower for term in ['internal', 'medicine']):
-                    specialty_metadata["specialty_type"] = "internal_medicine"
-                else:
-                    specialty_metadata["specialty_type"] = "medical"
-                
-                # Create the specialty item
-                specialty_item = create_dimension_item(
-                    id_str=specialty_id,
-                    path_components=[specialist_medical_practitioners_id, normalize_id(specialty)],
-                    depth=1,
-                    parent_id=specialist_medical_practitioners_id,
-                    children_ids=[],
-                    name=specialty.title(),
-                    description=f"Medical specialist in {specialty.lower()}",
-                    metadata=specialty_metadata
-                )
-                
-                all_items.append(specialty_item)
-        
-        # Update the specialist medical practitioners item with children
-        for item in all_items:
-            if item['id'] == specialist_medical_practitioners_id:
-                item['children_ids'] = sorted(specialist_children)
-                break
+    specialist_medical_practitioners_id = normalize_id('Specialist medical practitioners')
+    has_specialists = specialist_medical_practitioners_id in occupations
     
-    # Sort items by ID for consistent output
-    all_items.sort(key=lambda x: x['id'])
+    # Level 1: medical specialties for Specialist medical practitioners
+    specialties = {}
+    if has_specialists and specialty_groups:
+        print(f"Adding {sum(len(specs) for specs in specialty_groups.values())} medical specialties...")
+        specialties = plan_specialties(specialist_medical_practitioners_id, specialty_groups)
     
-    # Add items to dimension data
-    dimension_data['items'] = all_items
+    # Level 2: ABMS subspecialties under their WHO specialty
+    subspecialties = {}
+    if has_specialists and board_subspecialties:
+        subspecialties = plan_subspecialties(specialties, specialist_medical_practitioners_id, board_subspecialties)
+        print(f"Adding {len(subspecialties)} medical subspecialties...")
     
     # Create comprehensive dimension metadata
-    occupation_counts = {}
-    specialty_counts = 0
-    
-    for item in all_items:
-        if item['depth'] == 0:
-            occupation_type = item['metadata'].get('scope', 'other')
-            occupation_counts[occupation_type] = occupation_counts.get(occupation_type, 0) + 1
-        elif item['depth'] == 1:
-            specialty_counts += 1
-    
-    dimension_data['dimension_metadata'] = {
-        "total_occupations": len([item for item in all_items if item['depth'] == 0]),
+    occupation_counts = dict(Counter(
+        create_metadata_for_occupation(occupations[occupation_id]).get('scope', 'other')
+        for occupation_id in sorted(occupations)
+    ))
+    specialty_counts = len(specialties)
+    subspecialty_counts = len(subspecialties)
+    
+    hierarchy = {
+        "structure": "Healthcare occupations with medical specializations",
+        "levels": ["occupation", "specialty"],
+        "max_depth": 1  # Level 0: occupation groups, Level 1: specialties for medical practitioners
+    }
+    if subspecialty_counts:
+        hierarchy = {
+            "structure": "Healthcare occupations with medical specializations and ABMS subspecialties",
+            "levels": ["occupation", "specialty", "subspecialty"],
+            "max_depth": 2  # Level 2: ABMS subspecialties under WHO specialties
+        }
+    
+    dimension_metadata = {
+        "total_occupations": len(occupations),
         "total_specialties": specialty_counts,
         "occupation_distribution": occupation_counts,
         "specialty_groups": len(set(specialty_groups.keys())) if specialty_groups else 0,
@@ -413,20 +581,42 @@ def generate_personas_json(
         "international_standard": True,
         "last_updated": "2025-01-30"
     }
+    if subspecialty_counts:
+        dimension_metadata["total_subspecialties"] = subspecialty_counts
+    
+    builder = DimensionBuilder(
+        dimension=DimensionType.CARE_PROVIDER_ROLE,
+        description="Healthcare provider roles based on WHO health worker classification with ISCO codes",
+        reference={
+            "classification": "WHO Health Worker Classification and ISCO-08 Standards",
+            "burden_metric": "Professional scope, training requirements, and regulatory status",
+            "data_source": "World Health Organization Health Worker Classification and International Standard Classification of Occupations",
+            "last_updated": "2025-01-30",
+            "sources": [
+                "WHO Health Worker Classification Framework",
+                "International Standard Classification of Occupations (ISCO-08)",
+                "Medical specialty classification systems",
+                "Professional health worker regulatory standards"
+            ]
+        },
+        hierarchy=hierarchy,
+        dimension_metadata=dimension_metadata
+    )
     
     # Write to file
-    print(f"Writing care_provider_role.json with {len(all_items)} total items...")
+    total_items = len(occupations) + specialty_counts + subspecialty_counts
+    print(f"Writing care_provider_role.json with {total_items} total items...")
     
     # Ensure output directory exists
     Path(output_path).parent.mkdir(parents=True, exist_ok=True)
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(dimension_data, f, indent=2, ensure_ascii=False)
+    summary = builder.write(output_path, iter_role_items(occupations, specialties, subspecialties))
     
     print(f"✅ Successfully generated {output_path}")
-    print(f"   📊 Total items: {len(all_items)}")
-    print(f"   👥 Occupation groups: {len([item for item in all_items if item['depth'] == 0])}")
+    print(f"   📊 Total items: {summary['total_items']}")
+    print(f"   👥 Occupation groups: {len(occupations)}")
     print(f"   🩺 Medical specialties: {specialty_counts}")
+    print(f"   🔬 Medical subspecialties: {subspecialty_counts}")
     print(f"   📁 Specialty groups: {len(set(specialty_groups.keys())) if specialty_groups else 0}")
 
 
@@ -439,6 +629,7 @@ def main():
     
     classification_csv = data_dir / "WHO_health_worker_classification.csv"
     specialties_csv = data_dir / "WHO_health_worker_classification_specialities.csv"
+    subspecialties_txt = Path(__file__).parent / "personas_full_structure.txt"
     output_json = output_dir / "care_provider_role.json"
     
     # Verify input files exist
@@ -450,12 +641,17 @@ def main():
         print(f"Warning: {specialties_csv} not found - proceeding without specialties")
         specialties_csv = None
     
+    if not subspecialties_txt.exists():
+        print(f"Warning: {subspecialties_txt} not found - proceeding without subspecialties")
+        subspecialties_txt = None
+    
     # Generate the care_provider_role.json file
     try:
         generate_personas_json(
             str(classification_csv),
             str(specialties_csv) if specialties_csv else "",
-            str(output_json)
+            str(output_json),
+            str(subspecialties_txt) if subspecialties_txt else ""
         )
         
         print("\n🎉 Personas dimension generated successfully!")
@@ -5,7 +5,6 @@ Location of care is intrinsically linked to disease stage
 Settings range from community to intensive care
 """
 
-import json
 from pathlib import Path
 import sys
 
@@ -15,6 +14,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "clinical-skill-mix"))
 from skill_mix_dimensions_model import (
     SkillMixDimension, DimensionItem, ReferenceInfo, HierarchyInfo, DimensionType
 )
+from dimension_io import write_dimension
 
 # Define paths
 BASE_PATH = Path(__file__).parent.parent
@@ -208,8 +208,7 @@ def save_dimension(dimension):
     """Save the location dimension to JSON file"""
     output_path = SKILL_MIX_PATH / 'location.json'
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(dimension.dict(), f, indent=2, ensure_ascii=False)
+    write_dimension(dimension, output_path)
 
     print(f"✓ Generated location.json with {len(dimension.items)} locations")
     print(f"✓ Saved to {output_path}")
@@ -5,7 +5,6 @@ Care tasks represent cognitive activities for AI augmentation/automation
 Based on Physician Competency Reference Set (Englander et al.)
 """
 
-import json
 import csv
 from pathlib import Path
 import sys
@@ -16,6 +15,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "clinical-skill-mix"))
 from skill_mix_dimensions_model import (
     SkillMixDimension, DimensionItem, ReferenceInfo, HierarchyInfo, DimensionType
 )
+from dimension_io import write_dimension
 
 # Define paths
 BASE_PATH = Path(__file__).parent.parent
@@ -204,8 +204,7 @@ def save_dimension(dimension):
     """Save the task dimension to JSON file"""
     output_path = SKILL_MIX_PATH / 'care_task.json'
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(dimension.dict(), f, indent=2, ensure_ascii=False)
+    write_dimension(dimension, output_path)
 
     print(f"✓ Generated care_task.json with {len(dimension.items)} care tasks")
     print(f"  - 8 domains (depth 0)")
@@ -4,8 +4,8 @@ Generate conditions.json from ICD-10-CM major codes (Code Length = 3, Header = 0
 Replaces the previous GBD-based generation with ICD-10-CM classification
 """
 
-import json
 import csv
+import io
 from pathlib import Path
 import sys
 from collections import defaultdict
@@ -16,6 +16,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "clinical-skill-mix"))
 from skill_mix_dimensions_model import (
     SkillMixDimension, DimensionItem, ReferenceInfo, HierarchyInfo, DimensionType
 )
+from dimension_io import DimensionBuilder
+from generator_inputs import read_input_text
+from ghe_crosswalk import condition_burden, burden_summary
 
 # Define paths
 BASE_PATH = Path(__file__).parent.parent
@@ -57,26 +60,26 @@ def parse_icd10_csv():
     """Parse ICD-10-CM CSV and extract major codes (Code Length = 3, Header = 0)"""
     conditions = []
 
-    with open(ICD10_CSV, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            code_length = int(row['Code Length'])
-            header_flag = int(row['header_0 or transaction_1'])
+    # Shared loader: encoding sniffed once, decoded text cached by file hash
+    reader = csv.DictReader(io.StringIO(read_input_text(ICD10_CSV), newline=''))
+    for row in reader:
+        code_length = int(row['Code Length'])
+        header_flag = int(row['header_0 or transaction_1'])
 
-            # Filter: Code Length = 3 (include both Header = 0 and Header = 1 for complete coverage)
-            if code_length == 3:
-                code = row['Code'].strip()
-                short_desc = row['Short description'].strip()
-                long_desc = row['Long description'].strip()
+        # Filter: Code Length = 3 (include both Header = 0 and Header = 1 for complete coverage)
+        if code_length == 3:
+            code = row['Code'].strip()
+            short_desc = row['Short description'].strip()
+            long_desc = row['Long description'].strip()
 
-                # Use long description if available, otherwise short description
-                description = long_desc if long_desc else short_desc
+            # Use long description if available, otherwise short description
+            description = long_desc if long_desc else short_desc
 
-                conditions.append({
-                    'code': code,
-                    'name': description,
-                    'chapter_letter': code[0]  # First character indicates chapter
-                })
+            conditions.append({
+                'code': code,
+                'name': description,
+                'chapter_letter': code[0]  # First character indicates chapter
+            })
 
     print(f"Parsed {len(conditions)} ICD-10-CM major codes from CSV")
     return conditions
@@ -92,10 +95,19 @@ def group_by_chapter(conditions):
 
     return chapters
 
-def create_dimension_items(conditions):
-    """Create hierarchical dimension items: Chapter -> Condition"""
+def create_dimension_items(conditions, burden=None):
+    """
+    Yield hierarchical dimension items one at a time: Chapter -> Condition
+
+    Args:
+        conditions: Parsed ICD-10-CM codes
+        burden: GHE burden metadata per condition, aligned with conditions
+            (default: resolved with condition_burden)
+    """
+    if burden is None:
+        burden = condition_burden([condition['code'] for condition in conditions])
+    burden_by_code = {condition['code']: entry for condition, entry in zip(conditions, burden)}
     chapters_dict = group_by_chapter(conditions)
-    items = []
 
     # Create chapter-level items (depth 0)
     for letter in sorted(chapters_dict.keys()):
@@ -125,7 +137,7 @@ def create_dimension_items(conditions):
                 "condition_count": len(chapter_conditions)
             }
         )
-        items.append(chapter_item)
+        yield chapter_item
 
         # Create condition-level items (depth 1)
         for condition in chapter_conditions:
@@ -151,24 +163,15 @@ def create_dimension_items(conditions):
                 },
                 metadata={
                     "icd10_code": condition['code'],
-                    "chapter": chapter_name
+                    "chapter": chapter_name,
+                    **burden_by_code[condition['code']]
                 }
             )
-            items.append(condition_item)
+            yield condition_item
 
-    return items
-
-def generate_conditions_dimension():
-    """Generate the complete conditions dimension from ICD-10-CM"""
-
-    # Parse CSV
-    conditions = parse_icd10_csv()
-
-    # Create dimension items
-    items = create_dimension_items(conditions)
-
-    # Create dimension
-    dimension = SkillMixDimension(
+def create_conditions_builder(burden=None):
+    """Create the conditions dimension header; items are streamed separately"""
+    return DimensionBuilder(
         dimension=DimensionType.CONDITION,
         description="Medical conditions classified according to ICD-10-CM (International Classification of Diseases, 10th Revision, Clinical Modification). This dimension uses ALL 3-character codes including both category headers (with sub-codes) and standalone diagnostic codes for complete clinical coverage across all medical specialties.",
         reference=ReferenceInfo(
@@ -188,22 +191,42 @@ def generate_conditions_dimension():
             levels=["chapter", "code"],
             max_depth=1
         ),
-        items=items
+        dimension_metadata={"daly_crosswalk": burden_summary(burden)} if burden is not None else None
+    )
+
+def generate_conditions_dimension():
+    """Generate the complete conditions dimension from ICD-10-CM in memory"""
+
+    # Parse CSV
+    conditions = parse_icd10_csv()
+
+    burden = condition_burden([condition['code'] for condition in conditions])
+
+    # Create dimension
+    builder = create_conditions_builder(burden)
+    dimension = SkillMixDimension(
+        dimension=builder.dimension,
+        description=builder.description,
+        reference=builder.reference,
+        hierarchy=builder.hierarchy,
+        items=list(create_dimension_items(conditions, burden)),
+        dimension_metadata=builder.dimension_metadata
     )
 
     return dimension
 
-def save_dimension(dimension):
-    """Save the conditions dimension to JSON file"""
+def save_dimension(conditions):
+    """Stream the conditions dimension to JSON file as items are created"""
     output_path = SKILL_MIX_PATH / 'conditions.json'
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(dimension.dict(), f, indent=2, ensure_ascii=False)
+    # GHE cause and DALY figures for every code, resolved in one pass
+    burden = condition_burden([condition['code'] for condition in conditions])
+    summary = create_conditions_builder(burden).write(output_path, create_dimension_items(conditions, burden))
 
-    print(f"Generated conditions.json with {len(dimension.items)} items")
+    print(f"Generated conditions.json with {summary['total_items']} items")
     print(f"Saved to {output_path}")
 
-    return output_path
+    return output_path, summary
 
 if __name__ == "__main__":
     print("Generating conditions dimension from ICD-10-CM major codes...")
@@ -215,28 +238,27 @@ if __name__ == "__main__":
             print(f"ERROR: ICD-10-CM CSV not found at {ICD10_CSV}")
             sys.exit(1)
 
-        # Generate dimension
-        dimension = generate_conditions_dimension()
+        # Parse CSV
+        conditions = parse_icd10_csv()
 
-        # Save to file
-        output_path = save_dimension(dimension)
+        # Generate and save dimension (items are streamed to file)
+        output_path, summary = save_dimension(conditions)
 
         print("=" * 70)
         print("Conditions dimension generation complete!")
         print(f"\nStatistics:")
 
         # Count chapters and conditions
-        chapters = [item for item in dimension.items if item.depth == 0]
-        conditions = [item for item in dimension.items if item.depth == 1]
-
-        print(f"  Chapters: {len(chapters)}")
-        print(f"  Major category codes: {len(conditions)}")
-        print(f"  Total items: {len(dimension.items)}")
+        print(f"  Chapters: {summary['depth_counts'].get(0, 0)}")
+        print(f"  Major category codes: {summary['depth_counts'].get(1, 0)}")
+        print(f"  Total items: {summary['total_items']}")
 
         # Show first few chapters
+        chapters_dict = group_by_chapter(conditions)
         print(f"\nFirst 5 chapters:")
-        for chapter in chapters[:5]:
-            print(f"  - {chapter.name} ({chapter.metadata.get('condition_count', 0)} codes)")
+        for letter in sorted(chapters_dict.keys())[:5]:
+            chapter_name = ICD10_CHAPTERS.get(letter, f'Chapter {letter}')
+            print(f"  - {chapter_name} ({len(chapters_dict[letter])} codes)")
 
     except Exception as e:
         print(f"ERROR: Failed to generate conditions.json: {e}")
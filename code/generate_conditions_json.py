@@ -5,6 +5,7 @@ Uses standardized hierarchical skill-mix dimension format
 """
 
 import json
+import re
 from pathlib import Path
 from collections import defaultdict
 import sys
@@ -16,6 +17,7 @@ from skill_mix_dimensions_model import (
     SkillMixDimension, DimensionItem, ReferenceInfo, HierarchyInfo,
     DimensionType, DALYRankingCategory, build_hierarchical_items
 )
+from dimension_io import write_dimension
 
 # Define paths
 BASE_PATH = Path(__file__).parent.parent
@@ -157,19 +159,54 @@ DISEASE_TO_CHAPTER = {
     'mechanical': 'injuries'
 }
 
+def compile_keyword_matcher(keyword_map):
+    """
+    Compile a keyword -> chapter mapping into a single regex scanned once per title
+
+    The lookahead captures, at every position, the longest keyword starting
+    there, so overlapping keywords ('respiratory infections' vs 'respiratory')
+    are all visible to the caller. Declaration order becomes an explicit
+    priority between keywords that match separate parts of a title.
+    """
+    priorities = {keyword: rank for rank, keyword in enumerate(keyword_map)}
+    alternatives = sorted(keyword_map, key=lambda keyword: (-len(keyword), priorities[keyword]))
+    pattern = re.compile('(?=(' + '|'.join(re.escape(keyword) for keyword in alternatives) + '))')
+    return pattern, priorities
+
+DISEASE_KEYWORD_PATTERN, DISEASE_KEYWORD_PRIORITY = compile_keyword_matcher(DISEASE_TO_CHAPTER)
+
 def categorize_disease(disease_title):
-    """Categorize a disease based on its title"""
+    """
+    Categorize a disease based on its title
+
+    Overlapping keyword matches are resolved by longest match; among the
+    remaining non-overlapping matches the highest-priority keyword wins.
+    """
     title_lower = disease_title.lower()
     
-    for keyword, chapter in DISEASE_TO_CHAPTER.items():
-        if keyword in title_lower:
-            return chapter
-    
-    # Default categorization
-    if 'conditions' in title_lower:
+    matches = [
+        (match.start(), match.start() + len(match.group(1)), match.group(1))
+        for match in DISEASE_KEYWORD_PATTERN.finditer(title_lower)
+    ]
+    if not matches:
         return 'other'
     
-    return 'other'
+    # Keep the longest match of every overlapping group
+    kept = []
+    for start, end, keyword in sorted(matches, key=lambda m: (m[0] - m[1], m[0])):
+        if all(end <= kept_start or start >= kept_end for kept_start, kept_end, _ in kept):
+            kept.append((start, end, keyword))
+    
+    best_keyword = min((keyword for _, _, keyword in kept), key=DISEASE_KEYWORD_PRIORITY.get)
+    return DISEASE_TO_CHAPTER[best_keyword]
+
+def categorize_diseases(disease_titles):
+    """Categorize many disease titles at once, classifying each distinct title only once"""
+    chapters_by_title = {}
+    for title in disease_titles:
+        if title not in chapters_by_title:
+            chapters_by_title[title] = categorize_disease(title)
+    return [chapters_by_title[title] for title in disease_titles]
 
 def load_daly_statistics():
     """Load the DALY statistics from analysis"""
@@ -183,8 +220,9 @@ def generate_diseases_json(daly_stats):
     # Group diseases by chapter
     chapters = defaultdict(list)
     
-    for disease in daly_stats['diseases']:
-        chapter = categorize_disease(disease['title'])
+    diseases = daly_stats['diseases']
+    disease_chapters = categorize_diseases([disease['title'] for disease in diseases])
+    for disease, chapter in zip(diseases, disease_chapters):
         chapters[chapter].append(disease)
     
     # Define chapter metadata
@@ -381,9 +419,8 @@ def save_diseases_json(diseases_dimension):
     """Save the generated disease.json file using standardized format"""
     output_path = SKILL_MIX_PATH / 'disease.json'
     
-    # Convert Pydantic model to JSON
-    with open(output_path, 'w') as f:
-        json.dump(diseases_dimension.model_dump(), f, indent=2)
+    # Stream the Pydantic model to JSON one item at a time
+    write_dimension(diseases_dimension, output_path, ensure_ascii=True)
     
     print(f"Generated disease.json saved to {output_path}")
     return output_path
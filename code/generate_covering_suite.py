@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Generate a t-wise covering suite of Clinical Intelligence scenarios
+
+Builds a covering array (covering_array.py) over the eight dimensions at the
+chosen depths: the smallest set of cells found in which every pair (or
+triple, ...) of items across any dimensions occurs at least once. Cells are
+written as JSON lines {"cell_id": id, "rank": rank, "cell": {dimension: item_id}},
+with cell_id the packed id from cell_ids.py (stable when items are reordered)
+and rank the position in the same CellSpace.
+
+Constraints file: JSON list of incompatible item pairs, e.g.
+    [[["condition", "chapter-o"], ["care_provider_role", "..."]]]
+An item above the axis depth excludes all of its descendants. Tuples that
+the pairs rule out only in combination are not required, and are counted.
+
+Example:
+    python code/generate_covering_suite.py --strength 2
+    python code/generate_covering_suite.py --strength 3 --depth condition=0 care_task=0 care_provider_role=0
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "clinical-skill-mix"))
+
+from dimension_io import load_all_dimensions
+from cell_space import CellSpace, CLINICAL_INTELLIGENCE_DEPTHS
+from covering_array import DEFAULT_STRENGTH, covering_array
+from cell_ids import load_codec
+
+# Define paths
+BASE_PATH = Path(__file__).parent.parent
+EXPORT_PATH = BASE_PATH / "data" / "exports" / "covering"
+
+
+def parse_depths(specs):
+    """DIMENSION=DEPTH overrides ('all' for every item, '0,1' for several depths) on top of the cell-space depths"""
+    depths = dict(CLINICAL_INTELLIGENCE_DEPTHS)
+    for spec in specs or []:
+        name, _, depth = spec.partition('=')
+        if name not in depths or not depth:
+            raise ValueError(f'Invalid depth spec: {spec} (expected DIMENSION=DEPTH)')
+        if depth == 'all':
+            depths[name] = None
+        else:
+            levels = tuple(int(level) for level in depth.split(','))
+            depths[name] = levels[0] if len(levels) == 1 else levels
+    return depths
+
+
+def write_suite(suite, path, codec=None):
+    """Write suite rows as JSON lines (codec: CellIdCodec, default the latest in cell_ids.json)"""
+    codec = codec or load_codec()
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    ranks = suite.ranks()
+    with open(path, 'w', encoding='utf-8') as f:
+        for cell_id, rank, cell in zip(codec.encode_ranks(suite.space, ranks).tolist(), ranks.tolist(), suite.cells()):
+            f.write(json.dumps({'cell_id': cell_id, 'rank': rank, 'cell': cell}, ensure_ascii=False) + '\n')
+    return path
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--strength', type=int, default=DEFAULT_STRENGTH, help='t: cover every t-tuple of items')
+    parser.add_argument('--depth', nargs='+', metavar='DIMENSION=DEPTH', help='Axis depth overrides')
+    parser.add_argument('--constraints', type=Path, help='JSON file of incompatible item pairs')
+    parser.add_argument('--output', type=Path, help='Output JSONL (default: data/exports/covering/suite_t<t>.jsonl)')
+    args = parser.parse_args()
+
+    space = CellSpace.from_dimensions(load_all_dimensions(), parse_depths(args.depth))
+    incompatible = []
+    if args.constraints:
+        with open(args.constraints, 'r', encoding='utf-8') as f:
+            incompatible = [tuple(map(tuple, pair)) for pair in json.load(f)]
+
+    print(f"Covering {space.size:,} cells at strength {args.strength} "
+          f"({' × '.join(str(radix) for radix in space.radices)})...")
+    start = time.perf_counter()
+    suite = covering_array(space, args.strength, incompatible)
+    covered, required = suite.coverage()
+    print(f"  {len(suite):,} cells, {covered:,}/{required:,} {args.strength}-tuples covered "
+          f"({time.perf_counter() - start:.1f}s)")
+    excluded = suite.implied_exclusions()
+    if excluded:
+        print(f"  {excluded:,} {args.strength}-tuples not required: ruled out by combined constraints")
+        for tuple_ in suite.infeasible[:10]:
+            print(f"    {tuple_}")
+
+    path = write_suite(suite, args.output or EXPORT_PATH / f"suite_t{args.strength}.jsonl")
+    print(f"✓ Saved to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Shared input loader for the dimension generators
+
+Each input file is read from disk once: the bytes are hashed, the encoding
+is sniffed from a bounded sample, and the decoded text (and parsed
+DataFrame) is cached by content hash. Generators that read the same CSV,
+in the same process or across runs, reuse the cached result instead of
+re-reading and re-parsing the file for every candidate encoding.
+"""
+
+import codecs
+import hashlib
+import io
+import pickle
+from pathlib import Path
+
+# Define paths
+BASE_PATH = Path(__file__).parent.parent
+INPUT_CACHE_PATH = BASE_PATH / "data" / "cache" / "generator_inputs"
+
+# Bytes inspected when sniffing the encoding
+SNIFF_SAMPLE_SIZE = 64 * 1024
+
+# Tried in order; latin-1 decodes any byte sequence and is the final fallback
+# (as in the generators' original utf-8 / latin-1 loop, so 0x80-0x9F stay C1 controls)
+CANDIDATE_ENCODINGS = ['utf-8', 'latin-1']
+
+_BOMS = [
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+]
+
+_text_cache = {}
+_frame_cache = {}
+
+
+def sniff_encoding(sample: bytes, complete: bool = False) -> str:
+    """
+    Detect the encoding of a byte sample.
+
+    Args:
+        sample: Leading bytes of the file
+        complete: True if the sample is the whole file (a multi-byte
+            character cut off at the end of a partial sample is tolerated)
+
+    Returns:
+        Name of the first candidate encoding that decodes the sample
+    """
+    for bom, encoding in _BOMS:
+        if sample.startswith(bom):
+            return encoding
+
+    for encoding in CANDIDATE_ENCODINGS:
+        decoder = codecs.getincrementaldecoder(encoding)()
+        try:
+            decoder.decode(sample, final=complete)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+
+    return CANDIDATE_ENCODINGS[-1]
+
+
+def _read_input(path):
+    """Read a file's bytes once and return them with their SHA-256 digest"""
+    data = Path(path).read_bytes()
+    return data, hashlib.sha256(data).hexdigest()
+
+
+def _decode(data: bytes) -> str:
+    """Decode bytes with the sniffed encoding, falling back on later candidates"""
+    sample = data[:SNIFF_SAMPLE_SIZE]
+    encoding = sniff_encoding(sample, complete=len(data) <= SNIFF_SAMPLE_SIZE)
+    candidates = [encoding] + [e for e in CANDIDATE_ENCODINGS if e != encoding]
+
+    for candidate in candidates:
+        try:
+            return data.decode(candidate)
+        except UnicodeDecodeError:
+            # Non-decodable bytes beyond the sniffed sample
+            continue
+
+    return data.decode(CANDIDATE_ENCODINGS[-1], errors='replace')
+
+
+def read_input_text(path) -> str:
+    """
+    Read and decode a generator input file, cached by content hash.
+
+    Args:
+        path: Path to the input file
+
+    Returns:
+        Decoded file contents
+    """
+    data, digest = _read_input(path)
+    if digest not in _text_cache:
+        _text_cache[digest] = _decode(data)
+    return _text_cache[digest]
+
+
+def read_input_csv(path, use_disk_cache: bool = True):
+    """
+    Load a generator input CSV into a DataFrame, cached by content hash.
+
+    The parsed frame is kept in memory for the current process and, when
+    use_disk_cache is set, pickled under data/cache/generator_inputs so
+    later generator runs skip decoding and parsing altogether.
+
+    Args:
+        path: Path to the CSV file
+        use_disk_cache: Persist and reuse parsed frames across runs
+
+    Returns:
+        A copy of the cached DataFrame (callers may modify it freely)
+    """
+    # pandas is only needed by the CSV-to-DataFrame path
+    import pandas as pd
+
+    data, digest = _read_input(path)
+
+    if digest not in _frame_cache:
+        # Pickled frames are only readable by the pandas version that wrote them
+        cache_file = INPUT_CACHE_PATH / f"{digest}-pandas-{pd.__version__}.pkl"
+        frame = None
+
+        if use_disk_cache and cache_file.exists():
+            try:
+                with open(cache_file, 'rb') as f:
+                    frame = pickle.load(f)
+            except Exception:
+                # Unreadable or incompatible cache entry: rebuild it
+                frame = None
+
+        if frame is None:
+            if digest not in _text_cache:
+                _text_cache[digest] = _decode(data)
+            frame = pd.read_csv(io.StringIO(_text_cache[digest]))
+            if use_disk_cache:
+                INPUT_CACHE_PATH.mkdir(parents=True, exist_ok=True)
+                with open(cache_file, 'wb') as f:
+                    pickle.dump(frame, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        _frame_cache[digest] = frame
+
+    return _frame_cache[digest].copy()
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Render Clinical Intelligence scenario sentences in bulk
+
+Produces the same sentence as updateScenarioText / convertToPersonForm in
+docs/assets/js/main.js (the text a visitor copies from the Cube Explorer)
+for batches of cells, written to sharded JSONL files as evaluation prompts.
+
+The scenario template is compiled once into per-slot fragment tables: every
+item's phrase, with the template text around it and its JSON escaping
+already applied, is precomputed, so rendering a batch is a gather per slot
+plus vectorized string concatenation.
+"""
+
+import argparse
+import json
+import re
+import string
+import sys
+from functools import reduce
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "clinical-skill-mix"))
+
+from dimension_io import load_all_dimensions
+from cell_space import CellSpace
+from cell_ids import load_codec
+
+# Define paths
+BASE_PATH = Path(__file__).parent.parent
+EXPORT_PATH = BASE_PATH / "data" / "exports" / "scenarios"
+
+DEFAULT_BATCH_SIZE = 100_000
+DEFAULT_SHARD_SIZE = 1_000_000
+
+# Sentence shown in the Cube Explorer (whitespace collapsed as in the rendered page)
+SCENARIO_TEMPLATE = (
+    "AI Competency to {authority} {agent} {layer} layer for {task} "
+    "in {condition} during {phase} within the {setting}."
+)
+
+# Role name -> plural person form, as in convertToPersonForm (main.js)
+PERSON_FORMS = {
+    # Medical specialties
+    'Cardiology': 'cardiologists',
+    'Neurology': 'neurologists',
+    'Radiology': 'radiologists',
+    'Oncology': 'oncologists',
+    'Urology': 'urologists',
+    'Anaesthesiology': 'anesthesiologists',
+    'Dermatovenerology': 'dermatovenereologists',
+    'Gastroenterology': 'gastroenterologists',
+    'Haematology': 'hematologists',
+    'Immunology': 'immunologists',
+    'Ophthalmology': 'ophthalmologists',
+    'Otolaryngology': 'otolaryngologists',
+    'General Surgery': 'general surgeons',
+    'Neurological Surgery': 'neurosurgeons',
+    'Paediatric Surgery': 'pediatric surgeons',
+    'Plastic Surgery': 'plastic surgeons',
+    'Thoracic Surgery': 'thoracic surgeons',
+    'Vascular Surgery': 'vascular surgeons',
+    'Orthopaedics': 'orthopedic surgeons',
+    'Internal Medicine': 'internists',
+    'Respiratory Medicine': 'pulmonologists',
+    'Forensic Medicine': 'forensic pathologists',
+    'Occupational Medicine': 'occupational medicine physicians',
+    'Rehabilitative Medicine': 'physiatrists',
+    'Accident And Emergency Medicine': 'emergency medicine physicians',
+    'Infectious Disease': 'infectious disease specialists',
+    'Intensive Care': 'intensivists',
+    'Child Psychiatrist': 'child psychiatrists',
+    'Psychiatrist': 'psychiatrists',
+    'Gerontopsychiatrist': 'gerontopsychiatrists',
+    'Neuropsychiatrist': 'neuropsychiatrists',
+    'Gynaecologist': 'gynaecologists',
+    'Obstetrician': 'obstetricians',
+    'Neonatologist': 'neonatologists',
+    'Paediatrician': 'pediatricians',
+
+    # General roles
+    'Generalist Medical Practitioners': 'generalist medical practitioners',
+    'Specialist Medical Practitioners': 'specialist medical practitioners',
+    'Nursing Professionals': 'nursing professionals',
+    'Midwifery Professionals': 'midwifery professionals',
+    'Paramedical Practitioners': 'paramedical practitioners'
+}
+
+AUTHORITY_VERBS = {
+    'augmentation': 'augment',
+    'monitoring': 'monitor',
+    'automation': 'automate'
+}
+
+
+def _text(value):
+    """Collapse whitespace runs, as the browser does when rendering the sentence"""
+    return ' '.join(value.split())
+
+
+def convert_to_person_form(name):
+    """Plural person form of a provider role name"""
+    return PERSON_FORMS.get(name, name.lower())
+
+
+def agent_possessive(agent_facing, provider_role):
+    """Possessive agent phrase for an agent-facing item and a provider role"""
+    role = convert_to_person_form(provider_role.name)
+    singular = role[:-1] if role.endswith('s') else role
+
+    if agent_facing.id == 'encounter_facing':
+        return f"{singular}-patient encounter's"
+    if agent_facing.id == 'patient_facing':
+        return f"patient's in {singular}-patient care"
+    if agent_facing.id == 'ecosystem_facing':
+        return "healthcare ecosystem's"
+    # provider_facing and anything else: plural possessive (cardiologists')
+    return role + "'"
+
+
+def authority_verb(assigned_authority):
+    name = assigned_authority.name.lower()
+    return AUTHORITY_VERBS.get(name, name)
+
+
+# Template slot -> (dimensions it depends on, phrase for the items of those dimensions)
+SLOTS = {
+    'authority': (('assigned_authority',), authority_verb),
+    'agent': (('agent_facing', 'care_provider_role'), agent_possessive),
+    'layer': (('anchoring_layer',), lambda item: item.name.lower()),
+    'task': (('care_task',), lambda item: item.name.lower()),
+    'condition': (('condition',), lambda item: item.name.lower()),
+    'phase': (('care_phase',), lambda item: item.name.lower()),
+    'setting': (('care_setting',), lambda item: item.name.lower()),
+}
+
+
+class ScenarioRenderer:
+    """
+    Scenario template compiled against the items of a cell space
+
+    Args:
+        space: Cell space whose axes hold the items to render
+        template: Sentence template with {slot} placeholders from SLOTS
+    """
+
+    def __init__(self, space, template=SCENARIO_TEMPLATE):
+        self.space = space
+        self.template = template
+        self.slots = []
+
+        # Each slot's fragments carry the literal text preceding it; the
+        # literal after the last slot is attached to the final slot
+        pieces = list(string.Formatter().parse(template))
+        trailing = ''.join(literal for literal, field, _, _ in pieces if field is None)
+        fields = [(literal, field) for literal, field, _, _ in pieces if field is not None]
+
+        for i, (literal, field) in enumerate(fields):
+            if field not in SLOTS:
+                raise ValueError(f"Unknown template slot: {field}")
+            names, phrase = SLOTS[field]
+            axes = [space.axis(name) for name in names]
+
+            suffix = trailing if i == len(fields) - 1 else ''
+            radices = [space.radices[axis] for axis in axes]
+            fragments = np.empty(int(np.prod(radices)), dtype=object)
+            for flat, positions in enumerate(np.ndindex(*radices)):
+                items = [space.items[axis][p] for axis, p in zip(axes, positions)]
+                fragments[flat] = _json_fragment(
+                    re.sub(r'\s+', ' ', literal) + _text(phrase(*items)) + re.sub(r'\s+', ' ', suffix)
+                )
+
+            self.slots.append((axes, radices, fragments))
+
+    def render_json(self, ranks):
+        """JSON-escaped scenario text (without quotes) for each cell rank"""
+        ranks = np.asarray(ranks, dtype=np.int64)
+        positions = {}
+        parts = []
+        for axes, radices, fragments in self.slots:
+            flat = 0
+            for axis, radix in zip(axes, radices):
+                if axis not in positions:
+                    positions[axis] = (ranks // self.space.strides[axis]) % self.space.radices[axis]
+                flat = flat * radix + positions[axis]
+            parts.append(fragments[flat])
+        return reduce(np.add, parts)
+
+    def render(self, ranks):
+        """Scenario text for each cell rank"""
+        return [json.loads(f'"{text}"') for text in self.render_json(ranks)]
+
+    def render_cell(self, cell):
+        """Scenario text for one cell given as {dimension: item_id}"""
+        return self.render([self.space.rank(cell)])[0]
+
+
+def _json_fragment(text):
+    return json.dumps(text, ensure_ascii=False)[1:-1]
+
+
+def write_scenario_shards(
+    renderer,
+    ranks,
+    output_path=EXPORT_PATH,
+    batch_size=DEFAULT_BATCH_SIZE,
+    shard_size=DEFAULT_SHARD_SIZE,
+    codec=None
+):
+    """
+    Stream rendered scenarios to sharded JSONL files
+
+    Each line is {"cell_id": <packed id>, "rank": <rank>, "text": <scenario>};
+    cell IDs are the stable ids of cell_ids.py, ranks decode to items with
+    CellSpace.unrank.
+
+    Args:
+        renderer: ScenarioRenderer
+        ranks: Iterable of int64 rank arrays (batches), or a single array
+        output_path: Output directory
+        batch_size: Cells rendered per vectorized batch
+        shard_size: Lines per shard file
+        codec: CellIdCodec for the cell IDs (default: latest in cell_ids.json)
+
+    Returns:
+        Manifest dictionary (also written to _manifest.json)
+    """
+    codec = codec or load_codec()
+    output_path = Path(output_path)
+    output_path.mkdir(parents=True, exist_ok=True)
+    if isinstance(ranks, np.ndarray):
+        ranks = [ranks]
+
+    manifest = {'template': renderer.template, **renderer.space.describe(), 'cell_id_version': codec.version,
+                'shards': [], 'total_rows': 0}
+    shard, shard_rows = None, 0
+
+    def open_shard():
+        path = output_path / f"scenarios-{len(manifest['shards']):05d}.jsonl"
+        manifest['shards'].append({'path': path.name, 'rows': 0})
+        return open(path, 'w', encoding='utf-8')
+
+    try:
+        for block in ranks:
+            block = np.asarray(block, dtype=np.int64)
+            for start in range(0, len(block), batch_size):
+                batch = block[start:start + batch_size]
+                cell_ids = codec.encode_ranks(renderer.space, batch)
+                lines = ('{"cell_id":' + np.char.mod('%d', cell_ids).astype(object)
+                         + ',"rank":' + np.char.mod('%d', batch).astype(object) + ',"text":"'
+                         + renderer.render_json(batch) + '"}\n')
+
+                offset = 0
+                while offset < len(lines):
+                    if shard is None or shard_rows == shard_size:
+                        if shard is not None:
+                            shard.close()
+                        shard, shard_rows = open_shard(), 0
+                    take = min(shard_size - shard_rows, len(lines) - offset)
+                    shard.write(''.join(lines[offset:offset + take]))
+                    manifest['shards'][-1]['rows'] += take
+                    manifest['total_rows'] += take
+                    shard_rows += take
+                    offset += take
+    finally:
+        if shard is not None:
+            shard.close()
+
+    with open(output_path / '_manifest.json', 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+
+    return manifest
+
+
+def iter_rank_range(start, count, batch_size=DEFAULT_BATCH_SIZE):
+    """Consecutive cell ranks in batches"""
+    for offset in range(start, start + count, batch_size):
+        yield np.arange(offset, min(offset + batch_size, start + count), dtype=np.int64)
+
+
+def iter_rank_sample(size, count, seed, batch_size=DEFAULT_BATCH_SIZE):
+    """Uniformly sampled cell ranks in batches (with replacement)"""
+    rng = np.random.default_rng(seed)
+    for offset in range(0, count, batch_size):
+        yield rng.integers(0, size, min(batch_size, count - offset), dtype=np.int64)
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--count', type=int, default=DEFAULT_SHARD_SIZE, help='Number of scenarios to render')
+    parser.add_argument('--start', type=int, default=0, help='First cell rank (consecutive mode)')
+    parser.add_argument('--sample', action='store_true', help='Sample cells uniformly instead of a rank range')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument('--shard-size', type=int, default=DEFAULT_SHARD_SIZE)
+    parser.add_argument('--output', type=Path, default=EXPORT_PATH)
+    args = parser.parse_args()
+
+    space = CellSpace.from_dimensions(load_all_dimensions())
+    renderer = ScenarioRenderer(space)
+
+    if args.sample:
+        ranks = iter_rank_sample(space.size, args.count, args.seed, args.batch_size)
+    else:
+        ranks = iter_rank_range(args.start, min(args.count, space.size - args.start), args.batch_size)
+
+    print(f"Rendering {args.count:,} of {space.size:,} scenarios...")
+    manifest = write_scenario_shards(renderer, ranks, args.output, args.batch_size, args.shard_size)
+
+    print(f"✓ Wrote {manifest['total_rows']:,} scenarios in {len(manifest['shards'])} shards")
+    print(f"✓ Saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+Serve the Clinical Intelligence dimensions over a local HTTP/JSON API
+
+Loads all eight dimensions once into DimensionIndex lookups and a CellSpace
+and answers GET requests on a single asyncio event loop (standard library
+only, HTTP/1.1 keep-alive). Responses are cached as encoded bytes in an LRU
+keyed by the request target.
+
+Endpoints (query parameters in brackets):
+  /dimensions                                      dimension summaries and the cell space
+  /items         [dimension, depth?]               all items, or those at one depth
+  /item          [dimension, id]                   one item
+  /children      [dimension, id]                   direct children
+  /ancestors     [dimension, id]                   ancestors, root first
+  /descendants   [dimension, id, depth?]           all descendants, or those at one depth
+  /expand        [dimension, id, depth]            expand_to_depth
+  /cells/count   [<dimension>=<item id> ...]       cells, optionally under given items
+  /cell          [rank | id]                       items of the cell with a rank or packed cell id
+  /cells/sample  [count, seed?, <dimension>=<id>]  random cells (cached only with a seed)
+
+Cells are returned as {"cell_id", "rank", "cell"}: cell_id is the stable
+packed id from cell_ids.py, rank the position in the current CellSpace.
+  /stats                                           request and cache counters
+
+Example:
+    python code/serve_dimensions.py --port 8765
+    curl 'http://127.0.0.1:8765/expand?dimension=condition&id=chapter-i&depth=1'
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import traceback
+from collections import OrderedDict
+from http import HTTPStatus
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "clinical-skill-mix"))
+
+from dimension_io import model_to_dict, load_all_dimensions
+from dimension_index import index_dimensions
+from cell_space import CellSpace
+from cell_ids import load_codecs, cell_id_version
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+DEFAULT_CACHE_SIZE = 4096
+
+# Largest /cells/sample count
+MAX_SAMPLE = 1000
+
+
+class QueryError(Exception):
+    """Request that cannot be answered (carries the HTTP status)"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _encode(payload):
+    return json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+class DimensionQueryService:
+    """
+    Query handlers over indexed dimensions with an LRU response cache
+
+    Args:
+        dimensions: Loaded dimensions keyed by name
+        cache_size: Number of encoded responses kept
+        codecs: Cell-id codecs by version (default: load_codecs())
+    """
+
+    def __init__(self, dimensions, cache_size=DEFAULT_CACHE_SIZE, codecs=None):
+        self.indexes = index_dimensions(dimensions)
+        self.space = CellSpace.from_dimensions(dimensions)
+        self.codecs = codecs or load_codecs()
+        self.codec = self.codecs[max(self.codecs)]
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.counters = {'requests': 0, 'hits': 0, 'misses': 0}
+
+        self.routes = {
+            '/dimensions': self.dimensions,
+            '/items': self.items,
+            '/item': self.item,
+            '/children': self.children,
+            '/ancestors': self.ancestors,
+            '/descendants': self.descendants,
+            '/expand': self.expand,
+            '/cells/count': self.cell_count,
+            '/cell': self.cell,
+            '/cells/sample': self.sample_cells,
+        }
+
+    # -------------------------------------------------------------------------
+    # Dispatch
+    # -------------------------------------------------------------------------
+
+    def respond(self, target):
+        """
+        Status and encoded JSON body for a GET request target
+
+        Returns:
+            (HTTPStatus, bytes)
+        """
+        self.counters['requests'] += 1
+        cached = self.cache.get(target)
+        if cached is not None:
+            self.cache.move_to_end(target)
+            self.counters['hits'] += 1
+            return cached
+        self.counters['misses'] += 1
+
+        url = urlsplit(target)
+        if url.path == '/stats':
+            return HTTPStatus.OK, _encode({**self.counters, 'cache_entries': len(self.cache)})
+
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        try:
+            handler = self.routes.get(url.path)
+            if handler is None:
+                raise QueryError(HTTPStatus.NOT_FOUND, f'Unknown endpoint: {url.path}')
+            response = HTTPStatus.OK, _encode(handler(params))
+        except QueryError as e:
+            return e.status, _encode({'error': str(e)})
+        except KeyError as e:
+            return HTTPStatus.NOT_FOUND, _encode({'error': e.args[0]})
+        except Exception as e:
+            # Handler bug: log it and answer 500, never cached so a fix or retry is seen
+            print(f"Error answering {target}:", file=sys.stderr)
+            traceback.print_exc()
+            return HTTPStatus.INTERNAL_SERVER_ERROR, _encode({'error': f'Internal error: {type(e).__name__}'})
+
+        # Unseeded samples differ on every call
+        if url.path != '/cells/sample' or 'seed' in params:
+            self.cache[target] = response
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        return response
+
+    # -------------------------------------------------------------------------
+    # Parameters
+    # -------------------------------------------------------------------------
+
+    def _index(self, params):
+        name = self._require(params, 'dimension')
+        if name not in self.indexes:
+            raise QueryError(HTTPStatus.NOT_FOUND, f'Unknown dimension: {name}')
+        return self.indexes[name]
+
+    @staticmethod
+    def _require(params, key):
+        if key not in params:
+            raise QueryError(HTTPStatus.BAD_REQUEST, f'Missing parameter: {key}')
+        return params[key]
+
+    @staticmethod
+    def _int(params, key, default=None):
+        if key not in params:
+            if default is None:
+                raise QueryError(HTTPStatus.BAD_REQUEST, f'Missing parameter: {key}')
+            return default
+        try:
+            return int(params[key])
+        except ValueError:
+            raise QueryError(HTTPStatus.BAD_REQUEST, f'Parameter {key} must be an integer') from None
+
+    def _axis_positions(self, params):
+        """Allowed positions on each cell axis, restricted by <dimension>=<item id> parameters"""
+        allowed = []
+        for axis, name in enumerate(self.space.names):
+            positions = self.space.positions[axis]
+            if name not in params:
+                allowed.append(range(self.space.radices[axis]))
+                continue
+            index = self.indexes[name]
+            item = index.get(params[name])
+            under = [positions[i.id] for i in [item] + index.descendants(item.id) if i.id in positions]
+            if not under:
+                raise QueryError(HTTPStatus.BAD_REQUEST, f'No {name} cells under {item.id}')
+            allowed.append(under)
+        return allowed
+
+    # -------------------------------------------------------------------------
+    # Handlers
+    # -------------------------------------------------------------------------
+
+    def dimensions(self, params):
+        return {
+            'dimensions': [
+                {
+                    'name': name,
+                    'description': index.dimension.description,
+                    'item_count': len(index.items),
+                    'max_depth': index.max_depth,
+                    'levels': index.dimension.hierarchy.levels,
+                }
+                for name, index in self.indexes.items()
+            ],
+            'cell_space': self.space.describe(),
+        }
+
+    def items(self, params):
+        index = self._index(params)
+        items = index.items_at_depth(self._int(params, 'depth')) if 'depth' in params else index.items
+        return {'items': [model_to_dict(item) for item in items]}
+
+    def item(self, params):
+        return model_to_dict(self._index(params).get(self._require(params, 'id')))
+
+    def children(self, params):
+        return {'items': [model_to_dict(item) for item in self._index(params).children(self._require(params, 'id'))]}
+
+    def ancestors(self, params):
+        return {'items': [model_to_dict(item) for item in self._index(params).ancestors(self._require(params, 'id'))]}
+
+    def descendants(self, params):
+        index = self._index(params)
+        depth = self._int(params, 'depth') if 'depth' in params else None
+        return {'items': [model_to_dict(item) for item in index.descendants(self._require(params, 'id'), depth)]}
+
+    def expand(self, params):
+        index = self._index(params)
+        items = index.expand_to_depth(self._require(params, 'id'), self._int(params, 'depth'))
+        return {'items': [model_to_dict(item) for item in items]}
+
+    def cell_count(self, params):
+        allowed = self._axis_positions(params)
+        counts = {name: len(positions) for name, positions in zip(self.space.names, allowed)}
+        total = 1
+        for count in counts.values():
+            total *= count
+        return {'cells': total, 'axes': counts}
+
+    def _cell_ids(self, ranks):
+        return self.codec.encode_ranks(self.space, np.array(ranks, dtype=np.int64)).tolist()
+
+    def cell(self, params):
+        if 'id' in params:
+            cell_id = self._int(params, 'id')
+            version = int(cell_id_version(np.array([cell_id]))[0])
+            if cell_id < 0 or version not in self.codecs:
+                raise QueryError(HTTPStatus.NOT_FOUND, f'Unknown cell id version: {version}')
+            rank = int(self.codecs[version].decode_ranks(self.space, np.array([cell_id]))[0])
+        else:
+            rank = self._int(params, 'rank')
+            if not 0 <= rank < self.space.size:
+                raise QueryError(HTTPStatus.BAD_REQUEST, f'Rank must be in [0, {self.space.size})')
+        return {'cell_id': self._cell_ids([rank])[0], 'rank': rank, 'cell': self.space.unrank(rank)}
+
+    def sample_cells(self, params):
+        count = self._int(params, 'count', 1)
+        if not 1 <= count <= MAX_SAMPLE:
+            raise QueryError(HTTPStatus.BAD_REQUEST, f'Count must be between 1 and {MAX_SAMPLE}')
+        rng = random.Random(self._int(params, 'seed') if 'seed' in params else None)
+        allowed = self._axis_positions(params)
+
+        picks = [[rng.choice(positions) for positions in allowed] for _ in range(count)]
+        ranks = [sum(index * stride for index, stride in zip(indices, self.space.strides)) for indices in picks]
+        return {'cells': [
+            {
+                'cell_id': cell_id,
+                'rank': rank,
+                'cell': {name: self.space.items[axis][index].id
+                         for axis, (name, index) in enumerate(zip(self.space.names, indices))}
+            }
+            for indices, rank, cell_id in zip(picks, ranks, self._cell_ids(ranks))
+        ]}
+
+
+# =============================================================================
+# HTTP
+# =============================================================================
+
+async def handle_connection(service, reader, writer):
+    """Serve GET requests on one connection until the client closes it"""
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                    break
+                key, _, value = line.decode('latin-1').partition(':')
+                headers[key.strip().lower()] = value.strip().lower()
+
+            # Request bodies are not used, but must be consumed to keep the stream in sync
+            length = headers.get('content-length', '0')
+            if length.isdigit() and int(length) > 0:
+                await reader.readexactly(int(length))
+
+            try:
+                method, target, version = request_line.decode('latin-1').split()
+            except ValueError:
+                writer.write(_http_response(HTTPStatus.BAD_REQUEST, _encode({'error': 'Malformed request'}), False))
+                break
+
+            keep_alive = (headers.get('connection') != 'close' if version == 'HTTP/1.1'
+                          else headers.get('connection') == 'keep-alive')
+
+            if method == 'GET':
+                status, body = service.respond(target)
+            else:
+                status, body = HTTPStatus.METHOD_NOT_ALLOWED, _encode({'error': f'Unsupported method: {method}'})
+
+            writer.write(_http_response(status, body, keep_alive))
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    except Exception:
+        # Anything else would silently drop the connection: log it and send a 500
+        print("Error handling connection:", file=sys.stderr)
+        traceback.print_exc()
+        try:
+            writer.write(_http_response(
+                HTTPStatus.INTERNAL_SERVER_ERROR, _encode({'error': 'Internal error'}), False
+            ))
+            await writer.drain()
+        except ConnectionError:
+            pass
+    finally:
+        writer.close()
+
+
+def _http_response(status, body, keep_alive):
+    head = (
+        f'HTTP/1.1 {status.value} {status.phrase}\r\n'
+        f'Content-Type: application/json; charset=utf-8\r\n'
+        f'Content-Length: {len(body)}\r\n'
+        f'Connection: {"keep-alive" if keep_alive else "close"}\r\n\r\n'
+    )
+    return head.encode('latin-1') + body
+
+
+async def serve(service, host=DEFAULT_HOST, port=DEFAULT_PORT):
+    server = await asyncio.start_server(
+        lambda reader, writer: handle_connection(service, reader, writer), host, port
+    )
+    print(f"✓ Serving {len(service.indexes)} dimensions on http://{host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    """Main execution function."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--cache-size', type=int, default=DEFAULT_CACHE_SIZE, help='Cached responses (LRU)')
+    args = parser.parse_args()
+
+    print("Loading dimensions...")
+    service = DimensionQueryService(load_all_dimensions(), args.cache_size)
+
+    try:
+        asyncio.run(serve(service, args.host, args.port))
+    except KeyboardInterrupt:
+        print("\nStopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,7 @@ Count values within each dimension of the Clinical World Model
 Analyzes all 8 dimensions (5C + 3A) and provides detailed statistics
 """
 
-import json
+import sys
 from pathlib import Path
 from collections import defaultdict
 
@@ -12,6 +12,11 @@ from collections import defaultdict
 BASE_PATH = Path(__file__).parent.parent.parent
 SKILL_MIX_PATH = BASE_PATH / "clinical-skill-mix"
 
+# Add clinical-skill-mix directory to path for imports
+sys.path.insert(0, str(SKILL_MIX_PATH))
+
+from dimension_io import DimensionReader
+
 # All 8 dimensions
 DIMENSIONS = [
     # Clinical Competency Space (5C)
@@ -33,16 +38,15 @@ def analyze_dimension(dimension_name):
     if not json_file.exists():
         return None
 
-    with open(json_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-
-    items = data.get('items', [])
-
-    # Count by depth
+    # Stream items one at a time; only depth counts are kept in memory
+    total_items = 0
     depth_counts = defaultdict(int)
-    for item in items:
-        depth = item.get('depth', 0)
-        depth_counts[depth] += 1
+    with DimensionReader(json_file) as reader:
+        for item in reader.iter_raw_items():
+            depth = item.get('depth', 0)
+            depth_counts[depth] += 1
+            total_items += 1
+        data = {**reader.header, **reader.trailer}
 
     # Get hierarchy info
     hierarchy = data.get('hierarchy', {})
@@ -52,7 +56,7 @@ def analyze_dimension(dimension_name):
     return {
         'dimension': data.get('dimension', dimension_name),
         'description': data.get('description', '')[:100] + '...',
-        'total_items': len(items),
+        'total_items': total_items,
         'depth_counts': dict(depth_counts),
         'max_depth': max_depth,
         'hierarchy_levels': levels,
@@ -150,7 +154,8 @@ def main():
     care_phases = results_5c[1]['total_items']  # all phases (flat)
     care_settings = results_5c[2]['total_items']  # all settings (flat)
     care_task_leaf = results_5c[3]['depth_counts'].get(1, 0)  # tasks at depth 1
-    care_provider_all = results_5c[4]['total_items']  # ALL provider roles (86 total)
+    # Occupations and specialties (86); subspecialties at depth 2 only refine them
+    care_provider_all = results_5c[4]['depth_counts'].get(0, 0) + results_5c[4]['depth_counts'].get(1, 0)
 
     # Get counts for 3A (all flat)
     agent_facing = results_3a[0]['total_items']
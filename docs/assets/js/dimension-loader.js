@@ -3,57 +3,56 @@
  * Fetches JSON files and processes them for visualization
  */
 
-// Cache for loaded dimensions
-const dimensionCache = new Map();
-
 // Current dimension data
 let currentDimensionData = null;
 
+// Most recently requested dimension (earlier requests still in flight are not displayed)
+let requestedDimension = null;
+
+// Virtualized tree and list rows: estimated heights in px (including the gap between
+// rows) until a row has been rendered and measured
+const TREE_ROW_HEIGHT = 92;
+const LIST_ROW_HEIGHT = 120;
+const METADATA_ROW_HEIGHT = 36;
+const VIRTUAL_ROW_GAP = 8;
+const VIRTUAL_MAX_HEIGHT = 600;
+// Rows kept rendered above and below the visible window
+const VIRTUAL_OVERSCAN = 6;
+
+// Delay after the last keystroke before a list search runs (ms)
+const SEARCH_DEBOUNCE_MS = 150;
+
+// Search worker (assets/js/search-worker.js), started on first use
+let searchWorker = null;
+let searchWorkerFailed = false;
+let searchRequestCounter = 0;
+const pendingSearches = new Map(); // request id -> { resolve, fallback }
+const indexedSearchItems = new Map(); // dimension -> item count indexed in the worker
+
 /**
- * Load dimension data from JSON file
+ * Load dimension data (shared with the Cube Explorer through DimensionStore)
  */
 async function loadDimension(dimensionName) {
+    requestedDimension = dimensionName;
+
     try {
         // Show loading state
         updateLoadingState(true);
 
-        // Check cache first
-        if (dimensionCache.has(dimensionName)) {
-            const cachedData = dimensionCache.get(dimensionName);
-            currentDimensionData = cachedData;
-            displayDimension(cachedData);
-            updateLoadingState(false, dimensionName);
-            return cachedData;
+        // Info panels only need the sidecar, so paint them before the items arrive
+        if (!DimensionStore.isLoaded(dimensionName)) {
+            DimensionStore.loadDimensionSidecar(dimensionName).then(sidecar => {
+                if (sidecar && requestedDimension === dimensionName && !DimensionStore.isLoaded(dimensionName)) {
+                    updateInfoPanels(sidecar);
+                }
+            });
         }
 
-        // Map dimension names to file names (some are plural)
-        const fileNameMap = {
-            'condition': 'conditions',
-            'care_phase': 'care_phases',
-            'care_setting': 'care_settings',
-            'care_task': 'care_task',
-            'care_provider_role': 'care_provider_role',
-            'agent_facing': 'agent_facing',
-            'anchoring_layer': 'anchoring_layer',
-            'assigned_authority': 'assigned_authority'
-        };
-
-        const fileName = fileNameMap[dimensionName] || dimensionName;
-
-        // Fetch dimension data
-        const response = await fetch(`clinical-skill-mix/${fileName}.json`);
-        
-        if (!response.ok) {
-            throw new Error(`Failed to load ${dimensionName}: ${response.status}`);
+        const processedData = await DimensionStore.loadDimensionData(dimensionName);
+        if (requestedDimension !== dimensionName) {
+            return processedData;
         }
-        
-        const data = await response.json();
-        
-        // Process and validate data
-        const processedData = processDimensionData(data);
-        
-        // Cache the data
-        dimensionCache.set(dimensionName, processedData);
+
         currentDimensionData = processedData;
         
         // Display the dimension
@@ -78,100 +77,25 @@ async function loadDimension(dimensionName) {
     }
 }
 
-/**
- * Process raw dimension data
- */
-function processDimensionData(rawData) {
-    const processedData = {
-        ...rawData,
-        statistics: calculateDimensionStatistics(rawData),
-        hierarchyMap: buildHierarchyMap(rawData.items),
-        maxDepth: Math.max(...rawData.items.map(item => item.depth))
-    };
-    
-    return processedData;
-}
-
-/**
- * Calculate dimension statistics
- */
-function calculateDimensionStatistics(data) {
-    const items = data.items || [];
-    
-    const stats = {
-        totalItems: items.length,
-        itemsByDepth: {},
-        averageChildrenPerParent: 0,
-        maxChildren: 0,
-        leafNodes: 0
-    };
-    
-    // Count items by depth
-    items.forEach(item => {
-        const depth = item.depth;
-        stats.itemsByDepth[depth] = (stats.itemsByDepth[depth] || 0) + 1;
-        
-        // Count leaf nodes (items with no children)
-        if (!item.children_ids || item.children_ids.length === 0) {
-            stats.leafNodes++;
-        }
-        
-        // Track max children
-        if (item.children_ids) {
-            stats.maxChildren = Math.max(stats.maxChildren, item.children_ids.length);
-        }
-    });
-    
-    // Calculate average children per parent
-    const parents = items.filter(item => item.children_ids && item.children_ids.length > 0);
-    if (parents.length > 0) {
-        const totalChildren = parents.reduce((sum, parent) => sum + parent.children_ids.length, 0);
-        stats.averageChildrenPerParent = (totalChildren / parents.length).toFixed(1);
-    }
-    
-    return stats;
-}
-
-/**
- * Build hierarchy map for quick lookups
- */
-function buildHierarchyMap(items) {
-    const hierarchyMap = {
-        byId: new Map(),
-        byDepth: new Map(),
-        parents: new Map(),
-        children: new Map()
-    };
-    
-    // Index by ID
-    items.forEach(item => {
-        hierarchyMap.byId.set(item.id, item);
-        
-        // Index by depth
-        if (!hierarchyMap.byDepth.has(item.depth)) {
-            hierarchyMap.byDepth.set(item.depth, []);
-        }
-        hierarchyMap.byDepth.get(item.depth).push(item);
-        
-        // Index parent-child relationships
-        if (item.parent_id) {
-            hierarchyMap.parents.set(item.id, item.parent_id);
-        }
-        
-        if (item.children_ids && item.children_ids.length > 0) {
-            hierarchyMap.children.set(item.id, item.children_ids);
-        }
-    });
-    
-    return hierarchyMap;
-}
-
 /**
  * Display dimension data in the visualization area
  */
 function displayDimension(data) {
     const container = document.getElementById('dimension-visualization');
     const viewMode = getSelectedViewMode();
+
+    // The list view shows every item, so all shards are needed first
+    if (viewMode === 'list' && Object.keys(data.shards || {}).some(rootId => DimensionStore.hasPendingShard(data, rootId))) {
+        showLoading(container);
+        DimensionStore.loadAllDimensionShards(data)
+            .then(() => {
+                if (currentDimensionData === data) {
+                    displayDimension(data);
+                }
+            })
+            .catch(error => showError(container, `Failed to load ${data.dimension} items: ${error.message}`));
+        return;
+    }
     
     // Clear container
     container.innerHTML = '';
@@ -202,6 +126,9 @@ function getSelectedViewMode() {
 
 /**
  * Render hierarchical view
+ * The tree is a flat, preorder array of visible rows; expanding or
+ * collapsing a node splices its subtree in or out of that array and only
+ * the rows inside the scroll window are rendered
  */
 function renderHierarchicalView(container, data) {
     const hierarchyDiv = createElement('div', 'hierarchy-view');
@@ -224,30 +151,44 @@ function renderHierarchicalView(container, data) {
     
     // Create tree structure
     const treeContainer = createElement('div', 'tree-container');
-    const rootItems = data.items.filter(item => item.depth === 0);
-    
-    rootItems.forEach(rootItem => {
-        const treeNode = createTreeNode(rootItem, data);
-        treeContainer.appendChild(treeNode);
-    });
-    
     hierarchyDiv.appendChild(treeContainer);
     container.appendChild(hierarchyDiv);
+
+    const tree = {
+        rows: data.items.filter(item => item.depth === 0),
+        expanded: new Set(),
+        loading: new Set()
+    };
+    const rowHeight = TREE_ROW_HEIGHT + (shouldShowMetadata() ? METADATA_ROW_HEIGHT : 0);
+    const rows = createVirtualList(treeContainer, rowHeight, index => createTreeNode(tree.rows[index], data, tree));
+
+    treeContainer.addEventListener('click', function(event) {
+        const row = event.target.closest('.virtual-row');
+        if (row) {
+            toggleTreeRow(tree, Number(row.dataset.index), data, rows);
+        }
+    });
+
+    rows.setRowCount(tree.rows.length);
 }
 
 /**
- * Create tree node for hierarchical view
+ * Create tree node (one row) for hierarchical view
  */
-function createTreeNode(item, data) {
+function createTreeNode(item, data, tree) {
     const nodeDiv = createElement('div', `tree-node depth-${item.depth}`);
     
     // Node header
     const nodeHeader = createElement('div', 'node-header');
-    const hasChildren = item.children_ids && item.children_ids.length > 0;
+    const pendingShard = DimensionStore.hasPendingShard(data, item.id);
+    const hasChildren = pendingShard || (item.children_ids && item.children_ids.length > 0);
+    const childCount = pendingShard ? data.shards[item.id].count : (item.children_ids || []).length;
+    const isExpanded = tree.expanded.has(item.id);
+    const toggleSymbol = tree.loading.has(item.id) ? '…' : isExpanded ? '▼' : '▶';
     
     nodeHeader.innerHTML = `
-        <div class="node-toggle ${hasChildren ? 'expandable' : 'leaf'}">
-            ${hasChildren ? '▶' : '•'}
+        <div class="node-toggle ${hasChildren ? 'expandable' : 'leaf'}${isExpanded ? ' expanded' : ''}">
+            ${hasChildren ? toggleSymbol : '•'}
         </div>
         <div class="node-icon">
             ${getNodeIcon(item, data.dimension)}
@@ -258,51 +199,222 @@ function createTreeNode(item, data) {
             ${shouldShowMetadata() ? createMetadataHTML(item) : ''}
         </div>
         <div class="node-badge">
-            ${hasChildren ? item.children_ids.length : ''}
+            ${hasChildren ? childCount : ''}
         </div>
     `;
     
     nodeDiv.appendChild(nodeHeader);
-    
-    // Children container
-    if (hasChildren) {
-        const childrenContainer = createElement('div', 'node-children collapsed');
-        
-        item.children_ids.forEach(childId => {
-            const childItem = data.hierarchyMap.byId.get(childId);
-            if (childItem) {
-                const childNode = createTreeNode(childItem, data);
-                childrenContainer.appendChild(childNode);
-            }
-        });
-        
-        nodeDiv.appendChild(childrenContainer);
-        
-        // Add click handler for expansion
-        nodeHeader.addEventListener('click', function() {
-            toggleNodeExpansion(nodeDiv, childrenContainer);
-        });
-    }
-    
     return nodeDiv;
 }
 
 /**
- * Toggle node expansion
+ * Expand or collapse the tree row at index (fetching its shard on first expand)
  */
-function toggleNodeExpansion(nodeDiv, childrenContainer) {
-    const toggle = nodeDiv.querySelector('.node-toggle');
-    const isExpanded = !childrenContainer.classList.contains('collapsed');
-    
-    if (isExpanded) {
-        childrenContainer.classList.add('collapsed');
-        toggle.textContent = '▶';
-        toggle.classList.remove('expanded');
-    } else {
-        childrenContainer.classList.remove('collapsed');
-        toggle.textContent = '▼';
-        toggle.classList.add('expanded');
+function toggleTreeRow(tree, index, data, rows) {
+    const item = tree.rows[index];
+
+    if (tree.expanded.has(item.id)) {
+        // Visible descendants directly follow the item in preorder
+        let end = index + 1;
+        while (end < tree.rows.length && tree.rows[end].depth > item.depth) {
+            end++;
+        }
+        tree.rows.splice(index + 1, end - index - 1);
+        tree.expanded.delete(item.id);
+        rows.setRowCount(tree.rows.length, index);
+        return;
+    }
+
+    if (DimensionStore.hasPendingShard(data, item.id)) {
+        if (tree.loading.has(item.id)) {
+            return;
+        }
+        tree.loading.add(item.id);
+        rows.setRowCount(tree.rows.length, index);
+
+        DimensionStore.loadDimensionShard(data, item.id)
+            .catch(error => console.error(`Error loading children of ${item.id}:`, error))
+            .then(() => {
+                tree.loading.delete(item.id);
+                const current = tree.rows.indexOf(item);
+                if (current === -1) {
+                    return;
+                }
+                if (DimensionStore.hasPendingShard(data, item.id)) {
+                    rows.setRowCount(tree.rows.length, current);
+                } else {
+                    toggleTreeRow(tree, current, data, rows);
+                }
+            });
+        return;
     }
+
+    if (!item.children_ids || item.children_ids.length === 0) {
+        return;
+    }
+
+    tree.expanded.add(item.id);
+    tree.rows.splice(index + 1, 0, ...visibleDescendants(item, data, tree.expanded));
+    rows.setRowCount(tree.rows.length, index);
+}
+
+/**
+ * Descendants shown under an expanded item, in preorder
+ */
+function visibleDescendants(item, data, expanded, rows = []) {
+    (item.children_ids || []).forEach(childId => {
+        const childItem = data.hierarchyMap.byId.get(childId);
+        if (childItem) {
+            rows.push(childItem);
+            if (expanded.has(childId)) {
+                visibleDescendants(childItem, data, expanded, rows);
+            }
+        }
+    });
+    return rows;
+}
+
+/**
+ * Windowed rendering of variable-height rows inside a scroll container
+ * Only rows in (or near) the visible window exist in the DOM; renderRow(index)
+ * builds the element for one row. Rows start at an estimated height and are
+ * positioned by their measured heights once rendered, so text wraps in full.
+ */
+function createVirtualList(viewport, estimatedHeight, renderRow) {
+    const spacer = createElement('div', 'virtual-spacer');
+    viewport.classList.add('virtual-viewport');
+    viewport.appendChild(spacer);
+
+    const rendered = new Map(); // row index -> element
+    const heights = [];         // measured row heights (including the gap), by index
+    let offsets = [0];          // offsets[i]: top of row i; offsets[rowCount]: total height
+    let validOffsets = 0;       // offsets[0..validOffsets] are up to date
+    let rowCount = 0;
+    let frame = null;
+    let width = viewport.clientWidth;
+
+    function offsetOf(index) {
+        for (let i = validOffsets; i < index; i++) {
+            offsets[i + 1] = offsets[i] + (heights[i] || estimatedHeight);
+        }
+        validOffsets = Math.max(validOffsets, index);
+        return offsets[index];
+    }
+
+    function invalidateFrom(index) {
+        validOffsets = Math.min(validOffsets, index);
+    }
+
+    function rowAt(top) {
+        // Last row starting at or above top (binary search over the offsets)
+        let low = 0;
+        let high = Math.max(0, rowCount - 1);
+        offsetOf(rowCount);
+        while (low < high) {
+            const mid = (low + high + 1) >> 1;
+            if (offsets[mid] <= top) {
+                low = mid;
+            } else {
+                high = mid - 1;
+            }
+        }
+        return low;
+    }
+
+    function updateSize() {
+        const total = offsetOf(rowCount);
+        spacer.style.height = `${total}px`;
+        viewport.style.height = `${Math.min(VIRTUAL_MAX_HEIGHT, total)}px`;
+    }
+
+    function renderWindow() {
+        frame = null;
+        const height = viewport.clientHeight || VIRTUAL_MAX_HEIGHT;
+        const first = Math.max(0, rowAt(viewport.scrollTop) - VIRTUAL_OVERSCAN);
+        const last = Math.min(rowCount, rowAt(viewport.scrollTop + height) + 1 + VIRTUAL_OVERSCAN);
+
+        rendered.forEach((element, index) => {
+            if (index < first || index >= last) {
+                element.remove();
+                rendered.delete(index);
+            }
+        });
+
+        const added = [];
+        for (let index = first; index < last; index++) {
+            if (!rendered.has(index)) {
+                const element = renderRow(index);
+                element.classList.add('virtual-row');
+                element.dataset.index = index;
+                element.style.top = `${offsetOf(index)}px`;
+                viewport.appendChild(element);
+                rendered.set(index, element);
+                added.push(index);
+            }
+        }
+
+        // Measure new rows; if any differs from its estimate, reposition and fill the window again
+        let changedFrom = Infinity;
+        added.forEach(index => {
+            const measured = rendered.get(index).offsetHeight + VIRTUAL_ROW_GAP;
+            if (measured > VIRTUAL_ROW_GAP && measured !== (heights[index] || estimatedHeight)) {
+                heights[index] = measured;
+                changedFrom = Math.min(changedFrom, index);
+            }
+        });
+        if (changedFrom !== Infinity) {
+            invalidateFrom(changedFrom + 1);
+            rendered.forEach((element, index) => {
+                if (index > changedFrom) {
+                    element.style.top = `${offsetOf(index)}px`;
+                }
+            });
+            updateSize();
+            if (frame === null) {
+                frame = requestAnimationFrame(renderWindow);
+            }
+        }
+    }
+
+    function rerender(changedFrom) {
+        heights.length = Math.min(heights.length, changedFrom);
+        invalidateFrom(changedFrom);
+        rendered.forEach((element, index) => {
+            if (index >= changedFrom) {
+                element.remove();
+                rendered.delete(index);
+            }
+        });
+        updateSize();
+        renderWindow();
+    }
+
+    viewport.addEventListener('scroll', function() {
+        if (frame === null) {
+            frame = requestAnimationFrame(renderWindow);
+        }
+    }, { passive: true });
+
+    // Rows rewrap when the viewport width changes: measure them again
+    if (window.ResizeObserver) {
+        new ResizeObserver(() => {
+            if (viewport.clientWidth !== width) {
+                width = viewport.clientWidth;
+                rerender(0);
+            }
+        }).observe(viewport);
+    }
+
+    return {
+        /**
+         * Update the row count; rows from changedFrom onwards are re-rendered and re-measured
+         */
+        setRowCount(count, changedFrom = 0) {
+            rowCount = count;
+            offsets.length = Math.min(offsets.length, count + 1);
+            rerender(changedFrom);
+        }
+    };
 }
 
 /**
@@ -403,33 +515,67 @@ function renderListView(container, data) {
     
     // Create list container
     const listContainer = createElement('div', 'list-container');
+    listDiv.appendChild(listContainer);
+    container.appendChild(listDiv);
     
     // Sort items by depth, then by name
     const sortedItems = [...data.items].sort((a, b) => {
         if (a.depth !== b.depth) return a.depth - b.depth;
         return a.name.localeCompare(b.name);
     });
-    
-    sortedItems.forEach(item => {
-        const listItem = createListItem(item, data);
-        listContainer.appendChild(listItem);
+    indexSearchItems(data.dimension, sortedItems);
+
+    let visibleItems = sortedItems;
+    let highlights = new Map();
+    const rowHeight = LIST_ROW_HEIGHT + (shouldShowMetadata() ? METADATA_ROW_HEIGHT : 0);
+    const rows = createVirtualList(listContainer, rowHeight, index => {
+        const item = visibleItems[index];
+        return createListItem(item, data, highlights.get(item.id));
     });
-    
-    listDiv.appendChild(listContainer);
-    container.appendChild(listDiv);
+    rows.setRowCount(visibleItems.length);
     
     // Add search functionality
     const searchInput = header.querySelector('.search-input');
     const depthFilter = header.querySelector('.depth-filter');
+    let searchTimer = null;
+    let latestSearch = 0;
+
+    const showItems = (items, itemHighlights) => {
+        visibleItems = filterListItems(items, '', depthFilter.value);
+        highlights = itemHighlights;
+        listContainer.scrollTop = 0;
+        rows.setRowCount(visibleItems.length);
+    };
+
+    const applyFilter = () => {
+        const search = ++latestSearch;
+        const query = searchInput.value.trim();
+        if (!query) {
+            showItems(sortedItems, new Map());
+            return;
+        }
+
+        searchDimensionItems(data.dimension, sortedItems, query).then(results => {
+            if (search === latestSearch) {
+                showItems(
+                    results.map(result => data.hierarchyMap.byId.get(result.id)).filter(Boolean),
+                    new Map(results.map(result => [result.id, result]))
+                );
+            }
+        });
+    };
     
-    searchInput.addEventListener('input', () => filterListItems(searchInput.value, depthFilter.value, listContainer));
-    depthFilter.addEventListener('change', () => filterListItems(searchInput.value, depthFilter.value, listContainer));
+    searchInput.addEventListener('input', () => {
+        clearTimeout(searchTimer);
+        searchTimer = setTimeout(applyFilter, SEARCH_DEBOUNCE_MS);
+    });
+    depthFilter.addEventListener('change', applyFilter);
 }
 
 /**
- * Create list item
+ * Create list item (highlights: search match ranges for name and description)
  */
-function createListItem(item, data) {
+function createListItem(item, data, highlights) {
     const listItem = createElement('div', `list-item depth-${item.depth}`);
     
     listItem.innerHTML = `
@@ -437,9 +583,9 @@ function createListItem(item, data) {
             ${getNodeIcon(item, data.dimension)}
         </div>
         <div class="list-item-content">
-            <div class="list-item-title">${item.name}</div>
+            <div class="list-item-title">${highlightOffsets(item.name, highlights && highlights.name)}</div>
             <div class="list-item-path">${item.path_components.join(' › ')}</div>
-            <div class="list-item-description">${item.description || ''}</div>
+            <div class="list-item-description">${highlightOffsets(item.description || '', highlights && highlights.description)}</div>
             ${shouldShowMetadata() ? createMetadataHTML(item) : ''}
         </div>
         <div class="list-item-badge">
@@ -455,24 +601,100 @@ function createListItem(item, data) {
 }
 
 /**
- * Filter list items
+ * Filter list items (by name or description, and depth) on the main thread
+ * Used for the depth filter and when the search worker is unavailable
  */
-function filterListItems(searchTerm, depthFilter, container) {
-    const items = container.querySelectorAll('.list-item');
+function filterListItems(items, searchTerm, depthFilter) {
+    const queryTokens = searchQueryTokens(searchTerm);
     
-    items.forEach(item => {
-        const title = item.querySelector('.list-item-title').textContent.toLowerCase();
-        const description = item.querySelector('.list-item-description').textContent.toLowerCase();
-        const depthClass = Array.from(item.classList).find(cls => cls.startsWith('depth-'));
-        const itemDepth = depthClass ? depthClass.replace('depth-', '') : '0';
+    return items.filter(item => {
+        const matchesSearch = !searchTerm.trim() || matchesSearchQuery(item, queryTokens);
         
-        const matchesSearch = !searchTerm || 
-            title.includes(searchTerm.toLowerCase()) || 
-            description.includes(searchTerm.toLowerCase());
+        const matchesDepth = depthFilter === 'all' || String(item.depth) === depthFilter;
         
-        const matchesDepth = depthFilter === 'all' || itemDepth === depthFilter;
-        
-        item.style.display = matchesSearch && matchesDepth ? 'flex' : 'none';
+        return matchesSearch && matchesDepth;
+    });
+}
+
+/**
+ * Get the search worker, starting it on first use (null if workers are unavailable)
+ */
+function getSearchWorker() {
+    if (searchWorker || searchWorkerFailed) {
+        return searchWorker;
+    }
+    if (typeof Worker === 'undefined') {
+        searchWorkerFailed = true;
+        return null;
+    }
+
+    try {
+        searchWorker = new Worker('assets/js/search-worker.js');
+    } catch (error) {
+        console.warn('Search worker unavailable, searching on the main thread:', error);
+        searchWorkerFailed = true;
+        return null;
+    }
+
+    searchWorker.onmessage = function(event) {
+        const message = event.data;
+        if (message.type === 'results' && pendingSearches.has(message.requestId)) {
+            pendingSearches.get(message.requestId).resolve(message.results);
+            pendingSearches.delete(message.requestId);
+        }
+    };
+
+    searchWorker.onerror = function(error) {
+        console.warn('Search worker failed, searching on the main thread:', error.message || error);
+        searchWorker.terminate();
+        searchWorker = null;
+        searchWorkerFailed = true;
+        pendingSearches.forEach(({ resolve, fallback }) => resolve(fallback()));
+        pendingSearches.clear();
+    };
+
+    return searchWorker;
+}
+
+/**
+ * Send a dimension's items to the search worker (again only if the item count changed)
+ */
+function indexSearchItems(dimension, items) {
+    const worker = getSearchWorker();
+    if (!worker || indexedSearchItems.get(dimension) === items.length) {
+        return;
+    }
+
+    worker.postMessage({
+        type: 'index',
+        key: dimension,
+        items: items.map(item => ({ id: item.id, name: item.name, description: item.description || '' }))
+    });
+    indexedSearchItems.set(dimension, items.length);
+}
+
+/**
+ * Search a dimension's items
+ *
+ * @returns {Promise<Array>} Matches in item order as { id, name, description },
+ *     where name / description hold [start, end] highlight ranges
+ */
+function searchDimensionItems(dimension, items, query) {
+    const fallback = () => {
+        const queryTokens = searchQueryTokens(query);
+        return filterListItems(items, query, 'all').map(item => searchResult(item, queryTokens));
+    };
+
+    const worker = getSearchWorker();
+    if (!worker) {
+        return Promise.resolve(fallback());
+    }
+
+    indexSearchItems(dimension, items);
+    return new Promise(resolve => {
+        const requestId = ++searchRequestCounter;
+        pendingSearches.set(requestId, { resolve, fallback });
+        worker.postMessage({ type: 'search', key: dimension, requestId, query });
     });
 }
 
@@ -494,7 +716,7 @@ function renderNetworkView(container, data) {
                     <span class="stat-label">Nodes</span>
                 </div>
                 <div class="stat">
-                    <span class="stat-number">${data.items.filter(item => item.children_ids && item.children_ids.length > 0).length}</span>
+                    <span class="stat-number">${data.statistics.totalItems - data.statistics.leafNodes}</span>
                     <span class="stat-label">Edges</span>
                 </div>
             </div>
@@ -709,5 +931,5 @@ document.addEventListener('referencesToggled', function(event) {
 window.DimensionLoader = {
     loadDimension,
     getCurrentDimensionData: () => currentDimensionData,
-    getDimensionCache: () => dimensionCache
+    getDimensionCache: () => DimensionStore.getDimensionCache()
 };
\ No newline at end of file
@@ -0,0 +1,390 @@
+/**
+ * Dimension Store - Shared loading and caching of dimension data
+ * Fetches dimension files concurrently and keeps one cache of processed
+ * data used by both the Cube Explorer (main.js) and the dimension
+ * explorer (dimension-loader.js)
+ */
+
+// Dimension name -> data file name (some are plural), in 5C + 3A order
+const DIMENSION_FILES = {
+    // Clinical Competency Space (5C)
+    'condition': 'conditions',
+    'care_phase': 'care_phases',
+    'care_setting': 'care_settings',
+    'care_task': 'care_task',
+    'care_provider_role': 'care_provider_role',
+
+    // AI Cognitive Engagement (3A)
+    'agent_facing': 'agent_facing',
+    'anchoring_layer': 'anchoring_layer',
+    'assigned_authority': 'assigned_authority'
+};
+
+// Dimensions published as index.json plus one shard per root item (code/build_docs_data.py)
+const shardedDimensions = new Set(['condition']);
+
+// Dimension name -> promise of processed data (shared by every caller)
+const dimensionPromises = new Map();
+
+// Dimension name -> processed data, once loaded
+const dimensionCache = new Map();
+
+// Dimension name -> promise of the precomputed sidecar
+const sidecarPromises = new Map();
+
+// Promise of the build manifest (logical file name -> content-hashed file)
+let manifestPromise = null;
+
+/**
+ * Load the build manifest written by code/build_docs_data.py; resolves to null if unavailable
+ */
+function loadDataManifest() {
+    if (!manifestPromise) {
+        // Always revalidated: it is the only data file whose name does not change
+        manifestPromise = fetch('clinical-skill-mix/manifest.json', { cache: 'no-cache' })
+            .then(response => response.ok ? response.json() : null)
+            .catch(error => {
+                console.warn('Data manifest unavailable, using unhashed files:', error);
+                return null;
+            });
+    }
+    return manifestPromise;
+}
+
+/**
+ * Resolve a logical data file (e.g. 'conditions/index.json') to its published URL
+ */
+async function resolveDataUrl(logicalPath) {
+    const manifest = await loadDataManifest();
+    const entry = manifest && manifest.files && manifest.files[logicalPath];
+    return `clinical-skill-mix/${entry ? entry.path : logicalPath}`;
+}
+
+/**
+ * Fetch a logical data file through the manifest
+ */
+async function fetchDataFile(logicalPath) {
+    return fetch(await resolveDataUrl(logicalPath));
+}
+
+/**
+ * Get the data file name of a dimension
+ */
+function getDimensionFileName(dimensionName) {
+    return DIMENSION_FILES[dimensionName] || dimensionName;
+}
+
+/**
+ * Load processed data for a dimension (fetched once, then served from the cache)
+ */
+function loadDimensionData(dimensionName) {
+    if (!dimensionPromises.has(dimensionName)) {
+        const promise = fetchDimensionData(dimensionName)
+            .then(processedData => {
+                dimensionCache.set(dimensionName, processedData);
+                return processedData;
+            })
+            .catch(error => {
+                // Allow a retry on the next request
+                dimensionPromises.delete(dimensionName);
+                throw error;
+            });
+        dimensionPromises.set(dimensionName, promise);
+    }
+    return dimensionPromises.get(dimensionName);
+}
+
+/**
+ * Load several dimensions concurrently; failed dimensions resolve to null
+ */
+function loadAllDimensionData(dimensionNames = Object.keys(DIMENSION_FILES)) {
+    return Promise.all(dimensionNames.map(dimensionName =>
+        loadDimensionData(dimensionName).catch(error => {
+            console.error(`Error loading ${dimensionName}:`, error);
+            return null;
+        })
+    ));
+}
+
+/**
+ * Load the sidecar of a dimension (cached); resolves to null if unavailable
+ */
+function loadDimensionSidecar(dimensionName) {
+    if (!sidecarPromises.has(dimensionName)) {
+        sidecarPromises.set(dimensionName, fetchDimensionSidecar(getDimensionFileName(dimensionName)));
+    }
+    return sidecarPromises.get(dimensionName);
+}
+
+/**
+ * Fetch and process one dimension
+ */
+async function fetchDimensionData(dimensionName) {
+    const fileName = getDimensionFileName(dimensionName);
+
+    // Sharded dimensions load their index now and root shards on demand
+    if (shardedDimensions.has(dimensionName)) {
+        return processShardIndex(await fetchShardIndex(fileName), fileName);
+    }
+
+    // Fetch the small precomputed sidecar alongside the full dimension file
+    const [sidecar, response] = await Promise.all([
+        loadDimensionSidecar(dimensionName),
+        fetchDataFile(`${fileName}.json`)
+    ]);
+
+    if (!response.ok) {
+        throw new Error(`Failed to load ${dimensionName}: ${response.status}`);
+    }
+
+    return processDimensionData(await response.json(), sidecar);
+}
+
+/**
+ * Fetch the precomputed statistics and hierarchy sidecar of a dimension
+ * (written by code/build_docs_data.py); resolves to null if unavailable
+ */
+async function fetchDimensionSidecar(fileName) {
+    try {
+        const response = await fetchDataFile(`${fileName}.stats.json`);
+        return response.ok ? await response.json() : null;
+    } catch (error) {
+        console.warn(`Sidecar unavailable for ${fileName}:`, error);
+        return null;
+    }
+}
+
+/**
+ * Fetch the index of a sharded dimension (root items, statistics, shard list)
+ */
+async function fetchShardIndex(fileName) {
+    const response = await fetchDataFile(`${fileName}/index.json`);
+    if (!response.ok) {
+        throw new Error(`Failed to load ${fileName} index: ${response.status}`);
+    }
+    return response.json();
+}
+
+/**
+ * Fetch one shard of a sharded dimension: { root, children_ids, items }
+ */
+async function fetchShard(fileName, shardFile) {
+    const response = await fetchDataFile(`${fileName}/${shardFile}`);
+    if (!response.ok) {
+        throw new Error(`Failed to load ${fileName}/${shardFile}: ${response.status}`);
+    }
+    return response.json();
+}
+
+/**
+ * Process a shard index into dimension data holding only the root items
+ */
+function processShardIndex(index, fileName) {
+    const items = index.items.map(item => ({ ...item, children_ids: [] }));
+    return {
+        ...index,
+        items,
+        fileName,
+        hierarchyMap: buildHierarchyMap(items)
+    };
+}
+
+/**
+ * Check whether a root item's shard has not been loaded yet
+ */
+function hasPendingShard(data, itemId) {
+    const shard = data.shards && data.shards[itemId];
+    return Boolean(shard && shard.count > 0 && !shard.loaded);
+}
+
+/**
+ * Load the shard under a root item and merge its items into the dimension data
+ */
+function loadDimensionShard(data, rootId) {
+    const shard = data.shards && data.shards[rootId];
+    if (!shard) {
+        return Promise.resolve([]);
+    }
+
+    if (!shard.promise) {
+        shard.promise = fetchShard(data.fileName, shard.file).then(shardData => {
+            addShardItems(data, shardData);
+            shard.loaded = true;
+            return shardData.items;
+        }).catch(error => {
+            shard.promise = null;
+            throw error;
+        });
+    }
+    return shard.promise;
+}
+
+/**
+ * Load every pending shard (needed by views over all items)
+ */
+function loadAllDimensionShards(data) {
+    return Promise.all(Object.keys(data.shards || {}).map(rootId => loadDimensionShard(data, rootId)));
+}
+
+/**
+ * Merge shard items into the item list and hierarchy map
+ */
+function addShardItems(data, shardData) {
+    const hierarchyMap = data.hierarchyMap;
+    const root = hierarchyMap.byId.get(shardData.root);
+    if (root) {
+        root.children_ids = shardData.children_ids;
+        hierarchyMap.children.set(root.id, shardData.children_ids);
+    }
+
+    shardData.items.forEach(item => {
+        data.items.push(item);
+        hierarchyMap.byId.set(item.id, item);
+
+        if (!hierarchyMap.byDepth.has(item.depth)) {
+            hierarchyMap.byDepth.set(item.depth, []);
+        }
+        hierarchyMap.byDepth.get(item.depth).push(item);
+
+        if (item.parent_id) {
+            hierarchyMap.parents.set(item.id, item.parent_id);
+        }
+        if (item.children_ids && item.children_ids.length > 0) {
+            hierarchyMap.children.set(item.id, item.children_ids);
+        }
+    });
+}
+
+/**
+ * Process raw dimension data
+ */
+function processDimensionData(rawData, sidecar = null) {
+    if (sidecar) {
+        return {
+            ...rawData,
+            statistics: sidecar.statistics,
+            hierarchyMap: buildHierarchyMapFromSidecar(rawData.items, sidecar),
+            maxDepth: sidecar.maxDepth
+        };
+    }
+
+    const processedData = {
+        ...rawData,
+        statistics: calculateDimensionStatistics(rawData),
+        hierarchyMap: buildHierarchyMap(rawData.items),
+        maxDepth: rawData.items.reduce((max, item) => Math.max(max, item.depth), 0)
+    };
+    
+    return processedData;
+}
+
+/**
+ * Calculate dimension statistics
+ */
+function calculateDimensionStatistics(data) {
+    const items = data.items || [];
+    
+    const stats = {
+        totalItems: items.length,
+        itemsByDepth: {},
+        averageChildrenPerParent: 0,
+        maxChildren: 0,
+        leafNodes: 0
+    };
+    
+    // Count items by depth
+    items.forEach(item => {
+        const depth = item.depth;
+        stats.itemsByDepth[depth] = (stats.itemsByDepth[depth] || 0) + 1;
+        
+        // Count leaf nodes (items with no children)
+        if (!item.children_ids || item.children_ids.length === 0) {
+            stats.leafNodes++;
+        }
+        
+        // Track max children
+        if (item.children_ids) {
+            stats.maxChildren = Math.max(stats.maxChildren, item.children_ids.length);
+        }
+    });
+    
+    // Calculate average children per parent
+    const parents = items.filter(item => item.children_ids && item.children_ids.length > 0);
+    if (parents.length > 0) {
+        const totalChildren = parents.reduce((sum, parent) => sum + parent.children_ids.length, 0);
+        stats.averageChildrenPerParent = (totalChildren / parents.length).toFixed(1);
+    }
+    
+    return stats;
+}
+
+/**
+ * Build hierarchy map for quick lookups
+ */
+function buildHierarchyMap(items) {
+    const hierarchyMap = {
+        byId: new Map(),
+        byDepth: new Map(),
+        parents: new Map(),
+        children: new Map()
+    };
+    
+    // Index by ID
+    items.forEach(item => {
+        hierarchyMap.byId.set(item.id, item);
+        
+        // Index by depth
+        if (!hierarchyMap.byDepth.has(item.depth)) {
+            hierarchyMap.byDepth.set(item.depth, []);
+        }
+        hierarchyMap.byDepth.get(item.depth).push(item);
+        
+        // Index parent-child relationships
+        if (item.parent_id) {
+            hierarchyMap.parents.set(item.id, item.parent_id);
+        }
+        
+        if (item.children_ids && item.children_ids.length > 0) {
+            hierarchyMap.children.set(item.id, item.children_ids);
+        }
+    });
+    
+    return hierarchyMap;
+}
+
+/**
+ * Build hierarchy map from a sidecar's precomputed depth and children maps
+ */
+function buildHierarchyMapFromSidecar(items, sidecar) {
+    const hierarchyMap = {
+        byId: new Map(items.map(item => [item.id, item])),
+        byDepth: new Map(),
+        parents: new Map(),
+        children: new Map(Object.entries(sidecar.children))
+    };
+
+    Object.entries(sidecar.byDepth).forEach(([depth, ids]) => {
+        hierarchyMap.byDepth.set(Number(depth), ids.map(id => hierarchyMap.byId.get(id)));
+    });
+
+    hierarchyMap.children.forEach((childIds, parentId) => {
+        childIds.forEach(childId => hierarchyMap.parents.set(childId, parentId));
+    });
+
+    return hierarchyMap;
+}
+
+// Export functions
+window.DimensionStore = {
+    DIMENSION_FILES,
+    loadDimensionData,
+    loadAllDimensionData,
+    loadDimensionSidecar,
+    loadDimensionShard,
+    loadAllDimensionShards,
+    hasPendingShard,
+    loadDataManifest,
+    resolveDataUrl,
+    isLoaded: dimensionName => dimensionCache.has(dimensionName),
+    getDimensionCache: () => dimensionCache
+};
@@ -32,9 +32,25 @@ function initializeApp() {
     // Load default dimension
     loadDimension('care_task');
 
+    // Cache dimension data for repeat visits and offline use
+    registerServiceWorker();
+
     console.log('Clinical World Model (8-dimension) app initialized');
 }
 
+/**
+ * Register the data-caching service worker (docs/sw.js)
+ */
+function registerServiceWorker() {
+    if (!('serviceWorker' in navigator)) {
+        return;
+    }
+
+    navigator.serviceWorker.register('sw.js').catch(error => {
+        console.warn('Service worker registration failed:', error);
+    });
+}
+
 /**
  * Navigation functionality
  */
@@ -409,6 +425,21 @@ let selectedScenario = {
     persona: null
 };
 
+// Default cube selections
+const cubeExplorerDefaults = {
+    // Clinical Competency Space (5C)
+    'condition': 'chapter-i/i25',  // ICD-10-CM I25: Chronic ischemic heart disease
+    'care_phase': 'treatment-planning',
+    'care_setting': 'emergency-room',
+    'care_task': 'patient-care/patient-counseling',
+    'care_provider_role': 'specialist-medical-practitioners/cardiology',
+
+    // AI Cognitive Engagement (3A)
+    'agent_facing': 'provider_facing',
+    'anchoring_layer': 'input',
+    'assigned_authority': 'augmentation'
+};
+
 async function initializeCubeExplorer() {
     console.log('Initializing Cube Explorer (8-dimension framework: 5C + 3A)...');
 
@@ -428,23 +459,25 @@ async function initializeCubeExplorer() {
         { key: 'assigned_authority', file: 'assigned_authority' }
     ];
 
-    // Load all dimensions
+    // Load all dimensions concurrently from the shared store
     const allDimensions = [...dimensions5C, ...dimensions3A];
+    const defaultChapter = cubeExplorerDefaults.condition.split('/')[0];
 
-    for (const dimension of allDimensions) {
+    await Promise.all(allDimensions.map(async dimension => {
         try {
-            const response = await fetch(`clinical-skill-mix/${dimension.file}.json`);
-            if (response.ok) {
-                const data = await response.json();
-                cubeExplorerData[dimension.key] = data.items || [];
-                populateDropdown(dimension.key, data.items);
-            } else {
-                console.error(`Failed to load ${dimension.file}.json: ${response.status}`);
+            const data = await DimensionStore.loadDimensionData(dimension.key);
+
+            // The default condition's chapter is needed before its option can be selected
+            if (DimensionStore.hasPendingShard(data, defaultChapter)) {
+                await DimensionStore.loadDimensionShard(data, defaultChapter);
             }
+
+            cubeExplorerData[dimension.key] = data.items || [];
+            populateDropdown(dimension.key, data.items);
         } catch (error) {
             console.error(`Error loading ${dimension.file}:`, error);
         }
-    }
+    }));
 
     // Add change listeners to all dropdowns
     allDimensions.forEach(dimension => {
@@ -460,10 +493,33 @@ async function initializeCubeExplorer() {
     console.log('Cube Explorer initialized with 8 dimensions');
 }
 
+/**
+ * Add a condition chapter's codes to the condition dropdown, keeping the selection
+ */
+async function loadConditionChapter(chapterId) {
+    const data = await DimensionStore.loadDimensionData('condition');
+    if (!DimensionStore.hasPendingShard(data, chapterId)) {
+        return;
+    }
+
+    try {
+        await DimensionStore.loadDimensionShard(data, chapterId);
+
+        const select = document.getElementById('condition-select');
+        const selectedValue = select ? select.value : '';
+        populateDropdown('condition', data.items, false);
+        if (select) {
+            select.value = selectedValue;
+        }
+    } catch (error) {
+        console.error(`Error loading condition chapter ${chapterId}:`, error);
+    }
+}
+
 /**
  * Populate dropdown with dimension items
  */
-function populateDropdown(dimension, items) {
+function populateDropdown(dimension, items, applyDefault = true) {
     const selectId = dimension.replace(/_/g, '-') + '-select';
     const select = document.getElementById(selectId);
     if (!select) {
@@ -488,8 +544,8 @@ function populateDropdown(dimension, items) {
     // Clear existing options except the first one
     select.innerHTML = `<option value="">Select a ${label}...</option>`;
 
-    // Show all items as a flat list
-    const displayItems = items;
+    // Show all items as a flat list (sorted copy: the item array is shared with the explorer)
+    const displayItems = [...items];
 
     // Sort items by name
     displayItems.sort((a, b) => a.name.localeCompare(b.name));
@@ -503,30 +559,18 @@ function populateDropdown(dimension, items) {
     });
 
     // Set default values after populating (use requestAnimationFrame to ensure DOM is updated)
-    requestAnimationFrame(() => {
-        setDefaultSelection(dimension, select);
-    });
+    if (applyDefault) {
+        requestAnimationFrame(() => {
+            setDefaultSelection(dimension, select);
+        });
+    }
 }
 
 /**
  * Set default selection for a dimension
  */
 function setDefaultSelection(dimension, select) {
-    const defaults = {
-        // Clinical Competency Space (5C)
-        'condition': 'chapter-i/i25',  // ICD-10-CM I25: Chronic ischemic heart disease
-        'care_phase': 'treatment-planning',
-        'care_setting': 'emergency-room',
-        'care_task': 'patient-care/patient-counseling',
-        'care_provider_role': 'specialist-medical-practitioners/cardiology',
-
-        // AI Cognitive Engagement (3A)
-        'agent_facing': 'provider_facing',
-        'anchoring_layer': 'input',
-        'assigned_authority': 'augmentation'
-    };
-
-    const defaultValue = defaults[dimension];
+    const defaultValue = cubeExplorerDefaults[dimension];
     if (defaultValue) {
         console.log(`Setting default for ${dimension} to ${defaultValue}`);
         // Check if the option exists
@@ -551,6 +595,11 @@ function updateScenario(dimension, itemId) {
     const item = cubeExplorerData[dimension].find(i => i.id === itemId);
     selectedScenario[dimension] = item;
 
+    // Selecting a condition chapter fetches its codes into the dropdown
+    if (dimension === 'condition' && item && item.depth === 0) {
+        loadConditionChapter(item.id);
+    }
+
     // Update the scenario text
     updateScenarioText();
 }
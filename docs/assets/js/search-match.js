@@ -0,0 +1,87 @@
+/**
+ * Search Match - Matching rule shared by the explorer search paths
+ * An item matches a query when every query token is a prefix of some token
+ * of its name or description, ignoring case. Loaded by the search worker
+ * (importScripts) and by the page for the main-thread fallback, so both
+ * return the same items and highlights. Highlight ranges are offsets into
+ * the original text.
+ */
+
+// Searched item fields
+const SEARCH_FIELDS = ['name', 'description'];
+
+const SEARCH_TOKEN_PATTERN = /[\p{L}\p{N}]+/gu;
+
+/**
+ * Tokens of a text: lowercased token with its [start, end) in the original text
+ */
+function searchTokens(text) {
+    const tokens = [];
+    for (const match of (text || '').matchAll(SEARCH_TOKEN_PATTERN)) {
+        tokens.push({ token: match[0].toLowerCase(), start: match.index, end: match.index + match[0].length });
+    }
+    return tokens;
+}
+
+/**
+ * Distinct lowercased tokens of a query
+ */
+function searchQueryTokens(query) {
+    return Array.from(new Set(searchTokens(query).map(({ token }) => token)));
+}
+
+/**
+ * Whether every query token prefixes a token of the item's searched fields
+ */
+function matchesSearchQuery(item, queryTokens) {
+    if (queryTokens.length === 0) {
+        return false;
+    }
+    const tokens = SEARCH_FIELDS.flatMap(field => searchTokens(item[field]).map(({ token }) => token));
+    return queryTokens.every(prefix => tokens.some(token => token.startsWith(prefix)));
+}
+
+/**
+ * [start, end] ranges of the original text covering the longest query-token
+ * prefix of each matching token
+ */
+function searchHighlightRanges(text, queryTokens) {
+    const ranges = [];
+    searchTokens(text).forEach(({ token, start, end }) => {
+        const length = queryTokens.reduce(
+            (longest, prefix) => token.startsWith(prefix) ? Math.max(longest, prefix.length) : longest, 0
+        );
+        if (length > 0) {
+            ranges.push([start, start + originalPrefixLength(text.slice(start, end), length)]);
+        }
+    });
+    return ranges;
+}
+
+/**
+ * Length of the shortest prefix of a token whose lowercase form is at least
+ * `length` long (lowercasing can change the length of some characters)
+ */
+function originalPrefixLength(original, length) {
+    let lowered = 0;
+    let offset = 0;
+    for (const character of original) {
+        if (lowered >= length) {
+            break;
+        }
+        lowered += character.toLowerCase().length;
+        offset += character.length;
+    }
+    return offset;
+}
+
+/**
+ * Search result of one item: { id, name, description } highlight ranges
+ */
+function searchResult(item, queryTokens) {
+    const result = { id: item.id };
+    SEARCH_FIELDS.forEach(field => {
+        result[field] = searchHighlightRanges(item[field] || '', queryTokens);
+    });
+    return result;
+}
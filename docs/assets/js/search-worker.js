@@ -0,0 +1,119 @@
+/**
+ * Search Worker - Token index over dimension items for the explorer search
+ * Builds one prefix-searchable token index per dimension and answers
+ * queries with the matching item ids and highlight offsets, keeping the
+ * work off the UI thread
+ *
+ * Messages in:
+ *   { type: 'index', key, items: [{ id, name, description }] }
+ *   { type: 'search', key, requestId, query }
+ * Messages out:
+ *   { type: 'indexed', key, size }
+ *   { type: 'results', key, requestId, results: [{ id, name, description }] }
+ *   (name / description are [start, end] highlight ranges)
+ *
+ * Matching and highlighting follow search-match.js, shared with the
+ * main-thread fallback; the index only narrows down the candidate items.
+ */
+
+importScripts('search-match.js');
+
+// Dimension key -> index
+const indexes = new Map();
+
+self.onmessage = function(event) {
+    const message = event.data;
+
+    switch (message.type) {
+        case 'index':
+            indexes.set(message.key, buildIndex(message.items));
+            self.postMessage({ type: 'indexed', key: message.key, size: message.items.length });
+            break;
+        case 'search': {
+            const index = indexes.get(message.key);
+            self.postMessage({
+                type: 'results',
+                key: message.key,
+                requestId: message.requestId,
+                results: index ? searchIndex(index, message.query) : []
+            });
+            break;
+        }
+    }
+};
+
+/**
+ * Sorted token list and token -> ascending item positions
+ */
+function buildIndex(items) {
+    const postings = new Map();
+
+    items.forEach((item, position) => {
+        SEARCH_FIELDS.forEach(field => {
+            searchTokens(item[field]).forEach(({ token }) => {
+                let list = postings.get(token);
+                if (!list) {
+                    list = [];
+                    postings.set(token, list);
+                }
+                if (list[list.length - 1] !== position) {
+                    list.push(position);
+                }
+            });
+        });
+    });
+
+    return {
+        items,
+        tokens: Array.from(postings.keys()).sort(),
+        postings
+    };
+}
+
+/**
+ * First position in a sorted array whose value is >= target
+ */
+function lowerBound(sorted, target) {
+    let low = 0;
+    let high = sorted.length;
+    while (low < high) {
+        const middle = (low + high) >>> 1;
+        if (sorted[middle] < target) {
+            low = middle + 1;
+        } else {
+            high = middle;
+        }
+    }
+    return low;
+}
+
+/**
+ * Items in which every query token prefixes some token (in item order)
+ */
+function searchIndex(index, query) {
+    const queryTokens = searchQueryTokens(query);
+    if (queryTokens.length === 0) {
+        return [];
+    }
+
+    // hits[position] counts the query tokens matched so far, in order,
+    // so each pass only advances items that matched all earlier tokens
+    const hits = new Uint16Array(index.items.length);
+    queryTokens.forEach((prefix, matched) => {
+        for (let i = lowerBound(index.tokens, prefix); i < index.tokens.length && index.tokens[i].startsWith(prefix); i++) {
+            index.postings.get(index.tokens[i]).forEach(position => {
+                if (hits[position] === matched) {
+                    hits[position] = matched + 1;
+                }
+            });
+        }
+    });
+
+    const results = [];
+    hits.forEach((count, position) => {
+        if (count === queryTokens.length) {
+            results.push(searchResult(index.items[position], queryTokens));
+        }
+    });
+    return results;
+}
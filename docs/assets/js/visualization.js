@@ -352,6 +352,37 @@ function addVisualizationStyles() {
             font-weight: 500;
         }
         
+        /* Virtualized Tree and List Rows */
+        .tree-container.virtual-viewport,
+        .list-container.virtual-viewport {
+            display: block;
+            position: relative;
+            max-height: none;
+            overflow-y: auto;
+        }
+        
+        .virtual-spacer {
+            width: 1px;
+        }
+        
+        .virtual-viewport .virtual-row {
+            position: absolute;
+            left: 0;
+            right: var(--spacing-2);
+            box-sizing: border-box;
+            margin-bottom: 0;
+            padding: 0;
+            animation: none;
+        }
+        
+        .virtual-viewport .list-item.virtual-row {
+            padding: var(--spacing-4);
+        }
+        
+        .virtual-viewport .virtual-row .node-header {
+            padding: var(--spacing-3) var(--spacing-4);
+        }
+        
         /* Network View Styles */
         .network-view {
             padding: var(--spacing-8);
@@ -686,39 +717,18 @@ function addVisualizationStyles() {
     document.head.appendChild(style);
 }
 
-// Add search highlighting functionality
-function highlightSearchTerms(container, searchTerm) {
-    if (!searchTerm) return;
-    
-    const textNodes = [];
-    const walker = document.createTreeWalker(
-        container,
-        NodeFilter.SHOW_TEXT,
-        null,
-        false
-    );
+// Wrap [start, end] character ranges of a text in search highlight marks
+// (ranges come sorted and non-overlapping from search-match.js)
+function highlightOffsets(text, ranges) {
+    if (!ranges || ranges.length === 0) return text;
     
-    let node;
-    while (node = walker.nextNode()) {
-        textNodes.push(node);
-    }
-    
-    textNodes.forEach(textNode => {
-        const text = textNode.textContent;
-        const regex = new RegExp(`(${escapeRegExp(searchTerm)})`, 'gi');
-        
-        if (regex.test(text)) {
-            const highlightedHTML = text.replace(regex, '<mark class="search-highlight">$1</mark>');
-            const wrapper = document.createElement('span');
-            wrapper.innerHTML = highlightedHTML;
-            textNode.parentNode.replaceChild(wrapper, textNode);
-        }
+    let html = '';
+    let offset = 0;
+    ranges.forEach(([start, end]) => {
+        html += text.slice(offset, start) + `<mark class="search-highlight">${text.slice(start, end)}</mark>`;
+        offset = end;
     });
-}
-
-// Escape special regex characters
-function escapeRegExp(string) {
-    return string.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
+    return html + text.slice(offset);
 }
 
 // Add dynamic animations for tree expansion
@@ -883,7 +893,7 @@ document.addEventListener('DOMContentLoaded', function() {
 
 // Export utilities
 window.VisualizationUtils = {
-    highlightSearchTerms,
+    highlightOffsets,
     addTreeAnimations,
     expandTreeNode,
     collapseTreeNode,
@@ -0,0 +1,167 @@
+/**
+ * Service Worker - Offline cache for the Clinical World Model website
+ * Precaches the dimension data listed in clinical-skill-mix/manifest.json
+ * (written by code/build_docs_data.py) and serves it cache-first. Data
+ * files carry a content hash in their name, so when a new manifest
+ * arrives only files whose hash changed are downloaded, and files no
+ * longer listed are evicted.
+ */
+
+const DATA_CACHE = 'cwm-data-v1';
+const SHELL_CACHE = 'cwm-shell-v1';
+
+const DATA_PATH = 'clinical-skill-mix/';
+const MANIFEST_URL = new URL(`${DATA_PATH}manifest.json`, self.registration.scope).href;
+const DIST_PREFIX = new URL(`${DATA_PATH}dist/`, self.registration.scope).href;
+
+// Page shell, cached on first use so the explorer also opens offline
+const SHELL_FILES = [
+    './',
+    'index.html',
+    'assets/css/styles.css',
+    'assets/js/dimension-store.js',
+    'assets/js/main.js',
+    'assets/js/dimension-loader.js',
+    'assets/js/visualization.js',
+    'assets/js/search-match.js',
+    'assets/js/search-worker.js'
+];
+
+self.addEventListener('install', event => {
+    event.waitUntil((async () => {
+        const shellCache = await caches.open(SHELL_CACHE);
+        await shellCache.addAll(SHELL_FILES.map(path => new URL(path, self.registration.scope).href))
+            .catch(error => console.warn('Shell precache incomplete:', error));
+
+        const manifest = await fetchManifest();
+        if (manifest) {
+            await syncDataCache(manifest);
+        }
+        await self.skipWaiting();
+    })());
+});
+
+self.addEventListener('activate', event => {
+    event.waitUntil((async () => {
+        const keep = new Set([DATA_CACHE, SHELL_CACHE]);
+        const names = await caches.keys();
+        await Promise.all(names.filter(name => name.startsWith('cwm-') && !keep.has(name)).map(name => caches.delete(name)));
+        await self.clients.claim();
+    })());
+});
+
+self.addEventListener('fetch', event => {
+    const request = event.request;
+    if (request.method !== 'GET' || !request.url.startsWith(self.registration.scope)) {
+        return;
+    }
+
+    const url = request.url.split('#')[0].split('?')[0];
+
+    if (url === MANIFEST_URL) {
+        event.respondWith(handleManifest(request, event));
+    } else if (url.startsWith(DIST_PREFIX)) {
+        event.respondWith(cacheFirst(request, DATA_CACHE));
+    } else {
+        event.respondWith(networkFirst(request, SHELL_CACHE));
+    }
+});
+
+/**
+ * Fetch the current manifest from the network; resolves to null when offline
+ */
+async function fetchManifest() {
+    try {
+        const response = await fetch(MANIFEST_URL, { cache: 'no-cache' });
+        return response.ok ? response.json() : null;
+    } catch (error) {
+        return null;
+    }
+}
+
+/**
+ * URLs of the data files a manifest asks to precache
+ */
+function manifestUrls(manifest) {
+    return Object.values(manifest.files || {})
+        .filter(entry => entry.precache !== false)
+        .map(entry => new URL(`${DATA_PATH}${entry.path}`, self.registration.scope).href);
+}
+
+/**
+ * Bring the data cache in line with a manifest: download files with new
+ * hashes, keep unchanged ones and evict files no longer listed
+ */
+async function syncDataCache(manifest) {
+    const cache = await caches.open(DATA_CACHE);
+    const wanted = new Set(manifestUrls(manifest));
+    const cached = new Set((await cache.keys()).map(request => request.url));
+
+    await Promise.all([...cached]
+        .filter(url => url.startsWith(DIST_PREFIX) && !wanted.has(url))
+        .map(url => cache.delete(url)));
+
+    const missing = [...wanted].filter(url => !cached.has(url));
+    await Promise.all(missing.map(url =>
+        cache.add(url).catch(error => console.warn(`Could not precache ${url}:`, error))
+    ));
+}
+
+/**
+ * Manifest: network first (it names the current files), cached copy when offline
+ */
+async function handleManifest(request, event) {
+    const cache = await caches.open(DATA_CACHE);
+    try {
+        const response = await fetch(request);
+        if (response.ok) {
+            await cache.put(MANIFEST_URL, response.clone());
+            const manifest = await response.clone().json();
+            event.waitUntil(syncDataCache(manifest));
+        }
+        return response;
+    } catch (error) {
+        const cached = await cache.match(MANIFEST_URL);
+        if (cached) {
+            return cached;
+        }
+        throw error;
+    }
+}
+
+/**
+ * Content-hashed files never change: serve from cache, fetch and store on a miss
+ */
+async function cacheFirst(request, cacheName) {
+    const cache = await caches.open(cacheName);
+    const cached = await cache.match(request);
+    if (cached) {
+        return cached;
+    }
+
+    const response = await fetch(request);
+    if (response.ok) {
+        await cache.put(request, response.clone());
+    }
+    return response;
+}
+
+/**
+ * Page shell and unhashed files: network first, cached copy when offline
+ */
+async function networkFirst(request, cacheName) {
+    const cache = await caches.open(cacheName);
+    try {
+        const response = await fetch(request);
+        if (response.ok) {
+            await cache.put(request, response.clone());
+        }
+        return response;
+    } catch (error) {
+        const cached = await cache.match(request);
+        if (cached) {
+            return cached;
+        }
+        throw error;
+    }
+}
@@ -0,0 +1,49 @@
+"""Tests for the DALY aggregate cube (code/daly_cube.py)"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "code"))
+
+from daly_cube import DalyCube, UNKNOWN_LABEL
+
+
+def _frame(countries, sexes):
+    return pd.DataFrame({
+        'YEAR': [2019] * len(countries),
+        'COUNTRY': countries,
+        'GHE_CAUSE_CODE': [10, 10, 20][:len(countries)],
+        'GHE_CAUSE_TITLE': ['Cause A', 'Cause A', 'Cause B'][:len(countries)],
+        'GHE_CAUSE_TYPE': ['type-1', 'type-1', 'type-2'][:len(countries)],
+        'SEX': sexes,
+        'DALY': [100.0, 50.0, 30.0][:len(countries)],
+        'DEATHS': [4.0, 2.0, 1.0][:len(countries)],
+        'POPULATION': [1000.0, 500.0, 300.0][:len(countries)],
+    })
+
+
+def test_missing_country_is_kept_in_global_totals():
+    df = _frame(['AAA', None], ['male', 'female'])
+    cube = DalyCube.from_frame(df)
+
+    assert UNKNOWN_LABEL in cube.countries
+    result = cube.select(years=[2019])
+    assert result['DALY'].tolist() == [150.0]
+    assert result['DEATHS'].tolist() == [6.0]
+    assert cube.select(countries=[UNKNOWN_LABEL])['DALY'].tolist() == [50.0]
+
+
+def test_missing_sex_matches_baseline_groupby():
+    df = _frame(['AAA', None, 'BBB'], ['male', np.nan, None])
+    cube = DalyCube.from_frame(df)
+
+    # Baseline analyze_global_daly: groupby over causes, summed across countries and sexes
+    metrics = ['DALY', 'DEATHS', 'POPULATION']
+    expected = df.groupby('GHE_CAUSE_CODE')[metrics].sum()
+    result = cube.select(years=[2019]).set_index('GHE_CAUSE_CODE')[metrics]
+    assert {int(code): row.tolist() for code, row in result.iterrows()} == \
+        {int(code): row.tolist() for code, row in expected.iterrows()}
+    assert UNKNOWN_LABEL in cube.sexes